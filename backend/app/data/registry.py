@@ -0,0 +1,153 @@
+import csv
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+# Optional CSV with the full ticker universe (columns: ticker, name_en, name_kr, sector,
+# market, exchange, market_cap in billions of USD). Without it the bundled STOCK_DICT is used.
+TICKER_UNIVERSE_PATH = os.getenv("TICKER_UNIVERSE_PATH", "")
+
+# Market / exchange implied by a Yahoo ticker suffix, for sources that omit them
+SUFFIX_MARKETS = {
+    ".KS": ("KOSPI", "KRX"),
+    ".KQ": ("KOSDAQ", "KRX"),
+}
+DEFAULT_MARKET = ("US", "US")
+
+class TickerRecord:
+    """
+    One listed symbol. Slots keep tens of thousands of records compact; item access
+    keeps records interchangeable with the STOCK_DICT entries they replace.
+    """
+    __slots__ = ('ticker', 'name_en', 'name_kr', 'sector', 'market', 'exchange', 'market_cap')
+
+    def __init__(self, ticker: str, name_en: str, name_kr: str = None, sector: str = None,
+                 market: str = None, exchange: str = None, market_cap: float = None):
+        default_market, default_exchange = SUFFIX_MARKETS.get(ticker[-3:].upper(), DEFAULT_MARKET)
+        self.ticker = ticker
+        self.name_en = name_en or ticker
+        self.name_kr = name_kr or self.name_en
+        self.sector = sector or None
+        self.market = market or default_market
+        self.exchange = exchange or default_exchange
+        self.market_cap = float(market_cap) if market_cap not in (None, '') else None # Billions of USD
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"TickerRecord({self.ticker!r}, {self.name_en!r})"
+
+class TickerRegistry:
+    """
+    Ticker universe with O(1) lookup by ticker and precomputed sector, market and
+    exchange groups. Loaded on first use.
+    """
+    def __init__(self, path: str = TICKER_UNIVERSE_PATH):
+        self.path = path
+        self._records: Tuple[TickerRecord, ...] = ()
+        self._by_ticker: Dict[str, TickerRecord] = {}
+        self._by_sector: Dict[str, Tuple[TickerRecord, ...]] = {}
+        self._by_market: Dict[str, Tuple[TickerRecord, ...]] = {}
+        self._by_exchange: Dict[str, Tuple[TickerRecord, ...]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load_records(self) -> List[TickerRecord]:
+        if self.path and os.path.exists(self.path):
+            with open(self.path, newline='', encoding='utf-8-sig') as f:
+                return [
+                    TickerRecord(row['ticker'].strip(), row.get('name_en'), row.get('name_kr'),
+                                 row.get('sector'), row.get('market'), row.get('exchange'), row.get('market_cap'))
+                    for row in csv.DictReader(f) if row.get('ticker')
+                ]
+        if self.path:
+            print(f"Ticker universe {self.path} not found, using the bundled list")
+        from app.data.stocks import STOCK_DICT
+        return [TickerRecord(s['ticker'], s['name_en'], s['name_kr'], s.get('sector'), market_cap=s.get('market_cap'))
+                for s in STOCK_DICT]
+
+    def source_signature(self) -> str:
+        """
+        Identifies the universe source without loading it: the CSV's path, size and
+        modification time, or a hash of the bundled list.
+        """
+        if self.path and os.path.exists(self.path):
+            stat = os.stat(self.path)
+            return f"csv:{os.path.abspath(self.path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        from app.data.stocks import STOCK_DICT
+        digest = hashlib.sha1(json.dumps(STOCK_DICT, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return f"bundled:{digest.hexdigest()}"
+
+    def _group(self, attr: str) -> Dict[str, Tuple[TickerRecord, ...]]:
+        groups = {}
+        for record in self._records:
+            key = getattr(record, attr)
+            if key:
+                groups.setdefault(key, []).append(record)
+        return {key: tuple(records) for key, records in groups.items()}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            records = self._load_records()
+            # First occurrence wins if the source lists a ticker twice
+            self._by_ticker = {}
+            for record in records:
+                self._by_ticker.setdefault(record.ticker, record)
+            self._records = tuple(self._by_ticker.values())
+            self._by_sector = self._group('sector')
+            self._by_market = self._group('market')
+            self._by_exchange = self._group('exchange')
+            self._loaded = True
+
+    def get(self, ticker: str) -> Optional[TickerRecord]:
+        self._ensure_loaded()
+        return self._by_ticker.get(ticker)
+
+    def __contains__(self, ticker: str) -> bool:
+        return self.get(ticker) is not None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._records)
+
+    def records(self) -> Tuple[TickerRecord, ...]:
+        self._ensure_loaded()
+        return self._records
+
+    def sectors(self) -> List[str]:
+        self._ensure_loaded()
+        return list(self._by_sector)
+
+    def by_sector(self, sector: str) -> Tuple[TickerRecord, ...]:
+        self._ensure_loaded()
+        return self._by_sector.get(sector, ())
+
+    def in_sectors(self, sectors: list) -> List[TickerRecord]:
+        return [record for sector in sectors for record in self.by_sector(sector)]
+
+    def by_market(self, market: str) -> Tuple[TickerRecord, ...]:
+        self._ensure_loaded()
+        return self._by_market.get(market, ())
+
+    def by_exchange(self, exchange: str) -> Tuple[TickerRecord, ...]:
+        self._ensure_loaded()
+        return self._by_exchange.get(exchange, ())
+
+# Process-wide registry
+ticker_registry = TickerRegistry()
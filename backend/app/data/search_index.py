@@ -0,0 +1,182 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, List
+import numpy as np
+
+# Hangul initial consonants (choseong) in syllable order, as compatibility jamo
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+# Syllables per initial consonant (21 vowels x 28 finals)
+SYLLABLES_PER_CHOSEONG = 588
+
+# Prefixes up to this length have precomputed, popularity-ordered posting lists;
+# longer ones take the top ids of their sorted-term range from a range-minimum table
+PREFIX_INDEX_LEN = 3
+# Entries kept per precomputed prefix (also the largest allowed search limit)
+MAX_RESULTS = 50
+
+_STRIP = re.compile(r"[^\w.\-^=]+")
+_WORDS = re.compile(r"[^\w]+")
+
+def normalize(text: str) -> str:
+    """
+    Lowercases and drops spaces and punctuation other than ticker characters (. - ^ =).
+    """
+    return _STRIP.sub('', (text or '').lower())
+
+def choseong(text: str) -> str:
+    """
+    Replaces Hangul syllables with their initial consonants ("삼성sdi" -> "ㅅㅅsdi").
+    """
+    return ''.join(
+        CHOSEONG[(ord(ch) - HANGUL_FIRST) // SYLLABLES_PER_CHOSEONG] if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+class _RangeMin:
+    """
+    Sparse table over an array: the position of the smallest value in any range in O(1).
+    """
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self.levels = [np.arange(len(values), dtype=np.int32)] # levels[j][i]: argmin of values[i:i + 2**j]
+        width = 1
+        while width * 2 <= len(values):
+            prev = self.levels[-1]
+            left, right = prev[:-width], prev[width:]
+            self.levels.append(np.where(values[left] <= values[right], left, right))
+            width *= 2
+
+    def argmin(self, lo: int, hi: int) -> int:
+        level = (hi - lo).bit_length() - 1
+        a, b = self.levels[level][lo], self.levels[level][hi - (1 << level)]
+        return int(a if self.values[a] <= self.values[b] else b)
+
+class SearchIndex:
+    """
+    Autocomplete index over ticker, name_en and name_kr (plus the name_kr choseong).
+    Results are ranked: exact match of a whole ticker, name or name choseong, then prefix
+    (also of single words of name_en), then substring; within a tier by popularity, i.e.
+    market cap where the universe provides it, then registry order. Record ids are
+    popularity ranks, so posting lists are sorted best-first and lookups stop early.
+    """
+    def __init__(self, records):
+        # Stable sort: records without a market cap keep their registry order, after the rest
+        self._records = tuple(sorted(records, key=lambda record: -(record.market_cap or 0)))
+        self._haystacks: List[str] = [] # All terms of a record, for substring checks
+        self._exact: Dict[str, List[int]] = {}
+        self._prefixes: Dict[str, List[int]] = {}
+        self._grams: Dict[str, List[int]] = {}
+        sorted_terms = []
+
+        for rid, record in enumerate(self._records):
+            whole, words = self._record_terms(record)
+            terms = tuple(dict.fromkeys(whole + words))
+            self._haystacks.append('\n'.join(terms))
+            for term in whole:
+                self._post(self._exact, term, rid)
+            grams = set()
+            for term in terms:
+                for n in range(1, min(len(term), PREFIX_INDEX_LEN) + 1):
+                    self._post(self._prefixes, term[:n], rid, MAX_RESULTS)
+                sorted_terms.append((term, rid))
+                grams.update(term)
+                grams.update(term[i:i + 2] for i in range(len(term) - 1))
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(rid)
+
+        sorted_terms.sort()
+        self._terms = [term for term, _ in sorted_terms]
+        self._term_ranks = [rid for _, rid in sorted_terms]
+        self._range_min = _RangeMin(np.array(self._term_ranks, dtype=np.int32))
+
+    @staticmethod
+    def _record_terms(record):
+        """
+        Returns (whole terms, which also match exactly; single words of name_en).
+        """
+        ticker = record.ticker.lower()
+        name_kr = normalize(record.name_kr)
+        whole = [ticker, ticker.split('.')[0], normalize(record.name_en), name_kr, choseong(name_kr)]
+        # Individual words, so "google" finds "Alphabet (Google)" as a prefix match
+        words = [w for w in _WORDS.split(record.name_en.lower()) if w]
+        return [t for t in dict.fromkeys(whole) if t], words
+
+    @staticmethod
+    def _post(index: Dict[str, List[int]], key: str, rid: int, cap: int = None):
+        ids = index.setdefault(key, [])
+        if ids and ids[-1] == rid:
+            return
+        if cap is None or len(ids) < cap:
+            ids.append(rid)
+
+    def _prefix_ids(self, q: str, k: int) -> List[int]:
+        """
+        The k most popular records with a term starting with q, best first.
+        """
+        if len(q) <= PREFIX_INDEX_LEN:
+            return self._prefixes.get(q, [])[:k]
+
+        # Terms starting with q form one range of the sorted terms. Pop its minimum rank,
+        # split the range around it and repeat, so only about k positions are visited.
+        lo = bisect_left(self._terms, q)
+        hi = bisect_left(self._terms, q + '\U0010ffff', lo)
+        ids, seen, heap = [], set(), []
+
+        def push(lo: int, hi: int):
+            if lo < hi:
+                pos = self._range_min.argmin(lo, hi)
+                heapq.heappush(heap, (self._term_ranks[pos], pos, lo, hi))
+
+        push(lo, hi)
+        while heap and len(ids) < k:
+            rid, pos, lo, hi = heapq.heappop(heap)
+            if rid not in seen:
+                seen.add(rid)
+                ids.append(rid)
+            push(lo, pos)
+            push(pos + 1, hi)
+        return ids
+
+    def _substring_ids(self, q: str):
+        # Walk the rarest gram's postings best-first and verify each candidate
+        grams = [q[i:i + 2] for i in range(len(q) - 1)] or [q]
+        postings = min((self._grams.get(g, []) for g in grams), key=len)
+        haystacks = self._haystacks
+        for rid in postings:
+            if q in haystacks[rid]:
+                yield rid
+
+    def search(self, query: str, limit: int = 10) -> list:
+        q = normalize(query)
+        limit = max(1, min(limit, MAX_RESULTS))
+        if not q:
+            return []
+
+        found = {}
+        exact = self._exact.get(q, [])
+        for ids in (exact, self._prefix_ids(q, limit + len(exact)), self._substring_ids(q)):
+            for rid in ids:
+                if len(found) >= limit:
+                    break
+                found.setdefault(rid, None)
+            if len(found) >= limit:
+                break
+        return [self._records[rid] for rid in found]
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_search_index() -> SearchIndex:
+    """
+    Returns the index over the ticker registry, building it on first use.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from app.data.registry import ticker_registry
+                _index = SearchIndex(ticker_registry.records())
+    return _index
@@ -1,73 +1,74 @@
+# market_cap: approximate, in billions of USD; only used to rank search results
 STOCK_DICT = [
     # US Tech / Large Cap
-    {"ticker": "AAPL", "name_en": "Apple", "name_kr": "애플", "sector": "Technology"},
-    {"ticker": "MSFT", "name_en": "Microsoft", "name_kr": "마이크로소프트", "sector": "Technology"},
-    {"ticker": "GOOGL", "name_en": "Alphabet (Google)", "name_kr": "구글", "sector": "Technology"},
-    {"ticker": "AMZN", "name_en": "Amazon", "name_kr": "아마존", "sector": "Consumer Cyclical"},
-    {"ticker": "NVDA", "name_en": "NVIDIA", "name_kr": "엔비디아", "sector": "Technology"},
-    {"ticker": "TSLA", "name_en": "Tesla", "name_kr": "테슬라", "sector": "Automotive"},
-    {"ticker": "META", "name_en": "Meta", "name_kr": "메타", "sector": "Technology"},
-    {"ticker": "NFLX", "name_en": "Netflix", "name_kr": "넷플릭스", "sector": "Communication Services"},
-    {"ticker": "AMD", "name_en": "AMD", "name_kr": "AMD", "sector": "Technology"},
-    {"ticker": "INTC", "name_en": "Intel", "name_kr": "인텔", "sector": "Technology"},
-    {"ticker": "QCOM", "name_en": "Qualcomm", "name_kr": "퀄컴", "sector": "Technology"},
-    {"ticker": "IBM", "name_en": "IBM", "name_kr": "IBM", "sector": "Technology"},
-    {"ticker": "ORCL", "name_en": "Oracle", "name_kr": "오라클", "sector": "Technology"},
-    {"ticker": "CRM", "name_en": "Salesforce", "name_kr": "세일즈포스", "sector": "Technology"},
-    {"ticker": "ADBE", "name_en": "Adobe", "name_kr": "어도비", "sector": "Technology"},
-    {"ticker": "AVGO", "name_en": "Broadcom", "name_kr": "브로드컴", "sector": "Technology"},
-    {"ticker": "CSCO", "name_en": "Cisco", "name_kr": "시스코", "sector": "Technology"},
-    {"ticker": "ACN", "name_en": "Accenture", "name_kr": "엑센츄어", "sector": "Technology"},
-    {"ticker": "TXN", "name_en": "Texas Instruments", "name_kr": "텍사스 인스트루먼트", "sector": "Technology"},
-    {"ticker": "HON", "name_en": "Honeywell", "name_kr": "허니웰", "sector": "Industrials"},
-    {"ticker": "UNH", "name_en": "UnitedHealth", "name_kr": "유나이티드헬스", "sector": "Healthcare"},
-    {"ticker": "JNJ", "name_en": "Johnson & Johnson", "name_kr": "존슨앤존슨", "sector": "Healthcare"},
-    {"ticker": "LLY", "name_en": "Eli Lilly", "name_kr": "일라이 릴리", "sector": "Healthcare"},
-    {"ticker": "V", "name_en": "Visa", "name_kr": "비자", "sector": "Financial Services"},
-    {"ticker": "JPM", "name_en": "JPMorgan Chase", "name_kr": "JP모건", "sector": "Financial Services"},
-    {"ticker": "WMT", "name_en": "Walmart", "name_kr": "월마트", "sector": "Consumer Defensive"},
-    {"ticker": "PG", "name_en": "Procter & Gamble", "name_kr": "P&G", "sector": "Consumer Defensive"},
-    {"ticker": "MA", "name_en": "Mastercard", "name_kr": "마스터카드", "sector": "Financial Services"},
-    {"ticker": "HD", "name_en": "Home Depot", "name_kr": "홈디포", "sector": "Consumer Cyclical"},
-    {"ticker": "CVX", "name_en": "Chevron", "name_kr": "쉐브론", "sector": "Energy"},
-    {"ticker": "XOM", "name_en": "Exxon Mobil", "name_kr": "엑슨모빌", "sector": "Energy"},
-    {"ticker": "KO", "name_en": "Coca-Cola", "name_kr": "코카콜라", "sector": "Consumer Defensive"},
-    {"ticker": "PEP", "name_en": "PepsiCo", "name_kr": "펩시", "sector": "Consumer Defensive"},
-    {"ticker": "COST", "name_en": "Costco", "name_kr": "코스트코", "sector": "Consumer Defensive"},
-    {"ticker": "MCD", "name_en": "McDonald's", "name_kr": "맥도날드", "sector": "Consumer Cyclical"},
-    {"ticker": "DIS", "name_en": "Disney", "name_kr": "디즈니", "sector": "Communication Services"},
-    {"ticker": "NKE", "name_en": "Nike", "name_kr": "나이키", "sector": "Consumer Cyclical"},
-    {"ticker": "SBUX", "name_en": "Starbucks", "name_kr": "스타벅스", "sector": "Consumer Cyclical"},
+    {"ticker": "AAPL", "name_en": "Apple", "name_kr": "애플", "sector": "Technology", "market_cap": 3800},
+    {"ticker": "MSFT", "name_en": "Microsoft", "name_kr": "마이크로소프트", "sector": "Technology", "market_cap": 3700},
+    {"ticker": "GOOGL", "name_en": "Alphabet (Google)", "name_kr": "구글", "sector": "Technology", "market_cap": 3000},
+    {"ticker": "AMZN", "name_en": "Amazon", "name_kr": "아마존", "sector": "Consumer Cyclical", "market_cap": 2400},
+    {"ticker": "NVDA", "name_en": "NVIDIA", "name_kr": "엔비디아", "sector": "Technology", "market_cap": 4500},
+    {"ticker": "TSLA", "name_en": "Tesla", "name_kr": "테슬라", "sector": "Automotive", "market_cap": 1400},
+    {"ticker": "META", "name_en": "Meta", "name_kr": "메타", "sector": "Technology", "market_cap": 1800},
+    {"ticker": "NFLX", "name_en": "Netflix", "name_kr": "넷플릭스", "sector": "Communication Services", "market_cap": 450},
+    {"ticker": "AMD", "name_en": "AMD", "name_kr": "AMD", "sector": "Technology", "market_cap": 350},
+    {"ticker": "INTC", "name_en": "Intel", "name_kr": "인텔", "sector": "Technology", "market_cap": 170},
+    {"ticker": "QCOM", "name_en": "Qualcomm", "name_kr": "퀄컴", "sector": "Technology", "market_cap": 180},
+    {"ticker": "IBM", "name_en": "IBM", "name_kr": "IBM", "sector": "Technology", "market_cap": 270},
+    {"ticker": "ORCL", "name_en": "Oracle", "name_kr": "오라클", "sector": "Technology", "market_cap": 700},
+    {"ticker": "CRM", "name_en": "Salesforce", "name_kr": "세일즈포스", "sector": "Technology", "market_cap": 240},
+    {"ticker": "ADBE", "name_en": "Adobe", "name_kr": "어도비", "sector": "Technology", "market_cap": 150},
+    {"ticker": "AVGO", "name_en": "Broadcom", "name_kr": "브로드컴", "sector": "Technology", "market_cap": 1600},
+    {"ticker": "CSCO", "name_en": "Cisco", "name_kr": "시스코", "sector": "Technology", "market_cap": 270},
+    {"ticker": "ACN", "name_en": "Accenture", "name_kr": "엑센츄어", "sector": "Technology", "market_cap": 160},
+    {"ticker": "TXN", "name_en": "Texas Instruments", "name_kr": "텍사스 인스트루먼트", "sector": "Technology", "market_cap": 160},
+    {"ticker": "HON", "name_en": "Honeywell", "name_kr": "허니웰", "sector": "Industrials", "market_cap": 130},
+    {"ticker": "UNH", "name_en": "UnitedHealth", "name_kr": "유나이티드헬스", "sector": "Healthcare", "market_cap": 300},
+    {"ticker": "JNJ", "name_en": "Johnson & Johnson", "name_kr": "존슨앤존슨", "sector": "Healthcare", "market_cap": 450},
+    {"ticker": "LLY", "name_en": "Eli Lilly", "name_kr": "일라이 릴리", "sector": "Healthcare", "market_cap": 800},
+    {"ticker": "V", "name_en": "Visa", "name_kr": "비자", "sector": "Financial Services", "market_cap": 650},
+    {"ticker": "JPM", "name_en": "JPMorgan Chase", "name_kr": "JP모건", "sector": "Financial Services", "market_cap": 850},
+    {"ticker": "WMT", "name_en": "Walmart", "name_kr": "월마트", "sector": "Consumer Defensive", "market_cap": 800},
+    {"ticker": "PG", "name_en": "Procter & Gamble", "name_kr": "P&G", "sector": "Consumer Defensive", "market_cap": 350},
+    {"ticker": "MA", "name_en": "Mastercard", "name_kr": "마스터카드", "sector": "Financial Services", "market_cap": 520},
+    {"ticker": "HD", "name_en": "Home Depot", "name_kr": "홈디포", "sector": "Consumer Cyclical", "market_cap": 380},
+    {"ticker": "CVX", "name_en": "Chevron", "name_kr": "쉐브론", "sector": "Energy", "market_cap": 300},
+    {"ticker": "XOM", "name_en": "Exxon Mobil", "name_kr": "엑슨모빌", "sector": "Energy", "market_cap": 480},
+    {"ticker": "KO", "name_en": "Coca-Cola", "name_kr": "코카콜라", "sector": "Consumer Defensive", "market_cap": 300},
+    {"ticker": "PEP", "name_en": "PepsiCo", "name_kr": "펩시", "sector": "Consumer Defensive", "market_cap": 200},
+    {"ticker": "COST", "name_en": "Costco", "name_kr": "코스트코", "sector": "Consumer Defensive", "market_cap": 410},
+    {"ticker": "MCD", "name_en": "McDonald's", "name_kr": "맥도날드", "sector": "Consumer Cyclical", "market_cap": 220},
+    {"ticker": "DIS", "name_en": "Disney", "name_kr": "디즈니", "sector": "Communication Services", "market_cap": 200},
+    {"ticker": "NKE", "name_en": "Nike", "name_kr": "나이키", "sector": "Consumer Cyclical", "market_cap": 95},
+    {"ticker": "SBUX", "name_en": "Starbucks", "name_kr": "스타벅스", "sector": "Consumer Cyclical", "market_cap": 100},
 
     # Korea (KOSPI/KOSDAQ Top)
-    {"ticker": "005930.KS", "name_en": "Samsung Electronics", "name_kr": "삼성전자", "sector": "Technology"},
-    {"ticker": "000660.KS", "name_en": "SK Hynix", "name_kr": "SK하이닉스", "sector": "Technology"},
-    {"ticker": "373220.KS", "name_en": "LG Energy Solution", "name_kr": "LG에너지솔루션", "sector": "Energy"},
-    {"ticker": "207940.KS", "name_en": "Samsung Biologics", "name_kr": "삼성바이오로직스", "sector": "Healthcare"},
-    {"ticker": "005380.KS", "name_en": "Hyundai Motor", "name_kr": "현대차", "sector": "Automotive"},
-    {"ticker": "000270.KS", "name_en": "Kia", "name_kr": "기아", "sector": "Automotive"},
-    {"ticker": "005490.KS", "name_en": "POSCO Holdings", "name_kr": "POSCO홀딩스", "sector": "Basic Materials"},
-    {"ticker": "035420.KS", "name_en": "NAVER", "name_kr": "네이버", "sector": "Technology"},
-    {"ticker": "035720.KS", "name_en": "Kakao", "name_kr": "카카오", "sector": "Technology"},
-    {"ticker": "006400.KS", "name_en": "Samsung SDI", "name_kr": "삼성SDI", "sector": "Technology"},
-    {"ticker": "051910.KS", "name_en": "LG Chem", "name_kr": "LG화학", "sector": "Basic Materials"},
-    {"ticker": "068270.KS", "name_en": "Celltrion", "name_kr": "셀트리온", "sector": "Healthcare"},
-    {"ticker": "105560.KS", "name_en": "KB Financial", "name_kr": "KB금융", "sector": "Financial Services"},
-    {"ticker": "055550.KS", "name_en": "Shinhan Financial", "name_kr": "신한지주", "sector": "Financial Services"},
-    {"ticker": "012330.KS", "name_en": "Hyundai Mobis", "name_kr": "현대모비스", "sector": "Automotive"},
-    {"ticker": "032830.KS", "name_en": "Samsung Life", "name_kr": "삼성생명", "sector": "Financial Services"},
-    {"ticker": "003550.KS", "name_en": "LG", "name_kr": "LG", "sector": "Industrials"},
-    {"ticker": "015760.KS", "name_en": "KEPCO", "name_kr": "한국전력", "sector": "Utilities"},
-    {"ticker": "034020.KS", "name_en": "Doosan Enerbility", "name_kr": "두산에너빌리티", "sector": "Industrials"},
-    {"ticker": "017670.KS", "name_en": "SK Telecom", "name_kr": "SK텔레콤", "sector": "Communication Services"},
-    {"ticker": "018260.KS", "name_en": "Samsung SDS", "name_kr": "삼성에스디에스", "sector": "Technology"},
-    {"ticker": "009150.KS", "name_en": "Samsung Electro-Mechanics", "name_kr": "삼성전기", "sector": "Technology"},
-    {"ticker": "010130.KS", "name_en": "Korea Zinc", "name_kr": "고려아연", "sector": "Basic Materials"},
-    {"ticker": "000810.KS", "name_en": "Samsung Fire & Marine", "name_kr": "삼성화재", "sector": "Financial Services"},
-    {"ticker": "011200.KS", "name_en": "HMM", "name_kr": "HMM", "sector": "Industrials"},
-    {"ticker": "003490.KS", "name_en": "Korean Air", "name_kr": "대한항공", "sector": "Industrials"},
-    {"ticker": "036570.KS", "name_en": "NCSoft", "name_kr": "엔씨소프트", "sector": "Technology"},
-    {"ticker": "251270.KS", "name_en": "Netmarble", "name_kr": "넷마블", "sector": "Technology"},
-    {"ticker": "009830.KS", "name_en": "Hanwha Solutions", "name_kr": "한화솔루션", "sector": "Basic Materials"},
-    {"ticker": "090430.KS", "name_en": "Amorepacific", "name_kr": "아모레퍼시픽", "sector": "Consumer Defensive"},
+    {"ticker": "005930.KS", "name_en": "Samsung Electronics", "name_kr": "삼성전자", "sector": "Technology", "market_cap": 400},
+    {"ticker": "000660.KS", "name_en": "SK Hynix", "name_kr": "SK하이닉스", "sector": "Technology", "market_cap": 250},
+    {"ticker": "373220.KS", "name_en": "LG Energy Solution", "name_kr": "LG에너지솔루션", "sector": "Energy", "market_cap": 60},
+    {"ticker": "207940.KS", "name_en": "Samsung Biologics", "name_kr": "삼성바이오로직스", "sector": "Healthcare", "market_cap": 55},
+    {"ticker": "005380.KS", "name_en": "Hyundai Motor", "name_kr": "현대차", "sector": "Automotive", "market_cap": 40},
+    {"ticker": "000270.KS", "name_en": "Kia", "name_kr": "기아", "sector": "Automotive", "market_cap": 30},
+    {"ticker": "005490.KS", "name_en": "POSCO Holdings", "name_kr": "POSCO홀딩스", "sector": "Basic Materials", "market_cap": 15},
+    {"ticker": "035420.KS", "name_en": "NAVER", "name_kr": "네이버", "sector": "Technology", "market_cap": 25},
+    {"ticker": "035720.KS", "name_en": "Kakao", "name_kr": "카카오", "sector": "Technology", "market_cap": 20},
+    {"ticker": "006400.KS", "name_en": "Samsung SDI", "name_kr": "삼성SDI", "sector": "Technology", "market_cap": 15},
+    {"ticker": "051910.KS", "name_en": "LG Chem", "name_kr": "LG화학", "sector": "Basic Materials", "market_cap": 15},
+    {"ticker": "068270.KS", "name_en": "Celltrion", "name_kr": "셀트리온", "sector": "Healthcare", "market_cap": 25},
+    {"ticker": "105560.KS", "name_en": "KB Financial", "name_kr": "KB금융", "sector": "Financial Services", "market_cap": 30},
+    {"ticker": "055550.KS", "name_en": "Shinhan Financial", "name_kr": "신한지주", "sector": "Financial Services", "market_cap": 25},
+    {"ticker": "012330.KS", "name_en": "Hyundai Mobis", "name_kr": "현대모비스", "sector": "Automotive", "market_cap": 18},
+    {"ticker": "032830.KS", "name_en": "Samsung Life", "name_kr": "삼성생명", "sector": "Financial Services", "market_cap": 20},
+    {"ticker": "003550.KS", "name_en": "LG", "name_kr": "LG", "sector": "Industrials", "market_cap": 10},
+    {"ticker": "015760.KS", "name_en": "KEPCO", "name_kr": "한국전력", "sector": "Utilities", "market_cap": 20},
+    {"ticker": "034020.KS", "name_en": "Doosan Enerbility", "name_kr": "두산에너빌리티", "sector": "Industrials", "market_cap": 25},
+    {"ticker": "017670.KS", "name_en": "SK Telecom", "name_kr": "SK텔레콤", "sector": "Communication Services", "market_cap": 8},
+    {"ticker": "018260.KS", "name_en": "Samsung SDS", "name_kr": "삼성에스디에스", "sector": "Technology", "market_cap": 8},
+    {"ticker": "009150.KS", "name_en": "Samsung Electro-Mechanics", "name_kr": "삼성전기", "sector": "Technology", "market_cap": 10},
+    {"ticker": "010130.KS", "name_en": "Korea Zinc", "name_kr": "고려아연", "sector": "Basic Materials", "market_cap": 12},
+    {"ticker": "000810.KS", "name_en": "Samsung Fire & Marine", "name_kr": "삼성화재", "sector": "Financial Services", "market_cap": 12},
+    {"ticker": "011200.KS", "name_en": "HMM", "name_kr": "HMM", "sector": "Industrials", "market_cap": 10},
+    {"ticker": "003490.KS", "name_en": "Korean Air", "name_kr": "대한항공", "sector": "Industrials", "market_cap": 6},
+    {"ticker": "036570.KS", "name_en": "NCSoft", "name_kr": "엔씨소프트", "sector": "Technology", "market_cap": 3},
+    {"ticker": "251270.KS", "name_en": "Netmarble", "name_kr": "넷마블", "sector": "Technology", "market_cap": 3},
+    {"ticker": "009830.KS", "name_en": "Hanwha Solutions", "name_kr": "한화솔루션", "sector": "Basic Materials", "market_cap": 4},
+    {"ticker": "090430.KS", "name_en": "Amorepacific", "name_kr": "아모레퍼시픽", "sector": "Consumer Defensive", "market_cap": 5},
 ]
@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import market, stock, portfolio, features
+from app.routers import market, stock, portfolio, features, system
+from app.services.warmup import warmup_job
+from app.services.refresh_scheduler import refresh_scheduler, REFRESH_SCHEDULER_ENABLED
+from app.data.search_index import get_search_index
+import threading
 
 app = FastAPI(title="BlackRock Aladdin 2.0")
 
@@ -18,6 +22,22 @@ app.include_router(market.router)
 app.include_router(stock.router)
 app.include_router(portfolio.router)
 app.include_router(features.router)
+app.include_router(system.router)
+
+@app.on_event("startup")
+def start_warmup():
+    # No-op unless WARMUP_ON_STARTUP=1
+    warmup_job.start()
+
+@app.on_event("startup")
+def build_search_index():
+    # Building takes seconds for a full universe; do it before the first keystroke
+    threading.Thread(target=get_search_index, name="search-index", daemon=True).start()
+
+@app.on_event("startup")
+def start_refresh_scheduler():
+    if REFRESH_SCHEDULER_ENABLED:
+        refresh_scheduler.start()
 
 @app.get("/")
 def read_root():
@@ -1,18 +1,24 @@
 from fastapi import APIRouter, HTTPException
 from app.services.data_fetcher import MarketDataFetcher
+from app.services.async_fetcher import AsyncMarketDataFetcher
 from app.services.fund_manager import AIFundManager
 from pydantic import BaseModel
+from typing import List, Optional
+import asyncio
+from datetime import datetime
+import pandas as pd
 
 router = APIRouter(prefix="/api", tags=["features"])
 
 fetcher = MarketDataFetcher()
+afetcher = AsyncMarketDataFetcher(fetcher)
 fund_manager = AIFundManager()
 db = fetcher.db
 
 @router.get("/battle")
-def get_battle_status():
+async def get_battle_status():
     try:
-        status = fund_manager.get_battle_status()
+        status = await afetcher.run(fund_manager.get_battle_status)
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -59,3 +65,143 @@ def calculate_time_machine(request: TimeMachineRequest):
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+class DCASchedule(BaseModel):
+    ticker: str
+    amount: float # Invested on every scheduled date
+    start: str
+    end: Optional[str] = None # Defaults to today
+    frequency: str = "monthly"
+
+class TimeMachineBatchRequest(BaseModel):
+    items: List[TimeMachineRequest] = []
+    schedules: List[DCASchedule] = []
+
+# Spacing between dollar-cost-averaging purchases
+DCA_FREQUENCIES = {
+    "weekly": pd.DateOffset(weeks=1),
+    "monthly": pd.DateOffset(months=1),
+    "quarterly": pd.DateOffset(months=3)
+}
+
+def _check_date(value: str, field: str):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail=f"Invalid {field}: {value!r} (expected YYYY-MM-DD)")
+
+def _schedule_dates(schedule: DCASchedule) -> List[str]:
+    start = pd.Timestamp(schedule.start)
+    end = pd.Timestamp(schedule.end) if schedule.end else pd.Timestamp.now().normalize()
+    step = DCA_FREQUENCIES[schedule.frequency]
+    dates = []
+    # Offsets from the start date, so month-end dates do not drift (Jan 31 -> Feb 28 -> Mar 31)
+    while len(dates) < 10000:
+        date = start + step * len(dates)
+        if date > end:
+            break
+        dates.append(date)
+    return [d.strftime("%Y-%m-%d") for d in dates]
+
+def _performance(invested: float, current_value: float) -> dict:
+    profit = current_value - invested
+    return {
+        "initial_investment": invested,
+        "current_value": current_value,
+        "profit": profit,
+        "roi": (profit / invested) * 100 if invested else 0
+    }
+
+@router.post("/time-machine/batch")
+async def calculate_time_machine_batch(request: TimeMachineBatchRequest):
+    """
+    Many time-machine lookups and DCA schedules at once. Each ticker's history is loaded
+    once and every date is resolved against it.
+    """
+    for schedule in request.schedules:
+        if schedule.frequency not in DCA_FREQUENCIES:
+            raise HTTPException(status_code=400, detail=f"Unsupported frequency: {schedule.frequency}")
+        _check_date(schedule.start, f"start date for {schedule.ticker}")
+        if schedule.end:
+            _check_date(schedule.end, f"end date for {schedule.ticker}")
+    # One bad date would otherwise fail the whole history lookup for its ticker
+    for item in request.items:
+        _check_date(item.date, f"date for {item.ticker}")
+    if not request.items and not request.schedules:
+        raise HTTPException(status_code=400, detail="No items or schedules given")
+
+    try:
+        schedule_dates = [_schedule_dates(schedule) for schedule in request.schedules]
+        dates_by_ticker = {}
+        for item in request.items:
+            dates_by_ticker.setdefault(item.ticker, set()).add(item.date)
+        for schedule, dates in zip(request.schedules, schedule_dates):
+            dates_by_ticker.setdefault(schedule.ticker, set()).update(dates)
+
+        tickers = list(dates_by_ticker)
+        quotes, *price_maps = await asyncio.gather(
+            afetcher.get_quotes(tickers),
+            *[afetcher.run(fetcher.get_historical_prices, t, sorted(dates_by_ticker[t])) for t in tickers]
+        )
+        past_prices = dict(zip(tickers, price_maps))
+        current_prices = {t: quotes[t]['price'] for t in tickers if t in quotes}
+        # Same fallback as the single-ticker endpoint for tickers the batched quote missed
+        missing = [t for t in tickers if t not in current_prices]
+        fallback = await asyncio.gather(*[afetcher.get_current_price(t) for t in missing])
+        current_prices.update(zip(missing, fallback))
+
+        items = []
+        for item in request.items:
+            past_price = past_prices[item.ticker].get(item.date, 0.0)
+            if past_price == 0:
+                items.append({"ticker": item.ticker, "past_date": item.date, "error": "Historical price not found"})
+                continue
+            current_price = current_prices[item.ticker]
+            if not current_price:
+                items.append({"ticker": item.ticker, "past_date": item.date, "error": "Current price not found"})
+                continue
+            shares = item.amount / past_price
+            items.append({
+                "ticker": item.ticker,
+                "past_date": item.date,
+                "past_price": past_price,
+                "current_price": current_price,
+                "shares": shares,
+                **_performance(item.amount, shares * current_price)
+            })
+
+        schedules = []
+        for schedule, dates in zip(request.schedules, schedule_dates):
+            current_price = current_prices[schedule.ticker]
+            if not current_price:
+                schedules.append({"ticker": schedule.ticker, "frequency": schedule.frequency, "start": schedule.start,
+                                  "error": "Current price not found"})
+                continue
+            purchases = []
+            for date in dates:
+                price = past_prices[schedule.ticker].get(date, 0.0)
+                if price > 0: # Skip dates before the ticker's first trading day
+                    purchases.append({"date": date, "price": price, "shares": schedule.amount / price})
+            invested = schedule.amount * len(purchases)
+            shares = sum(p['shares'] for p in purchases)
+            schedules.append({
+                "ticker": schedule.ticker,
+                "frequency": schedule.frequency,
+                "start": schedule.start,
+                "end": dates[-1] if dates else schedule.start,
+                "contributions": len(purchases),
+                "current_price": current_price,
+                "shares": shares,
+                "average_cost": invested / shares if shares else 0,
+                **_performance(invested, shares * current_price),
+                "purchases": purchases
+            })
+
+        valid = [i for i in items + schedules if 'error' not in i]
+        invested = sum(i['initial_investment'] for i in valid)
+        current_value = sum(i['current_value'] for i in valid)
+        return {"items": items, "schedules": schedules, "totals": _performance(invested, current_value)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
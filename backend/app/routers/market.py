@@ -1,16 +1,18 @@
 from fastapi import APIRouter, HTTPException
 from app.services.data_fetcher import MarketDataFetcher
+from app.services.async_fetcher import AsyncMarketDataFetcher
 from app.services.analyzer import ConsultantAgent
 
 router = APIRouter(prefix="/api/market", tags=["market"])
 
 fetcher = MarketDataFetcher()
+afetcher = AsyncMarketDataFetcher(fetcher)
 agent = ConsultantAgent()
 
 @router.get("/summary")
-def get_market_summary():
+async def get_market_summary():
     try:
-        summary = fetcher.get_market_summary()
+        summary = await afetcher.get_market_summary()
         return summary
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -24,7 +26,7 @@ def get_market_news():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/movers")
-def get_market_movers():
+async def get_market_movers():
     try:
         # Re-implement logic from main.py
         import random
@@ -32,24 +34,21 @@ def get_market_movers():
         
         candidates = random.sample(STOCK_DICT, k=min(len(STOCK_DICT), 15))
         
+        quotes = await afetcher.get_quotes([stock['ticker'] for stock in candidates])
+        
         movers = []
         for stock in candidates:
             ticker = stock['ticker']
-            try:
-                hist = fetcher.get_ticker_data(ticker, period="5d")
-                if not hist.empty and len(hist) >= 2:
-                    prev_close = hist['Close'].iloc[-2]
-                    curr_close = hist['Close'].iloc[-1]
-                    change_p = ((curr_close - prev_close) / prev_close) * 100
-                    
-                    movers.append({
-                        "ticker": ticker,
-                        "name": stock['name_kr'],
-                        "price": curr_close,
-                        "change": change_p
-                    })
-            except:
+            quote = quotes.get(ticker)
+            if not quote:
                 continue
+            
+            movers.append({
+                "ticker": ticker,
+                "name": stock['name_kr'],
+                "price": quote['price'],
+                "change": quote['change_percent']
+            })
         
         movers.sort(key=lambda x: x['change'], reverse=True)
         
@@ -61,9 +60,9 @@ def get_market_movers():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/regime")
-def get_market_regime():
+async def get_market_regime():
     try:
-        market_data = fetcher.get_market_summary()
+        market_data = await afetcher.get_market_summary()
         regime = agent.analyze_market_regime(market_data)
         return regime
     except Exception as e:
@@ -20,6 +20,7 @@ class PortfolioItem(BaseModel):
 def get_portfolio():
     try:
         holdings = db.get_holdings()
+        prices = fetcher.get_current_prices([item['ticker'] for item in holdings])
         result = []
         
         for item in holdings:
@@ -27,7 +28,7 @@ def get_portfolio():
             shares = item['shares']
             avg_price = item['avg_price']
             
-            current_price = fetcher.get_current_price(ticker)
+            current_price = prices[ticker]
             
             current_value = shares * current_price
             cost_basis = shares * avg_price
@@ -73,12 +74,13 @@ def remove_portfolio_item(ticker: str):
 def analyze_portfolio():
     try:
         holdings = db.get_holdings()
+        prices = fetcher.get_current_prices([item['ticker'] for item in holdings])
         enriched_holdings = []
         for item in holdings:
             ticker = item['ticker']
             shares = item['shares']
             avg_price = item['avg_price']
-            current_price = fetcher.get_current_price(ticker)
+            current_price = prices[ticker]
             
             current_value = shares * current_price
             cost_basis = shares * avg_price
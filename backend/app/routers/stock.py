@@ -1,13 +1,17 @@
 from fastapi import APIRouter, HTTPException
 from app.services.data_fetcher import MarketDataFetcher
+from app.services.async_fetcher import AsyncMarketDataFetcher
 from app.services.analyzer import ConsultantAgent
 from app.data.stocks import STOCK_DICT
+from app.data.search_index import get_search_index
 from pydantic import BaseModel
+import asyncio
 import random
 
 router = APIRouter(tags=["stock"])
 
 fetcher = MarketDataFetcher()
+afetcher = AsyncMarketDataFetcher(fetcher)
 agent = ConsultantAgent()
 db = fetcher.db
 
@@ -50,15 +54,9 @@ def get_stock_details(ticker: str, period: str = "1y"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/api/search")
-def search_stocks(query: str):
-    query = query.lower()
-    results = []
-    for stock in STOCK_DICT:
-        if (query in stock['ticker'].lower() or 
-            query in stock['name_en'].lower() or 
-            query in stock['name_kr']):
-            results.append(stock)
-    return results[:10]
+def search_stocks(query: str, limit: int = 10):
+    # Ranked: exact > prefix > substring, then popularity; "ㅅㅅ" matches 삼성
+    return [stock.to_dict() for stock in get_search_index().search(query, limit)]
 
 @router.get("/api/consult/{ticker}")
 def consult_stock(ticker: str):
@@ -109,11 +107,12 @@ def chat_guide(request: ChatRequest):
 def get_watchlist():
     try:
         watchlist_items = db.get_watchlist()
+        prices = fetcher.get_current_prices([item['ticker'] for item in watchlist_items])
         results = []
         for item in watchlist_items:
             ticker = item['ticker']
             name = item['name']
-            price = fetcher.get_current_price(ticker)
+            price = prices[ticker]
             results.append({
                 "ticker": ticker,
                 "name": name,
@@ -140,9 +139,9 @@ def remove_watchlist(ticker: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/api/stock/{ticker}/competitors")
-def get_competitors(ticker: str):
+async def get_competitors(ticker: str):
     try:
-        competitors = fetcher.get_competitors(ticker)
+        competitors = await afetcher.get_competitors(ticker)
         return competitors
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,36 +163,65 @@ def get_stock_events(ticker: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/api/recommendations")
-def get_recommendations():
+async def get_recommendations():
     try:
         candidates = random.sample(STOCK_DICT, k=min(len(STOCK_DICT), 8))
-        analyzed_results = []
-        for stock in candidates:
+
+        async def load(stock):
             ticker = stock['ticker']
             try:
-                history = fetcher.get_ticker_data(ticker, period="6mo")
-                info = fetcher.get_company_info(ticker)
-                news = fetcher.get_news(ticker)
-                advice = agent.get_advice(ticker, history, info, news)
-                
-                if advice['score'] > 0:
-                    analyzed_results.append({
-                        "ticker": ticker,
-                        "name": stock['name_kr'],
-                        "action": advice['action'],
-                        "score": advice['score'],
-                        "reasons": advice['reasons'],
-                        "price": fetcher.get_current_price(ticker)
-                    })
+                return await asyncio.gather(
+                    afetcher.get_ticker_data(ticker, period="6mo"),
+                    afetcher.get_company_info(ticker),
+                    afetcher.get_news(ticker)
+                )
             except Exception as e:
                 print(f"Error analyzing {ticker}: {e}")
-                continue
+                return None
+
+        quotes, *loaded = await asyncio.gather(
+            afetcher.get_quotes([stock['ticker'] for stock in candidates]),
+            *[load(stock) for stock in candidates]
+        )
+        inputs = {stock['ticker']: data for stock, data in zip(candidates, loaded) if data is not None}
+
+        def advise_all():
+            # Technical indicators for all candidates in one vectorized pass
+            tech = agent.tech_analyzer
+            panel = tech.analyze_panel(tech.panel_from_histories({t: data[0] for t, data in inputs.items()}))
+            advice = {}
+            for ticker, (history, info, news) in inputs.items():
+                technical = panel.loc[ticker].to_dict() if ticker in panel.index else None
+                advice[ticker] = agent.get_advice(ticker, history, info, news, technical=technical)
+            return advice
+
+        advice_by_ticker = await asyncio.to_thread(advise_all)
+
+        analyzed_results = []
+        for stock in candidates:
+            advice = advice_by_ticker.get(stock['ticker'])
+            if advice and advice['score'] > 0:
+                analyzed_results.append({
+                    "ticker": stock['ticker'],
+                    "name": stock['name_kr'],
+                    "action": advice['action'],
+                    "score": advice['score'],
+                    "reasons": advice['reasons'],
+                    "price": quotes.get(stock['ticker'], {}).get('price', 0.0)
+                })
         
         analyzed_results.sort(key=lambda x: x['score'], reverse=True)
         return analyzed_results[:3]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/api/indicators/{ticker}")
+def get_indicators(ticker: str):
+    try:
+        return fetcher.get_indicator_snapshot(ticker)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/api/analyze/volatility/{ticker}")
 def analyze_volatility(ticker: str):
     try:
@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services.provider_guard import provider_status
+from app.services.warmup import warmup_job
+from app.services.refresh_scheduler import refresh_scheduler
+from app.services.cache import shared_cache
+
+router = APIRouter(prefix="/api/system", tags=["system"])
+
+@router.get("/providers")
+def get_provider_status():
+    return provider_status()
+
+@router.get("/warmup")
+def get_warmup_status():
+    return warmup_job.status()
+
+@router.get("/cache")
+def get_cache_status():
+    return {"cache": shared_cache.stats(), "scheduler": refresh_scheduler.stats()}
+
+@router.get("/ready")
+def get_readiness():
+    # 503 until the startup warm-up has filled the caches (or given up retrying its failed
+    # critical steps, reported as "degraded" in /warmup), so rolling deploys wait for it
+    status = warmup_job.status()
+    return JSONResponse(status_code=200 if status['ready'] else 503, content=status)
@@ -1,7 +1,97 @@
+import hashlib
 import pandas as pd
 import numpy as np
 from textblob import TextBlob
 from typing import Dict, Any, List
+from app.services.cache import TTLCache
+
+# An article's polarity never changes, so it is memoized by link (or a hash of its text)
+polarity_memo = TTLCache(max_size=10000, default_ttl=7 * 24 * 3600)
+
+def article_polarity(item: Dict[str, Any]) -> float:
+    """
+    TextBlob polarity of a news item's title and summary, computed once per article.
+    """
+    if item.get('polarity') is not None:
+        return item['polarity']
+
+    text = f"{item.get('title', '')} {item.get('summary', '')}"
+    key = item.get('link') or hashlib.sha1(text.encode('utf-8')).hexdigest()
+    polarity = polarity_memo.get(key)
+    if polarity is None:
+        polarity = TextBlob(text).sentiment.polarity
+        polarity_memo.set(key, polarity)
+    return polarity
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Column-wise rolling(window).mean() for a matrix whose NaNs are all leading.
+    """
+    out = np.full_like(values, np.nan)
+    if len(values) < window:
+        return out
+    filled = np.nan_to_num(values)
+    sums = np.cumsum(filled, axis=0)
+    counts = np.cumsum(~np.isnan(values), axis=0)
+    window_sums = sums[window - 1:].copy()
+    window_sums[1:] -= sums[:-window]
+    window_counts = counts[window - 1:].copy()
+    window_counts[1:] -= counts[:-window]
+    out[window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+    return out
+
+def _gains_losses(closes: np.ndarray):
+    """
+    Up and down moves per bar. Like analyze(), the first bar's missing delta counts as 0.
+    """
+    delta = np.zeros_like(closes)
+    delta[1:] = closes[1:] - closes[:-1]
+    missing = np.isnan(closes)
+    delta[1:][np.isnan(delta[1:])] = 0.0 # First bar after leading NaNs
+    gains = np.where(missing, np.nan, np.maximum(delta, 0.0))
+    losses = np.where(missing, np.nan, np.maximum(-delta, 0.0))
+    return gains, losses
+
+def _last_window_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Last row of _rolling_mean(values, window), without computing the others.
+    """
+    if len(values) < window:
+        return np.full(values.shape[1:], np.nan)
+    return values[-window:].mean(axis=0)
+
+def _macd(values: np.ndarray):
+    """
+    Column-wise MACD (EWM 12 - EWM 26) and its EWM 9 signal line, as analyze() computes
+    them with ewm(adjust=False), for a matrix whose NaNs are all leading.
+    """
+    missing = np.isnan(values)
+    # Back-filling the leading NaNs with the first value leaves the recursions unchanged
+    filled = pd.DataFrame(values).bfill().to_numpy() if missing.any() else values
+    macd = np.empty_like(values)
+    signal = np.empty_like(values)
+    if not len(values):
+        return macd, signal
+
+    a12, a26, a9 = 2 / 13, 2 / 27, 2 / 10
+    fast, slow = filled[0].copy(), filled[0].copy()
+    sig = np.zeros_like(fast)
+    step = np.empty_like(fast)
+    for t in range(len(values)):
+        np.subtract(filled[t], fast, out=step)
+        step *= a12
+        fast += step
+        np.subtract(filled[t], slow, out=step)
+        step *= a26
+        slow += step
+        np.subtract(fast, slow, out=macd[t])
+        np.subtract(macd[t], sig, out=step)
+        step *= a9
+        sig += step
+        signal[t] = sig
+    macd[missing] = np.nan
+    signal[missing] = np.nan
+    return macd, signal
 
 class TechnicalAnalyzer:
     def analyze(self, history: pd.DataFrame) -> Dict[str, Any]:
@@ -45,6 +135,80 @@ class TechnicalAnalyzer:
             "sma_200": sma_200.iloc[-1]
         }
 
+    @staticmethod
+    def panel_from_histories(histories: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Builds a close-price matrix (dates x tickers) from per-ticker histories.
+        Dates are exchange-local, so KRX and US bars of the same day share a row.
+        """
+        columns = {}
+        for ticker, history in histories.items():
+            if history is None or history.empty:
+                continue
+            close = history['Close']
+            index = close.index.tz_localize(None) if getattr(close.index, 'tz', None) is not None else close.index
+            columns[ticker] = close.set_axis(index.normalize())
+        return pd.DataFrame(columns)
+
+    def analyze_panel(self, closes: pd.DataFrame, latest_only: bool = True):
+        """
+        Vectorized analyze() for many tickers at once.
+        closes is a dates x tickers matrix; NaN marks days a ticker did not trade.
+        latest_only=True returns one row per ticker with the same fields as analyze().
+        Otherwise returns {indicator: dates x tickers DataFrame} with the full series.
+        """
+        # Row-major, so each date's row is contiguous for the per-date recursions
+        values = np.ascontiguousarray(closes.to_numpy(dtype=float))
+        # Move each column's NaNs to the top so every ticker's bars are contiguous.
+        # Rolling windows and EWMs then see exactly the series analyze() would.
+        if np.isnan(values).any():
+            order = np.argsort(~np.isnan(values), axis=0, kind='stable')
+            packed = np.take_along_axis(values, order, axis=0)
+        else:
+            order = np.broadcast_to(np.arange(len(values))[:, None], values.shape)
+            packed = values
+
+        # Latest values only need the trailing window of each rolling mean
+        gains, losses = _gains_losses(packed if not latest_only else packed[-15:])
+
+        macd, signal = _macd(packed)
+
+        if not latest_only:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rsi = 100 - (100 / (1 + _rolling_mean(gains, 14) / _rolling_mean(losses, 14)))
+            series = {
+                "rsi": rsi,
+                "macd": macd,
+                "macd_signal": signal,
+                "sma_50": _rolling_mean(packed, 50),
+                "sma_200": _rolling_mean(packed, 200)
+            }
+            result = {}
+            for name, packed_series in series.items():
+                unpacked = np.empty_like(values)
+                np.put_along_axis(unpacked, order, packed_series, axis=0)
+                result[name] = pd.DataFrame(unpacked, index=closes.index, columns=closes.columns)
+            return result
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + _last_window_mean(gains, 14) / _last_window_mean(losses, 14)))
+        nan_row = np.full(values.shape[1], np.nan)
+        latest = pd.DataFrame({
+            "rsi": rsi,
+            "macd": macd[-1] if len(macd) else nan_row,
+            "macd_signal": signal[-1] if len(signal) else nan_row,
+            "sma_50": _last_window_mean(packed, 50),
+            "sma_200": _last_window_mean(packed, 200)
+        }, index=closes.columns)
+
+        price = packed[-1] if len(packed) else nan_row
+        sma_50, sma_200 = latest['sma_50'].to_numpy(), latest['sma_200'].to_numpy()
+        with np.errstate(invalid='ignore'):
+            bullish = (price > sma_50) & (sma_50 > sma_200)
+            bearish = (price < sma_50) & (sma_50 < sma_200)
+        latest['trend'] = np.select([bullish, bearish], ["상승세 (Bullish)", "하락세 (Bearish)"], "중립 (Neutral)")
+        return latest[["rsi", "macd", "macd_signal", "trend", "sma_50", "sma_200"]]
+
 class FundamentalAnalyzer:
     def analyze(self, info: Dict[str, Any]) -> Dict[str, Any]:
         if not info:
@@ -80,11 +244,7 @@ class SentimentAnalyzer:
         count = 0
         
         for item in news:
-            title = item.get('title', '')
-            summary = item.get('summary', '')
-            text = f"{title} {summary}"
-            blob = TextBlob(text)
-            total_polarity += blob.sentiment.polarity
+            total_polarity += article_polarity(item)
             count += 1
             
         avg_polarity = total_polarity / count if count > 0 else 0
@@ -107,8 +267,10 @@ class ConsultantAgent:
         self.fund_analyzer = FundamentalAnalyzer()
         self.sent_analyzer = SentimentAnalyzer()
         
-    def get_advice(self, ticker: str, history: pd.DataFrame, info: Dict[str, Any], news: List[Dict[str, Any]]) -> Dict[str, Any]:
-        tech_result = self.tech_analyzer.analyze(history)
+    def get_advice(self, ticker: str, history: pd.DataFrame, info: Dict[str, Any], news: List[Dict[str, Any]],
+                   technical: Dict[str, Any] = None) -> Dict[str, Any]:
+        # technical: precomputed TechnicalAnalyzer result (e.g. a row of analyze_panel)
+        tech_result = technical if technical is not None else self.tech_analyzer.analyze(history)
         fund_result = self.fund_analyzer.analyze(info)
         sent_result = self.sent_analyzer.analyze(news)
         
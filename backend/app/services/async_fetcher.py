@@ -0,0 +1,79 @@
+import asyncio
+import os
+from functools import partial
+from typing import Dict, Any, List
+import pandas as pd
+from app.services.data_fetcher import MarketDataFetcher
+
+# Maximum number of blocking upstream calls a fetcher runs at once
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "8"))
+
+class AsyncMarketDataFetcher:
+    """
+    Awaitable wrapper around MarketDataFetcher.
+    Blocking calls run in worker threads with at most `concurrency` of them in flight,
+    so fan-out endpoints can gather many fetches and wait only for the slowest one.
+    """
+    def __init__(self, fetcher: MarketDataFetcher = None, concurrency: int = FETCH_CONCURRENCY):
+        self.fetcher = fetcher or MarketDataFetcher()
+        self.concurrency = concurrency
+        self._semaphore = None
+
+    @property
+    def db(self):
+        return self.fetcher.db
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking call in a worker thread under the concurrency limit.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(partial(func, *args, **kwargs))
+
+    async def get_ticker_data(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        return await self.run(self.fetcher.get_ticker_data, ticker, period=period)
+
+    async def get_current_price(self, ticker: str) -> float:
+        return await self.run(self.fetcher.get_current_price, ticker)
+
+    async def get_quotes(self, tickers: list) -> Dict[str, Dict[str, float]]:
+        return await self.run(self.fetcher.get_quotes, tickers)
+
+    async def get_histories(self, tickers: list, period: str = "1y") -> Dict[str, pd.DataFrame]:
+        return await self.run(self.fetcher.get_histories, tickers, period=period)
+
+    async def get_company_info(self, ticker: str) -> Dict[str, Any]:
+        return await self.run(self.fetcher.get_company_info, ticker)
+
+    async def get_news(self, ticker: str) -> list:
+        return await self.run(self.fetcher.get_news, ticker)
+
+    async def get_market_summary(self) -> Dict[str, Any]:
+        return await self.run(self.fetcher.get_market_summary)
+
+    async def get_competitors(self, ticker: str) -> List[Dict[str, Any]]:
+        """
+        Same as MarketDataFetcher.get_competitors, but peer infos are fetched concurrently.
+        """
+        peers = self.fetcher._sector_peers(ticker)
+        if not peers:
+            return []
+
+        quotes, *infos = await asyncio.gather(
+            self.get_quotes([s['ticker'] for s in peers]),
+            *[self.get_company_info(s['ticker']) for s in peers],
+            return_exceptions=True
+        )
+        if isinstance(quotes, Exception):
+            print(f"Error fetching competitor quotes for {ticker}: {quotes}")
+            quotes = {}
+
+        competitors = []
+        for stock, info in zip(peers, infos):
+            if isinstance(info, Exception):
+                print(f"Error fetching competitor {stock['ticker']}: {info}")
+                continue
+            competitors.append(self.fetcher._competitor_row(stock, info, quotes))
+        return competitors
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+# TTL (seconds) per key namespace. The namespace is the part of the key
+# before the first ':' (e.g. "quote:AAPL" -> "quote").
+NAMESPACE_TTLS = {
+    "quote": 60,
+    "history": 300,
+    "news": 300,
+    "info": 3600,
+    "failure": 30, # Entries carry their own TTL per failure kind
+    "market_summary": 300,
+    "economic_data": 300,
+    "market_news": 300,
+}
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded in-memory cache with LRU eviction,
+    per-namespace TTLs and hit/miss/eviction counters.
+    """
+    def __init__(self, max_size: int = 2048, default_ttl: int = 300, namespace_ttls: Optional[Dict[str, int]] = None):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.namespace_ttls = dict(namespace_ttls or {})
+        self._data = OrderedDict() # key -> (value, stored_at, ttl)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def namespace(key: str) -> str:
+        return key.split(':', 1)[0]
+
+    def ttl_for(self, key: str) -> int:
+        return self.namespace_ttls.get(self.namespace(key), self.default_ttl)
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the cached value if present and not expired, otherwise None.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, stored_at, ttl = entry
+                if time.time() - stored_at < ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def get_stale(self, key: str, max_stale: int) -> Any:
+        """
+        Returns an expired value if it expired less than max_stale seconds ago, otherwise None.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, stored_at, ttl = entry
+            if time.time() - stored_at < ttl + max_stale:
+                self.stale_hits += 1
+                return value
+            return None
+
+    def expiry(self, key: str):
+        """
+        Returns (stored_at, ttl) for key without touching LRU order or counters, or None.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            return entry[1], entry[2]
+
+    def set(self, key: str, value: Any, ttl: int = None):
+        with self._lock:
+            ttl = ttl if ttl is not None else self.ttl_for(key)
+            self._data[key] = (value, time.time(), ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs the
+    function, later callers wait for it and share its result (or exception).
+    """
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+# Process-wide cache shared by every MarketDataFetcher instance
+shared_cache = TTLCache(namespace_ttls=NAMESPACE_TTLS)
+shared_flight = SingleFlight()
+
+# Background workers for stale-while-revalidate refreshes
+refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
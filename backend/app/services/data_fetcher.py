@@ -1,127 +1,685 @@
 import yfinance as yf
 import pandas as pd
+import numpy as np
 from typing import Dict, Any, Optional
-from deep_translator import GoogleTranslator
 from app.services.db_service import DBService
-from app.data.stocks import STOCK_DICT
-from textblob import TextBlob
+from app.services.translator import CachedTranslator
+from app.services.analyzer import article_polarity
+from app.services.cache import shared_cache, shared_flight, refresh_executor
+from app.services.refresh_scheduler import refresh_scheduler
+from app.services.indicators import IndicatorEngine
+from app.services.market_calendar import market_ttl, summary_ttl
+from app.services.provider_guard import get_guard, FetchFailure, classify_failure, NOT_FOUND, TRANSIENT
+from app.data.registry import ticker_registry
 import requests
+import re
+import time
 from datetime import datetime, timedelta
 import calendar
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# How long past its TTL a dashboard entry may still be served while it refreshes in the background
+MAX_STALE_SECONDS = 1800
+# How long past its TTL any entry may still be served when a refetch comes back empty (provider down)
+STALE_IF_ERROR_SECONDS = 3600
+
+# Minimum age of the local OHLCV store before a ticker is gap-filled from upstream
+# (during the session; outside it the store stays fresh until the next open)
+HISTORY_REFRESH_SECONDS = 300
+MAX_PERIOD_START = "1900-01-01"
+# Every history load covers at least this period so shorter periods are sliced from memory
+HISTORY_SUPERSET_PERIOD = "5y"
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# History fed to a streaming indicator engine when its state is (re)built
+INDICATOR_SEED_PERIOD = "2y"
+
+# How long company info (yf.Ticker.info) persisted in market.db is considered fresh
+FUNDAMENTALS_TTL = int(os.getenv("FUNDAMENTALS_TTL", str(24 * 3600)))
+
+# Freshness policy (seconds) for company_cache fields. Volatile numbers expire quickly,
+# the translated summary slowly. Stale rows are served and refreshed in the background.
+COMPANY_FIELD_TTLS = {
+    "market_cap": 3600,
+    "fifty_two_week_high": 3600,
+    "fifty_two_week_low": 3600,
+    "dividend_yield": 24 * 3600,
+    "summary_kr": 30 * 24 * 3600
+}
+
+# Most peers returned by get_competitors; a full universe can list thousands per sector
+MAX_COMPETITORS = 25
+
+# Tickers shown in the market summary
+MARKET_INDICES = {
+    "^GSPC": "S&P 500",
+    "^IXIC": "Nasdaq",
+    "^DJI": "Dow Jones",
+    "^KS11": "KOSPI",
+    "^KQ11": "KOSDAQ",
+    "GC=F": "Gold",
+    "CL=F": "WTI Crude Oil",
+    "KRW=X": "USD/KRW",
+    "BTC-USD": "Bitcoin",
+    "^TNX": "10Y Treasury Yield",
+    "^VIX": "VIX (Volatility)"
+}
 
 class MarketDataFetcher:
     def __init__(self):
         self.db = DBService()
-        self.cache = {} # Simple in-memory cache
-        self.cache_ttl = 300 # 300 seconds (5 minutes)
+        self.translator = CachedTranslator(db=self.db)
+        self.cache = shared_cache # Process-wide cache shared by all fetchers
+        self.flight = shared_flight # Coalesces concurrent misses on the same key
+        self.scheduler = refresh_scheduler # Refreshes frequently read keys ahead of expiry
+        self.yahoo = get_guard("yahoo")
+        self.cnn = get_guard("cnn")
 
-    def _get_cached_data(self, key: str, fetch_func, ttl: int = None):
+    def _get_cached_data(self, key: str, fetch_func, ttl: int = None, max_stale: int = None):
         """
         Helper to get data from cache or fetch it.
+        TTL defaults to the namespace TTL of the shared cache.
+        Concurrent misses on the same key share a single fetch.
+        With max_stale (stale-while-revalidate), an expired value younger than
+        TTL + max_stale is returned immediately and refreshed in the background.
         """
-        import time
-        current_time = time.time()
-        ttl = ttl or self.cache_ttl
-        
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if current_time - timestamp < ttl:
+        def fetch_and_store():
+            data = fetch_func()
+            if data:
+                self.cache.set(key, data, ttl)
+            return data
+
+        self.scheduler.record(key, fetch_and_store)
+        data = self.cache.get(key)
+        if data is not None:
+            return data
+
+        def load():
+            # Another caller may have filled the cache while we waited for the lock
+            data = self.cache.get(key)
+            if data is not None:
                 return data
-        
-        # Fetch fresh data
-        data = fetch_func()
-        if data:
-            self.cache[key] = (data, current_time)
-        return data
+            data = fetch_and_store()
+            if data:
+                return data
+            # Upstream failed or is unhealthy: fall back to the last good value
+            stale = self.cache.get_stale(key, STALE_IF_ERROR_SECONDS)
+            return stale if stale is not None else data
+
+        if max_stale:
+            stale = self.cache.get_stale(key, max_stale)
+            if stale is not None:
+                self._refresh_in_background(key, load)
+                return stale
+
+        return self.flight.do(key, load)
+
+    def _refresh_in_background(self, key: str, load):
+        """
+        Schedules a single background refresh for key (no-op if one is already running).
+        """
+        if self.flight.in_flight(key):
+            return
+
+        def refresh():
+            try:
+                self.flight.do(key, load)
+            except Exception as e:
+                print(f"Background refresh failed for {key}: {e}")
+
+        refresh_executor.submit(refresh)
+
+    def _last_good(self, key: str) -> Dict[str, Any]:
+        """
+        Returns the last value cached under key, if young enough to stand in for parts of a
+        refetch that failed, otherwise {}.
+        """
+        return self.cache.get_stale(key, STALE_IF_ERROR_SECONDS) or {}
+
+    def _failure(self, key: str) -> Optional[FetchFailure]:
+        """
+        Returns the cached failure for key if a recent lookup failed.
+        """
+        return self.cache.get(f"failure:{key}")
+
+    def _record_failure(self, key: str, error: Exception = None, kind: str = None) -> FetchFailure:
+        """
+        Negative-caches a failed lookup for a TTL that depends on the failure kind.
+        """
+        failure = FetchFailure(kind or classify_failure(error), str(error or 'no data'))
+        self.cache.set(f"failure:{key}", failure, failure.ttl)
+        return failure
+
+    def _download(self, tickers: list, **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Bulk-downloads daily bars for several tickers in a single request.
+        Returns {ticker: DataFrame}; tickers that came back missing or all-NaN are left out.
+        Failures are read from the returned frame only: yf.download keeps per-ticker errors
+        in a process-global dict that concurrent downloads overwrite.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        data = self.yahoo.call(yf.download, tickers, group_by='ticker', auto_adjust=True, progress=False, threads=True, **kwargs)
+        frames = {}
+        if data is None or data.empty:
+            return frames
+
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                df = data[ticker]
+            elif len(tickers) == 1:
+                df = data # Single ticker downloads may come back with flat columns
+            else:
+                continue
+            df = df.dropna(how='all')
+            if not df.empty:
+                frames[ticker] = df
+        return frames
+
+    def _record_download_failures(self, namespace: str, tickers: list, frames: Dict[str, pd.DataFrame]):
+        """
+        Negative-caches the tickers a bulk download returned nothing for. An empty result
+        carries no reason, so it is treated as transient; only explicit errors (e.g. a
+        delisted symbol raised by a per-ticker call) are remembered as NOT_FOUND.
+        """
+        for ticker in tickers:
+            if ticker not in frames:
+                self._record_failure(f"{namespace}:{ticker}", kind=TRANSIENT)
+
+    def get_quotes(self, tickers: list) -> Dict[str, Dict[str, float]]:
+        """
+        Gets latest price and daily change for many tickers with one bulk request.
+        Results are stored in the per-ticker quote cache.
+        Returns {ticker: {"price", "previous_close", "change", "change_percent"}}.
+        """
+        quotes = {}
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            self.scheduler.record(f"quote:{ticker}", self._fetch_quotes, batch=("quote", ticker))
+            cached = self.cache.get(f"quote:{ticker}")
+            if cached is not None:
+                quotes[ticker] = cached
+            elif self._failure(f"quote:{ticker}") is None:
+                missing.append(ticker)
+
+        if missing:
+            quotes.update(self._fetch_quotes(missing))
+        return quotes
+
+    def _fetch_quotes(self, tickers: list) -> Dict[str, Dict[str, float]]:
+        """
+        Downloads quotes for tickers regardless of the cache and stores them in it.
+        """
+        quotes = {}
+        try:
+            frames = self._download(tickers, period="5d")
+        except Exception as e:
+            print(f"Error fetching quotes for {tickers}: {e}")
+            for ticker in tickers:
+                self._record_failure(f"quote:{ticker}", e)
+            return quotes
+        self._record_download_failures("quote", tickers, frames)
+
+        for ticker, df in frames.items():
+            closes = df['Close'].dropna()
+            if closes.empty:
+                continue
+            price = float(closes.iloc[-1])
+            prev_close = float(closes.iloc[-2]) if len(closes) > 1 else price
+            change = price - prev_close
+            quote = {
+                "price": price,
+                "previous_close": prev_close,
+                "change": change,
+                "change_percent": (change / prev_close) * 100 if prev_close else 0
+            }
+            self.cache.set(f"quote:{ticker}", quote, market_ttl(ticker, self.cache.ttl_for("quote")))
+            quotes[ticker] = quote
+        return quotes
+
+    def get_histories(self, tickers: list, period: str = "1y") -> Dict[str, pd.DataFrame]:
+        """
+        Fetches historical data for many tickers with one bulk request.
+        Results are stored in the per-ticker history cache used by get_ticker_data.
+        """
+        histories = {}
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            cached = self._cached_history(ticker, period)
+            if cached is not None:
+                histories[ticker] = cached
+            elif self._failure(f"history:{ticker}") is None:
+                missing.append(ticker)
+
+        if not missing:
+            return histories
+
+        try:
+            frames = self._download(missing, period=period)
+        except Exception as e:
+            print(f"Error fetching histories for {missing}: {e}")
+            for ticker in missing:
+                self._record_failure(f"history:{ticker}", e)
+            return histories
+        self._record_download_failures("history", missing, frames)
+
+        for ticker, df in frames.items():
+            readjusted = False
+            try:
+                readjusted = self._store_download(ticker, df)
+            except Exception as e:
+                print(f"Error storing history for {ticker}: {e}")
+            entry = self.cache.get(f"history:{ticker}")
+            if readjusted or entry is None or entry['start'] > self._period_start(period):
+                self.cache.set(f"history:{ticker}", {"frame": df, "start": self._period_start(period)},
+                               market_ttl(ticker, self.cache.ttl_for("history")))
+            histories[ticker] = df
+        return histories
+
+    def _period_start(self, period: str) -> str:
+        """
+        Returns the first calendar date (YYYY-MM-DD) covered by a yfinance-style period.
+        """
+        today = pd.Timestamp.now().normalize()
+        if period == 'max':
+            return MAX_PERIOD_START
+        if period == 'ytd':
+            return today.replace(month=1, day=1).strftime('%Y-%m-%d')
+
+        match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+        if not match:
+            raise ValueError(f"Unsupported period: {period}")
+        n, unit = int(match.group(1)), match.group(2)
+        if unit == 'd':
+            # Trading days: look back far enough to cover weekends and holidays
+            start = today - pd.Timedelta(days=n * 2 + 7)
+        elif unit == 'wk':
+            start = today - pd.Timedelta(weeks=n)
+        elif unit == 'mo':
+            start = today - pd.DateOffset(months=n)
+        else:
+            start = today - pd.DateOffset(years=n)
+        return start.strftime('%Y-%m-%d')
+
+    def _frame_to_rows(self, df: pd.DataFrame) -> list:
+        df = df[OHLCV_COLUMNS].dropna(subset=['Close'])
+        return [
+            (ts.strftime('%Y-%m-%d'), float(o), float(h), float(l), float(c), float(v) if pd.notna(v) else 0.0)
+            for ts, o, h, l, c, v in df.itertuples()
+        ]
+
+    def _anchor_moved(self, stored: list, fetched: list) -> bool:
+        """
+        True when prices were re-adjusted upstream (split/dividend) since stored was saved:
+        the close of the last settled stored bar differs from the freshly fetched one.
+        The last stored bar itself may have been a partial session, so it is not compared.
+        """
+        if not stored:
+            return False
+        anchor = stored[-2] if len(stored) > 1 else stored[-1]
+        anchor_date, anchor_close = anchor[0], anchor[4]
+        fetched_close = next((row[4] for row in fetched if row[0] == anchor_date), None)
+        return fetched_close is not None and abs(fetched_close - anchor_close) > abs(anchor_close) * 1e-3
+
+    def _store_download(self, ticker: str, df: pd.DataFrame) -> bool:
+        """
+        Saves bulk-downloaded bars to the local OHLCV store. If the stored bars they overlap were
+        adjusted differently, or none overlap (so neither the adjustment nor the gap in between
+        can be checked), the ticker is rewritten with just these bars so the store never mixes
+        adjustment levels. Returns True when the ticker was rewritten.
+        """
+        rows = self._frame_to_rows(df)
+        if not rows:
+            return False
+        start = rows[0][0]
+        stored = self.db.get_ohlcv(ticker, start=start)
+        if stored:
+            readjusted = self._anchor_moved(stored, rows)
+        else:
+            readjusted = self.db.get_ohlcv_meta(ticker) is not None
+        self.db.save_ohlcv(ticker, rows, start, self._timezone_of(df), replace=readjusted)
+        return readjusted
+
+    def _rows_to_frame(self, rows: list, timezone: str = None) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=['Date'] + OHLCV_COLUMNS)
+        df['Date'] = pd.to_datetime(df['Date'])
+        if timezone:
+            df['Date'] = df['Date'].dt.tz_localize(timezone)
+        return df.set_index('Date')
+
+    def _timezone_of(self, df: pd.DataFrame) -> Optional[str]:
+        tz = getattr(df.index, 'tz', None)
+        return str(tz) if tz is not None else None
+
+    def _download_history(self, stock, start: str) -> pd.DataFrame:
+        if start == MAX_PERIOD_START:
+            return self.yahoo.call(stock.history, period='max')
+        return self.yahoo.call(stock.history, start=start)
+
+    def _sync_history(self, ticker: str, start: str) -> Optional[Dict[str, Any]]:
+        """
+        Brings the local OHLCV store for ticker up to date so it covers start..today,
+        downloading only the bars that are missing. Returns the ticker's store metadata.
+        """
+        meta = self.db.get_ohlcv_meta(ticker)
+        stock = yf.Ticker(ticker)
+
+        if meta and meta['coverage_start'] <= start:
+            updated_at = datetime.fromisoformat(meta['updated_at']).timestamp()
+            if time.time() - updated_at < market_ttl(ticker, HISTORY_REFRESH_SECONDS, now=updated_at):
+                return meta
+
+            # Gap-fill from the second-to-last stored bar: the last one may have been a partial session
+            lookback = (pd.Timestamp(meta['last_date']) - pd.Timedelta(days=14)).strftime('%Y-%m-%d')
+            recent = self.db.get_ohlcv(ticker, start=lookback)
+            anchor = recent[-2] if len(recent) > 1 else recent[-1]
+
+            hist = self.yahoo.call(stock.history, start=anchor[0])
+            if hist.empty:
+                return meta
+
+            rows = self._frame_to_rows(hist)
+            if self._anchor_moved(recent, rows):
+                # Prices were re-adjusted upstream (split/dividend): reload the whole covered range
+                full = self._download_history(stock, meta['coverage_start'])
+                if not full.empty:
+                    self.db.save_ohlcv(ticker, self._frame_to_rows(full), meta['coverage_start'], self._timezone_of(full), replace=True)
+            else:
+                self.db.save_ohlcv(ticker, rows, meta['coverage_start'], self._timezone_of(hist))
+            return self.db.get_ohlcv_meta(ticker)
+
+        # Requested range is not covered yet: download it in full once
+        hist = self._download_history(stock, start)
+        if hist.empty:
+            return meta
+        self.db.save_ohlcv(ticker, self._frame_to_rows(hist), start, self._timezone_of(hist))
+        return self.db.get_ohlcv_meta(ticker)
+
+    def _slice_history(self, frame: pd.DataFrame, start: str, period: str) -> pd.DataFrame:
+        """
+        Cuts a longer series down to the requested period.
+        """
+        hist = frame[frame.index >= pd.Timestamp(start, tz=frame.index.tz)]
+        trading_days = re.fullmatch(r'(\d+)d', period)
+        if trading_days:
+            hist = hist.tail(int(trading_days.group(1)))
+        return hist
+
+    def _cached_history(self, ticker: str, period: str) -> Optional[pd.DataFrame]:
+        """
+        Serves period from the longest in-memory series kept for ticker, if it covers it.
+        """
+        entry = self.cache.get(f"history:{ticker}")
+        if entry is None:
+            return None
+        start = self._period_start(period)
+        if entry['start'] > start:
+            return None
+        return self._slice_history(entry['frame'], start, period)
 
     def get_ticker_data(self, ticker: str, period: str = "1y") -> pd.DataFrame:
         """
         Fetches historical data for a given ticker.
+        One superset series (at least HISTORY_SUPERSET_PERIOD) is kept in memory per ticker and
+        shorter periods are sliced from it. Bars are kept in the local OHLCV store; only bars
+        after the last stored date are downloaded.
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
-            return hist
+            start = self._period_start(period)
+        except ValueError:
+            # Unknown period format: bypass the local store
+            try:
+                return self.yahoo.call(yf.Ticker(ticker).history, period=period)
+            except Exception as e:
+                print(f"Error fetching data for {ticker}: {e}")
+                return pd.DataFrame()
+
+        load_start = min(start, self._period_start(HISTORY_SUPERSET_PERIOD))
+        flight_key = f"history:{ticker}:{load_start}"
+        load = partial(self._load_history, ticker, load_start)
+        self.scheduler.record(f"history:{ticker}", load, flight_key=flight_key)
+
+        cached = self._cached_history(ticker, period)
+        if cached is not None:
+            return cached
+        if self._failure(f"history:{ticker}") is not None:
+            return pd.DataFrame()
+
+        frame = self.flight.do(flight_key, load)
+        if frame.empty:
+            return frame
+        return self._slice_history(frame, start, period)
+
+    def _load_history(self, ticker: str, load_start: str) -> pd.DataFrame:
+        """
+        Syncs the local OHLCV store from load_start and caches the stored bars.
+        """
+        error = None
+        try:
+            meta = self._sync_history(ticker, load_start)
         except Exception as e:
+            # Serve whatever is stored locally
             print(f"Error fetching data for {ticker}: {e}")
+            error = e
+            meta = self.db.get_ohlcv_meta(ticker)
+
+        if not meta:
+            self._record_failure(f"history:{ticker}", error)
             return pd.DataFrame()
 
+        frame = self._rows_to_frame(self.db.get_ohlcv(ticker, start=load_start), meta['timezone'])
+        if not frame.empty:
+            self.cache.set(f"history:{ticker}", {"frame": frame, "start": load_start},
+                           market_ttl(ticker, self.cache.ttl_for("history")))
+        return frame
+
     def get_current_price(self, ticker: str) -> float:
         """
         Gets the current price (or last close).
+        Returns 0.0 straight away for tickers recently found not to exist, or whose per-ticker
+        fallbacks recently failed. After a transient quote failure it skips the bulk quote and
+        goes straight to the per-ticker fallbacks.
         """
+        failure = self._failure(f"quote:{ticker}")
+        if failure is not None and failure.kind == NOT_FOUND:
+            return 0.0
+        if self._failure(f"price:{ticker}") is not None:
+            return 0.0
+
+        if failure is None:
+            quote = self.get_quotes([ticker]).get(ticker)
+            if quote:
+                return quote['price']
+
         try:
             stock = yf.Ticker(ticker)
             # fast_info is often faster/more reliable for current price
-            return stock.fast_info.last_price
+            return self.yahoo.call(lambda: stock.fast_info.last_price)
         except Exception as e:
             # Fallback for indices like ^IXIC which sometimes fail on fast_info
+            error = e
             try:
-                hist = stock.history(period="1d")
+                hist = self.yahoo.call(stock.history, period="1d")
                 if not hist.empty:
                     return hist['Close'].iloc[-1]
-            except Exception:
-                pass
+            except Exception as history_error:
+                error = history_error
             print(f"Error fetching price for {ticker}: {e}")
+            self._record_failure(f"price:{ticker}", error)
             return 0.0
 
+    def get_current_prices(self, tickers: list) -> Dict[str, float]:
+        """
+        Gets current prices for many tickers from one bulk quote request. Tickers the bulk
+        quote missed go through get_current_price's per-ticker fallbacks; 0.0 means no price.
+        """
+        quotes = self.get_quotes(tickers)
+        return {ticker: quotes[ticker]['price'] if ticker in quotes else self.get_current_price(ticker)
+                for ticker in dict.fromkeys(tickers)}
+
     def get_historical_price(self, ticker: str, date: str) -> float:
         """
         Gets the closing price on a specific date (or nearest previous trading day).
         Date format: YYYY-MM-DD
         """
+        return self.get_historical_prices(ticker, [date]).get(date, 0.0)
+
+    def get_historical_prices(self, ticker: str, dates: list) -> Dict[str, float]:
+        """
+        Gets closing prices on many dates (nearest previous trading day each) from a single
+        history load. Dates before the first available bar map to 0.0.
+        Date format: YYYY-MM-DD
+        """
+        if not dates:
+            return {}
         try:
-            stock = yf.Ticker(ticker)
-            # Fetch data for a small window around the date to ensure we find a trading day
-            target_date = datetime.strptime(date, "%Y-%m-%d")
-            start_date = target_date - timedelta(days=5)
-            end_date = target_date + timedelta(days=1)
-            
-            hist = stock.history(start=start_date.strftime("%Y-%m-%d"), end=end_date.strftime("%Y-%m-%d"))
-            
-            if not hist.empty:
-                # Return the price closest to the target date (last available in the window)
-                return hist['Close'].iloc[-1]
-            return 0.0
+            # Unparseable dates map to 0.0 without failing the others
+            targets = pd.DatetimeIndex(pd.to_datetime(dates, format='%Y-%m-%d', errors='coerce'))
+            if targets.isna().all():
+                return {date: 0.0 for date in dates}
+            # Whole years back to the earliest date, so the load is served by the local store
+            days = (pd.Timestamp.now().normalize() - targets.min()).days
+            hist = self.get_ticker_data(ticker, period=f"{max(days, 0) // 365 + 1}y")
+            closes = hist['Close'].dropna() if not hist.empty else pd.Series(dtype=float)
+            if closes.empty:
+                return {date: 0.0 for date in dates}
+
+            index = closes.index
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            # Position of the last bar on or before each date
+            positions = index.normalize().searchsorted(targets, side='right') - 1
+            values = closes.to_numpy()[np.clip(positions, 0, None)]
+            prices = np.where((positions >= 0) & ~targets.isna(), values, 0.0)
+            return {date: float(price) for date, price in zip(dates, prices)}
         except Exception as e:
-            print(f"Error fetching historical price for {ticker} on {date}: {e}")
-            return 0.0
+            print(f"Error fetching historical prices for {ticker}: {e}")
+            return {date: 0.0 for date in dates}
 
-    def get_company_info(self, ticker: str) -> Dict[str, Any]:
+    def get_indicator_snapshot(self, ticker: str) -> Dict[str, Any]:
         """
-        Gets company profile/info.
+        Latest RSI / MACD / SMA values from the ticker's persisted streaming indicator state.
+        Only bars newer than the state are applied. The state is reseeded from
+        INDICATOR_SEED_PERIOD of history when it is missing or the stored bars were
+        re-adjusted (e.g. after a split).
         """
+        history = self.get_ticker_data(ticker, period=INDICATOR_SEED_PERIOD)
+        if history.empty:
+            return {}
+        closes = history['Close'].dropna()
+        closes.index = closes.index.strftime('%Y-%m-%d')
+
+        stored = self.db.get_indicator_state(ticker)
+        engine = IndicatorEngine.from_dict(stored) if stored else None
+        if engine is not None and engine.prev_date is not None:
+            anchor = closes.get(engine.prev_date)
+            if anchor is None or abs(anchor - engine.prev_close) > 1e-6 * abs(engine.prev_close):
+                engine = None
+
+        if engine is None:
+            engine = IndicatorEngine().seed(closes)
+        else:
+            before = (engine.last_date, engine.last_close)
+            for date, close in closes[closes.index >= engine.last_date].items():
+                engine.update(date, float(close))
+            if (engine.last_date, engine.last_close) == before:
+                return engine.snapshot()
+
         try:
-            stock = yf.Ticker(ticker)
-            return stock.info
+            self.db.save_indicator_state(ticker, engine.to_dict())
         except Exception as e:
-            print(f"Error fetching info for {ticker}: {e}")
-            return {}
+            print(f"Error storing indicator state for {ticker}: {e}")
+        return engine.snapshot()
+
+    def get_company_info(self, ticker: str, max_age: int = None) -> Dict[str, Any]:
+        """
+        Gets company profile/info.
+        Cached in memory and in market.db; refetched once older than FUNDAMENTALS_TTL,
+        or older than max_age when given (which also bypasses the memory cache).
+        """
+        key = f"info:{ticker}"
+        ttl = min(self.cache.ttl_for("info"), FUNDAMENTALS_TTL)
+
+        def fetch_info():
+            stored = self.db.get_fundamentals(ticker)
+            if stored:
+                age = time.time() - datetime.fromisoformat(stored['fetched_at']).timestamp()
+                if age < (max_age or FUNDAMENTALS_TTL):
+                    return stored['info']
+
+            if self._failure(key) is not None:
+                return stored['info'] if stored else {}
+
+            try:
+                stock = yf.Ticker(ticker)
+                info = self.yahoo.call(lambda: stock.info)
+            except Exception as e:
+                print(f"Error fetching info for {ticker}: {e}")
+                self._record_failure(key, e)
+                # An outdated copy beats nothing
+                return stored['info'] if stored else {}
+
+            if info:
+                self.db.save_fundamentals(ticker, info)
+            else:
+                self._record_failure(key)
+            return info
+
+        if max_age is not None:
+            info = fetch_info()
+            if info:
+                self.cache.set(key, info, ttl)
+            return info
+
+        return self._get_cached_data(key, fetch_info, ttl=ttl)
 
     def get_translated_company_info(self, ticker: str) -> Dict[str, Any]:
         """
         Gets company info with translated summary and details, using cache.
+        Cached rows are always served immediately; fields past their COMPANY_FIELD_TTLS
+        policy are refreshed by a background job.
         """
         # Check cache
         cached = self.db.get_company_cache(ticker)
         if cached:
+            stale_fields = self._stale_company_fields(cached)
+            if stale_fields:
+                refresh_summary = 'summary_kr' in stale_fields
+                max_age = min(COMPANY_FIELD_TTLS[f] for f in stale_fields)
+                self._refresh_in_background(
+                    f"company:{ticker}",
+                    lambda: self._build_company_cache(ticker, refresh_summary=refresh_summary, max_age=max_age)
+                )
             return cached
 
-        # Fetch fresh
-        info = self.get_company_info(ticker)
-        if not info:
-            return {}
+        # Cold miss: fetch fresh
+        return self._build_company_cache(ticker)
 
-        # Translate Summary
-        summary_en = info.get('longBusinessSummary', '')
-        summary_kr = summary_en
-        if summary_en:
+    def _stale_company_fields(self, cached: Dict[str, Any]) -> list:
+        now = time.time()
+        stale = []
+        for field, ttl in COMPANY_FIELD_TTLS.items():
+            updated_at = cached['summary_updated_at'] if field == 'summary_kr' else cached['details_updated_at']
             try:
-                # Split into chunks if too long (Google Translate has limits), but deep_translator handles some.
-                # For safety, let's just try translating.
-                summary_kr = GoogleTranslator(source='auto', target='ko').translate(summary_en)
-            except Exception as e:
-                print(f"Translation failed for {ticker}: {e}")
+                if now - datetime.fromisoformat(updated_at).timestamp() >= ttl:
+                    stale.append(field)
+            except (TypeError, ValueError):
+                stale.append(field)
+        return stale
+
+    def _build_company_cache(self, ticker: str, refresh_summary: bool = True, max_age: int = None) -> Dict[str, Any]:
+        """
+        Fetches company info, translates the summary (if requested) and stores the row in company_cache.
+        """
+        info = self.get_company_info(ticker, max_age=max_age)
+        if not info:
+            return {}
 
         # Extract Details
         details = {
@@ -138,6 +696,21 @@ class MarketDataFetcher:
             "fifty_two_week_low": info.get('fiftyTwoWeekLow', 'N/A')
         }
 
+        if not refresh_summary:
+            self.db.update_company_details(ticker, details)
+            return self.db.get_company_cache(ticker)
+
+        # Translate Summary
+        summary_en = info.get('longBusinessSummary', '')
+        summary_kr = summary_en
+        if summary_en:
+            try:
+                # Split into chunks if too long (Google Translate has limits), but deep_translator handles some.
+                # For safety, let's just try translating.
+                summary_kr = self.translator.translate(summary_en)
+            except Exception as e:
+                print(f"Translation failed for {ticker}: {e}")
+
         # Save to Cache
         self.db.save_company_cache(ticker, summary_kr, details)
 
@@ -147,43 +720,49 @@ class MarketDataFetcher:
             "last_updated": "Just Now"
         }
 
+    def _sector_peers(self, ticker: str) -> list:
+        """
+        Returns registry records in the same sector as ticker (excluding itself),
+        same-market peers first.
+        """
+        current_stock = ticker_registry.get(ticker)
+        if not current_stock or not current_stock.sector:
+            return []
+
+        peers = [s for s in ticker_registry.by_sector(current_stock.sector) if s.ticker != ticker]
+        peers.sort(key=lambda s: s.market != current_stock.market)
+        return peers[:MAX_COMPETITORS]
+
+    def _competitor_row(self, stock: Dict[str, Any], info: Dict[str, Any], quotes: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+        return {
+            "ticker": stock['ticker'],
+            "name": stock['name_kr'],
+            "price": quotes.get(stock['ticker'], {}).get('price', 0.0),
+            "market_cap": info.get('marketCap', 0),
+            "pe_ratio": info.get('trailingPE', 0)
+        }
+
     def get_competitors(self, ticker: str) -> list:
         """
         Finds competitors in the same sector and fetches their basic data.
         """
-        # Find current stock's sector
-        current_stock = next((s for s in STOCK_DICT if s['ticker'] == ticker), None)
-        if not current_stock:
-            return []
-        
-        sector = current_stock.get('sector')
-        if not sector:
-            return []
+        peers = self._sector_peers(ticker)
+        quotes = self.get_quotes([s['ticker'] for s in peers])
 
         competitors = []
-        for stock in STOCK_DICT:
-            if stock['ticker'] != ticker and stock.get('sector') == sector:
-                try:
-                    info = self.get_company_info(stock['ticker'])
-                    price = self.get_current_price(stock['ticker'])
-                    market_cap = info.get('marketCap', 0)
-                    pe_ratio = info.get('trailingPE', 0)
-                    
-                    competitors.append({
-                        "ticker": stock['ticker'],
-                        "name": stock['name_kr'],
-                        "price": price,
-                        "market_cap": market_cap,
-                        "pe_ratio": pe_ratio
-                    })
-                except Exception as e:
-                    print(f"Error fetching competitor {stock['ticker']}: {e}")
+        for stock in peers:
+            try:
+                info = self.get_company_info(stock['ticker'])
+                competitors.append(self._competitor_row(stock, info, quotes))
+            except Exception as e:
+                print(f"Error fetching competitor {stock['ticker']}: {e}")
         
         return competitors
 
     def get_news_briefing(self, ticker: str) -> list:
         """
         Fetches news, translates to Korean, analyzes sentiment, and returns top 3.
+        Untranslated items are returned in English with translation_pending set.
         """
         try:
             # 1. Fetch News
@@ -192,16 +771,15 @@ class MarketDataFetcher:
                 return []
 
             processed_news = []
-            translator = GoogleTranslator(source='auto', target='ko')
+            translator = self.translator
 
             # Process only top 3 to save time/resources
             for item in raw_news[:3]:
                 title_en = item.get('title', '')
                 summary_en = item.get('summary', '')
                 
-                # 2. Sentiment Analysis (on English text)
-                blob = TextBlob(f"{title_en} {summary_en}")
-                polarity = blob.sentiment.polarity
+                # 2. Sentiment Analysis (on English text, computed once per article at ingest)
+                polarity = article_polarity(item)
                 
                 sentiment = "중립"
                 if polarity > 0.1:
@@ -209,25 +787,9 @@ class MarketDataFetcher:
                 elif polarity < -0.1:
                     sentiment = "부정"
 
-                # 3. Translation
-                try:
-                    title_kr = translator.translate(title_en)
-                    
-                    summary_kr = ""
-                    if summary_en:
-                        try:
-                            # Try translating full summary (up to 1000 chars)
-                            summary_kr = translator.translate(summary_en[:1000])
-                        except Exception:
-                            # Retry with shorter chunk if failed
-                            try:
-                                summary_kr = translator.translate(summary_en[:200])
-                            except Exception:
-                                summary_kr = summary_en # Fallback to English
-                except Exception as e:
-                    print(f"Translation failed for news: {e}")
-                    title_kr = title_en
-                    summary_kr = summary_en
+                # 3. Translation (queued in the background if not translated yet)
+                title_kr, title_pending = translator.translate_or_defer(title_en)
+                summary_kr, summary_pending = translator.translate_or_defer(summary_en[:1000])
 
                 processed_news.append({
                     "title": title_kr,
@@ -235,7 +797,8 @@ class MarketDataFetcher:
                     "link": item.get('link', ''),
                     "published": item.get('published', ''),
                     "sentiment": sentiment,
-                    "polarity": polarity
+                    "polarity": polarity,
+                    "translation_pending": title_pending or summary_pending
                 })
             
             return processed_news
@@ -249,55 +812,39 @@ class MarketDataFetcher:
         Fetches data for major indices and Gold.
         """
         def fetch_summary():
-            indices = {
-                "^GSPC": "S&P 500",
-                "^IXIC": "Nasdaq",
-                "^DJI": "Dow Jones",
-                "^KS11": "KOSPI",
-                "^KQ11": "KOSDAQ",
-                "GC=F": "Gold",
-                "CL=F": "WTI Crude Oil",
-                "KRW=X": "USD/KRW",
-                "BTC-USD": "Bitcoin",
-                "^TNX": "10Y Treasury Yield",
-                "^VIX": "VIX (Volatility)"
-            }
+            indices = MARKET_INDICES
             summary = {}
+            # The CNN request runs alongside the bulk quote download
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                fear_and_greed = pool.submit(self.get_fear_and_greed_index)
+                quotes = self.get_quotes(list(indices.keys()))
+                fear_and_greed_score = fear_and_greed.result()
+
+            if not quotes:
+                # Provider down: keep serving the cached summary instead of zeros
+                return {}
+            previous = self._last_good('market_summary')
             for ticker, name in indices.items():
-                try:
-                    stock = yf.Ticker(ticker)
-                    # Try fast_info first
-                    price = stock.fast_info.last_price
-                    prev_close = stock.fast_info.previous_close
-                    
-                    # Fallback if fast_info fails (common for indices)
-                    if price is None or prev_close is None:
-                        hist = stock.history(period="5d")
-                        if not hist.empty:
-                            price = hist['Close'].iloc[-1]
-                            prev_close = hist['Close'].iloc[-2] if len(hist) > 1 else price
-                    
-                    change = price - prev_close
-                    change_percent = (change / prev_close) * 100 if prev_close else 0
-                    
+                quote = quotes.get(ticker)
+                if quote:
                     summary[name] = {
-                        "price": price,
-                        "change": change,
-                        "change_percent": change_percent
+                        "price": quote['price'],
+                        "change": quote['change'],
+                        "change_percent": quote['change_percent']
                     }
-                except Exception as e:
-                    print(f"Error fetching {name}: {e}")
-                    summary[name] = {"price": 0.0, "change": 0.0, "change_percent": 0.0}
+                else:
+                    print(f"Error fetching {name}: no data")
+                    summary[name] = previous.get(name, {"price": 0.0, "change": 0.0, "change_percent": 0.0})
                 
             # Add Fear & Greed Index
             summary['Fear & Greed'] = {
-                "price": self.get_fear_and_greed_index(),
+                "price": fear_and_greed_score,
                 "change": 0,
                 "change_percent": 0
             }
             return summary
 
-        return self._get_cached_data('market_summary', fetch_summary)
+        return self._get_cached_data('market_summary', fetch_summary, ttl=summary_ttl(self.cache.ttl_for('market_summary')), max_stale=MAX_STALE_SECONDS)
 
     def get_fear_and_greed_index(self) -> float:
         """
@@ -308,7 +855,7 @@ class MarketDataFetcher:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
-            response = requests.get("https://production.dataviz.cnn.io/index/fearandgreed/graphdata", headers=headers, timeout=5)
+            response = self.cnn.call(requests.get, "https://production.dataviz.cnn.io/index/fearandgreed/graphdata", headers=headers, timeout=self.cnn.timeout)
             if response.status_code == 200:
                 data = response.json()
                 # The data structure usually contains 'fear_and_greed' object with 'score'
@@ -333,42 +880,47 @@ class MarketDataFetcher:
     def get_news(self, ticker: str) -> list:
         """
         Fetches news for a ticker via yfinance.
-        Returns a list of dicts with 'title', 'summary', 'link', 'published'.
+        Returns a list of dicts with 'title', 'summary', 'link', 'published', 'polarity'.
+        Sentiment polarity is computed once at ingest and cached with the articles.
         """
-        try:
-            stock = yf.Ticker(ticker)
-            raw_news = stock.news
-            formatted_news = []
-            for item in raw_news:
-                if not item:
-                    continue
+        def fetch_news():
+            try:
+                stock = yf.Ticker(ticker)
+                raw_news = self.yahoo.call(lambda: stock.news)
+                formatted_news = []
+                for item in raw_news:
+                    if not item:
+                        continue
+                        
+                    # Handle cases where content might be None or missing
+                    content = item.get('content')
+                    if content is None:
+                        content = item
                     
-                # Handle cases where content might be None or missing
-                content = item.get('content')
-                if content is None:
-                    content = item
-                
-                # Safe link extraction
-                link = ''
-                click_through = content.get('clickThroughUrl')
-                if click_through and isinstance(click_through, dict):
-                    link = click_through.get('url', '')
-                elif isinstance(click_through, str):
-                    link = click_through
-                elif 'link' in content:
-                    link = content['link']
-                
-                formatted_news.append({
-                    "title": content.get('title', 'No Title'),
-                    "summary": content.get('summary', ''),
-                    "link": link,
-                    "published": content.get('pubDate', '')
-                })
-            return formatted_news
-            return formatted_news
-        except Exception as e:
-            print(f"Error fetching news for {ticker}: {e}")
-            return []
+                    # Safe link extraction
+                    link = ''
+                    click_through = content.get('clickThroughUrl')
+                    if click_through and isinstance(click_through, dict):
+                        link = click_through.get('url', '')
+                    elif isinstance(click_through, str):
+                        link = click_through
+                    elif 'link' in content:
+                        link = content['link']
+                    
+                    article = {
+                        "title": content.get('title', 'No Title'),
+                        "summary": content.get('summary', ''),
+                        "link": link,
+                        "published": content.get('pubDate', '')
+                    }
+                    article['polarity'] = article_polarity(article)
+                    formatted_news.append(article)
+                return formatted_news
+            except Exception as e:
+                print(f"Error fetching news for {ticker}: {e}")
+                return []
+
+        return self._get_cached_data(f"news:{ticker}", fetch_news)
 
     def get_stock_events(self, ticker: str) -> list:
         """
@@ -380,7 +932,7 @@ class MarketDataFetcher:
             
             # 1. Earnings (Calendar)
             try:
-                calendar = stock.calendar
+                calendar = self.yahoo.call(lambda: stock.calendar)
                 if calendar is not None and not calendar.empty:
                     # yfinance calendar structure varies, usually has 'Earnings Date' or similar
                     # For simplicity, we'll try to extract dates.
@@ -391,26 +943,20 @@ class MarketDataFetcher:
 
             # 2. News as Events
             # We reuse get_news but format it for the timeline
-            # AND Translate it
+            # AND Translate it (in the background; English is served until it is ready)
             news_items = self.get_news(ticker)
-            translator = GoogleTranslator(source='auto', target='ko')
+            translator = self.translator
             
             for item in news_items:
-                title = item['title']
-                summary = item['summary']
-                
-                try:
-                    title = translator.translate(title)
-                    if summary:
-                        summary = translator.translate(summary[:200]) # Translate first 200 chars
-                except Exception:
-                    pass
+                title, title_pending = translator.translate_or_defer(item['title'])
+                summary, summary_pending = translator.translate_or_defer(item['summary'][:200]) # Translate first 200 chars
 
                 events.append({
                     "date": item['published'], # ISO string
                     "type": "news",
                     "title": title,
-                    "description": summary
+                    "description": summary,
+                    "translation_pending": title_pending or summary_pending
                 })
                 
             # Sort by date
@@ -433,25 +979,34 @@ class MarketDataFetcher:
                 "Crude Oil": "CL=F",
                 "USD/KRW": "KRW=X"
             }
+            quotes = self.get_quotes(list(indicators.values()))
+            previous = self._last_good('economic_data')
             data = {}
             for name, ticker in indicators.items():
-                data[name] = self.get_current_price(ticker)
+                quote = quotes.get(ticker)
+                data[name] = quote['price'] if quote else self.get_current_price(ticker)
+            if not any(data.values()):
+                # Provider down: keep serving the cached indicators instead of zeros
+                return {}
+            for name, price in data.items():
+                if not price:
+                    data[name] = previous.get(name, 0.0)
             return data
 
-        return self._get_cached_data('economic_data', fetch_economic)
+        return self._get_cached_data('economic_data', fetch_economic, ttl=summary_ttl(self.cache.ttl_for('economic_data')), max_stale=MAX_STALE_SECONDS)
 
     def get_market_news(self) -> list:
         """
         Fetches general market news (using S&P 500 as proxy).
+        Untranslated titles are returned in English with translation_pending set.
         """
         def fetch_news():
             try:
                 # Use S&P 500 ticker for general market news
                 stock = yf.Ticker("^GSPC")
-                raw_news = stock.news
+                raw_news = self.yahoo.call(lambda: stock.news)
                 
                 processed_news = []
-                translator = GoogleTranslator(source='auto', target='ko')
                 
                 for item in raw_news:
                     if not item:
@@ -476,17 +1031,8 @@ class MarketDataFetcher:
                     elif 'link' in content:
                         link = content['link']
 
-                    title_en = content.get('title', 'No Title')
-                    
-                    # Translate Title
-                    try:
-                        title_kr = translator.translate(title_en)
-                    except:
-                        title_kr = title_en
-
                     processed_news.append({
-                        "title": title_kr,
-                        "original_title": title_en,
+                        "original_title": content.get('title', 'No Title'),
                         "link": link,
                         "published": content.get('pubDate', ''),
                         "thumbnail": thumbnail,
@@ -498,7 +1044,13 @@ class MarketDataFetcher:
                 print(f"Error fetching market news: {e}")
                 return []
 
-        return self._get_cached_data('market_news', fetch_news)
+        # Titles are translated on read so entries cached before a translation finished pick it up
+        news = self._get_cached_data('market_news', fetch_news, max_stale=MAX_STALE_SECONDS)
+        localized = []
+        for item in news:
+            title, pending = self.translator.translate_or_defer(item['original_title'])
+            localized.append({**item, "title": title, "translation_pending": pending})
+        return localized
 
     def get_smart_calendar(self, watchlist_tickers: list) -> list:
         """
@@ -0,0 +1,81 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+# Maximum number of idle read connections kept per database
+READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "8"))
+# Prepared statements cached per connection
+STATEMENT_CACHE_SIZE = 256
+# Seconds a connection waits on a lock held by another process before failing
+BUSY_TIMEOUT = 30
+
+class ConnectionPool:
+    """
+    SQLite connections for one database file in WAL mode: a pool of read connections
+    and a single writer serialized by a lock. WAL lets readers run while a write is in
+    progress, and serializing writers in-process avoids "database is locked" errors.
+    Connections are long-lived, so their prepared-statement caches are reused.
+    """
+    def __init__(self, path: str, read_pool_size: int = READ_POOL_SIZE):
+        self.path = path
+        self._readers = queue.LifoQueue(maxsize=read_pool_size)
+        self._writer = None
+        self._write_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def read(self):
+        """
+        Borrows a read connection; it goes back to the pool afterwards.
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def write(self):
+        """
+        Holds the writer connection; commits on success and rolls back on error.
+        """
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            try:
+                yield self._writer
+                self._writer.commit()
+            except Exception:
+                self._writer.rollback()
+                raise
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(path: str) -> ConnectionPool:
+    """
+    Returns the process-wide pool for a database file.
+    """
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = ConnectionPool(path)
+            _pools[path] = pool
+        return pool
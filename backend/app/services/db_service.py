@@ -1,152 +1,313 @@
-import sqlite3
 import json
+import threading
 from datetime import datetime
 import os
+from app.services.db_pool import get_pool
+from app.services.migrations import run_migrations
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'market.db')
-from app.data.stocks import STOCK_DICT
+# Oldest (least recently used) translations are pruned beyond this many rows
+TRANSLATION_CACHE_MAX_ROWS = 50000
+# A cache hit only rewrites last_used once the stored value is older than this (seconds),
+# so hot translations don't queue a write behind the writer lock on every read
+TRANSLATION_TOUCH_INTERVAL = 24 * 3600
+from app.data.registry import ticker_registry
+
+# Display name of a ticker: Korean name from the stock universe, else the cached company name
+STOCK_NAME_SQL = "COALESCE(u.name_kr, json_extract(cc.details_json, '$.name'), {ticker})"
+
+# Migrations run once per process, not in every DBService()
+_schema_ready = False
+_schema_lock = threading.Lock()
+# stock_universe is checked against the registry source once per process, on first use
+_universe_ready = False
+_universe_lock = threading.Lock()
 
 class DBService:
     def __init__(self):
+        self.pool = get_pool(DB_PATH)
         self._init_db()
 
     def _init_db(self):
-        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS company_cache (
-                ticker TEXT PRIMARY KEY,
-                summary_kr TEXT,
-                details_json TEXT,
-                last_updated TIMESTAMP
-            )
-        ''')
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS watchlist (
-                ticker TEXT PRIMARY KEY,
-                added_at TIMESTAMP
-            )
-        ''')
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS portfolio (
-                ticker TEXT PRIMARY KEY,
-                shares INTEGER,
-                avg_price REAL,
-                purchase_date TEXT,
-                updated_at TIMESTAMP
-            )
-        ''')
-        
-        # Migration: Add purchase_date if not exists
-        try:
-            c.execute('ALTER TABLE portfolio ADD COLUMN purchase_date TEXT')
-        except sqlite3.OperationalError:
-            pass # Column likely exists
-            
-        conn.commit()
-        conn.commit()
-        conn.close()
+        global _schema_ready
+        with _schema_lock:
+            if _schema_ready:
+                return
+            os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+            with self.pool.write() as conn:
+                run_migrations(conn)
+            _schema_ready = True
+
+    def _ensure_stock_universe(self):
+        """
+        Mirrors the ticker registry into stock_universe so listings can join against it.
+        Runs on first use, and only rewrites the table (and loads the registry) when the
+        registry's source changed since the last sync.
+        """
+        global _universe_ready
+        if _universe_ready:
+            return
+        with _universe_lock:
+            if _universe_ready:
+                return
+            signature = ticker_registry.source_signature()
+            with self.pool.read() as conn:
+                row = conn.execute("SELECT signature FROM sync_state WHERE name = 'stock_universe'").fetchone()
+            if row is None or row[0] != signature:
+                rows = [(s.ticker, s.name_en, s.name_kr, s.sector) for s in ticker_registry.records()]
+                with self.pool.write() as conn:
+                    c = conn.cursor()
+                    c.execute('DELETE FROM stock_universe')
+                    c.executemany('''
+                        INSERT INTO stock_universe (ticker, name_en, name_kr, sector) VALUES (?, ?, ?, ?)
+                    ''', rows)
+                    c.execute('''
+                        INSERT OR REPLACE INTO sync_state (name, signature, synced_at) VALUES (?, ?, ?)
+                    ''', ('stock_universe', signature, datetime.now().isoformat()))
+            _universe_ready = True
 
     def get_company_cache(self, ticker: str):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('SELECT summary_kr, details_json, last_updated FROM company_cache WHERE ticker = ?', (ticker,))
-        row = c.fetchone()
-        conn.close()
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('''
+                SELECT summary_kr, details_json, last_updated, details_updated_at, summary_updated_at
+                FROM company_cache WHERE ticker = ?
+            ''', (ticker,))
+            row = c.fetchone()
         
         if row:
             return {
                 "summary_kr": row[0],
                 "details": json.loads(row[1]),
-                "last_updated": row[2]
+                "last_updated": row[2],
+                "details_updated_at": row[3] or row[2],
+                "summary_updated_at": row[4] or row[2]
             }
         return None
 
     def save_company_cache(self, ticker: str, summary_kr: str, details: dict):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('''
-            INSERT OR REPLACE INTO company_cache (ticker, summary_kr, details_json, last_updated)
-            VALUES (?, ?, ?, ?)
-        ''', (ticker, summary_kr, json.dumps(details), datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        now = datetime.now().isoformat()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO company_cache (ticker, summary_kr, details_json, last_updated, details_updated_at, summary_updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (ticker, summary_kr, json.dumps(details), now, now, now))
+
+    def update_company_details(self, ticker: str, details: dict):
+        """
+        Refreshes the details of a cached company while keeping its translated summary.
+        """
+        now = datetime.now().isoformat()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                UPDATE company_cache SET details_json = ?, last_updated = ?, details_updated_at = ?
+                WHERE ticker = ?
+            ''', (json.dumps(details), now, now, ticker))
+
+    def get_fundamentals(self, ticker: str):
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('SELECT info_json, fetched_at FROM fundamentals_cache WHERE ticker = ?', (ticker,))
+            row = c.fetchone()
+
+        if row:
+            return {
+                "info": json.loads(row[0]),
+                "fetched_at": row[1]
+            }
+        return None
+
+    def save_fundamentals(self, ticker: str, info: dict):
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO fundamentals_cache (ticker, info_json, fetched_at)
+                VALUES (?, ?, ?)
+            ''', (ticker, json.dumps(info, default=str), datetime.now().isoformat()))
+
+    def get_ohlcv_meta(self, ticker: str):
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('SELECT coverage_start, last_date, timezone, updated_at FROM ohlcv_meta WHERE ticker = ?', (ticker,))
+            row = c.fetchone()
+
+        if row:
+            return {
+                "coverage_start": row[0],
+                "last_date": row[1],
+                "timezone": row[2],
+                "updated_at": row[3]
+            }
+        return None
+
+    def get_ohlcv(self, ticker: str, start: str = None):
+        """
+        Returns stored daily bars as (date, open, high, low, close, volume) rows, oldest first.
+        """
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('''
+                SELECT date, open, high, low, close, volume FROM ohlcv
+                WHERE ticker = ? AND date >= ?
+                ORDER BY date
+            ''', (ticker, start or ''))
+            rows = c.fetchall()
+        return rows
+
+    def save_ohlcv(self, ticker: str, rows: list, coverage_start: str, timezone: str = None, replace: bool = False):
+        """
+        Upserts daily bars and widens the ticker's covered range.
+        With replace=True the ticker's existing bars are dropped first (e.g. after a split adjustment).
+        """
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            if replace:
+                c.execute('DELETE FROM ohlcv WHERE ticker = ?', (ticker,))
+                c.execute('DELETE FROM ohlcv_meta WHERE ticker = ?', (ticker,))
+            c.executemany('''
+                INSERT OR REPLACE INTO ohlcv (ticker, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [(ticker, *row) for row in rows])
+            c.execute('SELECT MAX(date) FROM ohlcv WHERE ticker = ?', (ticker,))
+            last_date = c.fetchone()[0]
+            c.execute('''
+                INSERT INTO ohlcv_meta (ticker, coverage_start, last_date, timezone, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    coverage_start = MIN(coverage_start, excluded.coverage_start),
+                    last_date = excluded.last_date,
+                    timezone = COALESCE(excluded.timezone, timezone),
+                    updated_at = excluded.updated_at
+            ''', (ticker, coverage_start, last_date, timezone, datetime.now().isoformat()))
+
+    def get_indicator_state(self, ticker: str):
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('SELECT state_json FROM indicator_state WHERE ticker = ?', (ticker,))
+            row = c.fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_indicator_state(self, ticker: str, state: dict):
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO indicator_state (ticker, state_json, last_date, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', (ticker, json.dumps(state), state.get('last_date'), datetime.now().isoformat()))
+
+    def get_translation(self, key: str):
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute('SELECT translated, last_used FROM translation_cache WHERE key = ?', (key,))
+            row = c.fetchone()
+        if row is None:
+            return None
+
+        now = datetime.now()
+        if not row[1] or (now - datetime.fromisoformat(row[1])).total_seconds() > TRANSLATION_TOUCH_INTERVAL:
+            with self.pool.write() as conn:
+                conn.execute('UPDATE translation_cache SET last_used = ? WHERE key = ?', (now.isoformat(), key))
+        return row[0]
+
+    def save_translation(self, key: str, target: str, translated: str):
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO translation_cache (key, target, translated, last_used)
+                VALUES (?, ?, ?, ?)
+            ''', (key, target, translated, datetime.now().isoformat()))
+
+    def prune_translations(self, max_rows: int = TRANSLATION_CACHE_MAX_ROWS):
+        """
+        Evicts the least recently used translations beyond max_rows.
+        """
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                DELETE FROM translation_cache WHERE key IN (
+                    SELECT key FROM translation_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            ''', (max_rows,))
 
     def add_to_watchlist(self, ticker: str):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('INSERT OR IGNORE INTO watchlist (ticker, added_at) VALUES (?, ?)', (ticker, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('INSERT OR IGNORE INTO watchlist (ticker, added_at) VALUES (?, ?)', (ticker, datetime.now().isoformat()))
 
     def remove_from_watchlist(self, ticker: str):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('DELETE FROM watchlist WHERE ticker = ?', (ticker,))
-        conn.commit()
-        conn.close()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('DELETE FROM watchlist WHERE ticker = ?', (ticker,))
 
     def get_stock_name(self, ticker: str) -> str:
-        # 1. Try STOCK_DICT
-        stock = next((s for s in STOCK_DICT if s['ticker'] == ticker), None)
+        # Ticker registry first, then the company cache
+        stock = ticker_registry.get(ticker)
         if stock:
-            return stock['name_kr']
-            
-        # 2. Try Cache
-        cached = self.get_company_cache(ticker)
-        if cached and 'details' in cached:
-            return cached['details'].get('name', ticker)
-            
-        return ticker
+            return stock.name_kr
+
+        self._ensure_stock_universe()
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute(f'''
+                SELECT {STOCK_NAME_SQL.format(ticker='t.ticker')}
+                FROM (SELECT ? AS ticker) t
+                LEFT JOIN stock_universe u ON u.ticker = t.ticker
+                LEFT JOIN company_cache cc ON cc.ticker = t.ticker
+            ''', (ticker,))
+            row = c.fetchone()
+        return row[0]
 
     def get_watchlist(self):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('SELECT ticker FROM watchlist ORDER BY added_at DESC')
-        rows = c.fetchall()
-        conn.close()
-        
-        result = []
-        for row in rows:
-            ticker = row[0]
-            name = self.get_stock_name(ticker)
-            result.append({"ticker": ticker, "name": name})
-        return result
+        # Names are joined in, so the whole listing is one query
+        self._ensure_stock_universe()
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute(f'''
+                SELECT w.ticker, {STOCK_NAME_SQL.format(ticker='w.ticker')}
+                FROM watchlist w
+                LEFT JOIN stock_universe u ON u.ticker = w.ticker
+                LEFT JOIN company_cache cc ON cc.ticker = w.ticker
+                ORDER BY w.added_at DESC
+            ''')
+            rows = c.fetchall()
+
+        return [{"ticker": row[0], "name": row[1]} for row in rows]
 
     def get_holdings(self):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('SELECT ticker, shares, avg_price, purchase_date FROM portfolio ORDER BY updated_at DESC')
-        rows = c.fetchall()
-        conn.close()
-        
+        self._ensure_stock_universe()
+        with self.pool.read() as conn:
+            c = conn.cursor()
+            c.execute(f'''
+                SELECT p.ticker, {STOCK_NAME_SQL.format(ticker='p.ticker')}, p.shares, p.avg_price, p.purchase_date
+                FROM portfolio p
+                LEFT JOIN stock_universe u ON u.ticker = p.ticker
+                LEFT JOIN company_cache cc ON cc.ticker = p.ticker
+                ORDER BY p.updated_at DESC
+            ''')
+            rows = c.fetchall()
+
         result = []
         for row in rows:
-            ticker = row[0]
-            name = self.get_stock_name(ticker)
             result.append({
-                "ticker": ticker, 
-                "name": name,
-                "shares": row[1], 
-                "avg_price": row[2], 
-                "purchase_date": row[3]
+                "ticker": row[0],
+                "name": row[1],
+                "shares": row[2],
+                "avg_price": row[3],
+                "purchase_date": row[4]
             })
         return result
 
     def add_holding(self, ticker: str, shares: int, avg_price: float, purchase_date: str = None):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('''
-            INSERT OR REPLACE INTO portfolio (ticker, shares, avg_price, purchase_date, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (ticker, shares, avg_price, purchase_date, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO portfolio (ticker, shares, avg_price, purchase_date, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (ticker, shares, avg_price, purchase_date, datetime.now().isoformat()))
 
     def remove_holding(self, ticker: str):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('DELETE FROM portfolio WHERE ticker = ?', (ticker,))
-        conn.commit()
-        conn.close()
+        with self.pool.write() as conn:
+            c = conn.cursor()
+            c.execute('DELETE FROM portfolio WHERE ticker = ?', (ticker,))
@@ -1,7 +1,7 @@
 import random
 from typing import List, Dict, Any
 from app.services.data_fetcher import MarketDataFetcher
-from app.data.stocks import STOCK_DICT
+from app.data.registry import ticker_registry
 
 class AIFundManager:
     def __init__(self):
@@ -42,8 +42,13 @@ class AIFundManager:
         results = []
 
         # 2. Select Stocks & Calculate Return for each Persona
+        picks_by_persona = {persona['id']: self._select_stocks(persona['id']) for persona in personas}
+        histories = self.fetcher.get_histories(
+            [stock['ticker'] for picks in picks_by_persona.values() for stock in picks], period="1mo"
+        )
+
         for persona in personas:
-            picks = self._select_stocks(persona['id'])
+            picks = picks_by_persona[persona['id']]
             
             total_return = 0
             portfolio_items = []
@@ -51,11 +56,11 @@ class AIFundManager:
             for stock in picks:
                 ticker = stock['ticker']
                 try:
-                    # Fetch 1mo history to calculate return
-                    hist = self.fetcher.get_ticker_data(ticker, period="1mo")
-                    if not hist.empty:
-                        start_price = hist['Close'].iloc[0]
-                        end_price = hist['Close'].iloc[-1]
+                    # 1mo history to calculate return
+                    hist = histories.get(ticker)
+                    if hist is not None and not hist.empty:
+                        start_price = hist['Close'].dropna().iloc[0]
+                        end_price = hist['Close'].dropna().iloc[-1]
                         ret = ((end_price - start_price) / start_price) * 100
                         
                         total_return += ret
@@ -96,20 +101,20 @@ class AIFundManager:
         if persona_id == "warren":
             # Value: Finance, Consumer, Healthcare (Stable)
             # Mock logic: Pick from specific sectors
-            candidates = [s for s in STOCK_DICT if s.get('sector') in ['Financial Services', 'Consumer Defensive', 'Healthcare', 'Energy']]
+            candidates = ticker_registry.in_sectors(['Financial Services', 'Consumer Defensive', 'Healthcare', 'Energy'])
             
         elif persona_id == "elon":
             # Growth: Technology, Communication (High Risk)
-            candidates = [s for s in STOCK_DICT if s.get('sector') in ['Technology', 'Communication Services', 'Consumer Cyclical']]
+            candidates = ticker_registry.in_sectors(['Technology', 'Communication Services', 'Consumer Cyclical'])
             
         elif persona_id == "quant":
             # Momentum: Random selection but we simulate "Trend"
             # In reality, we would calculate RSI/MACD here.
             # For demo speed, we just pick random stocks and let the return calculation decide the winner.
-            candidates = STOCK_DICT
+            candidates = ticker_registry.records()
 
         # Shuffle and pick 3
         if not candidates:
-            candidates = STOCK_DICT
+            candidates = ticker_registry.records()
             
         return random.sample(candidates, k=min(len(candidates), 3))
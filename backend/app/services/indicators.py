@@ -0,0 +1,305 @@
+import math
+from collections import deque
+from typing import Dict, Any, Optional
+import pandas as pd
+
+# Bump when the serialized state layout changes; older states are reseeded
+STATE_VERSION = 1
+
+class SMAState:
+    """
+    Simple moving average over a ring buffer. update() appends a bar, revise() replaces
+    the latest one (e.g. an intraday tick); both are O(1). Revising before any update
+    appends instead.
+    """
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self._updates = 0
+
+    def update(self, x: float):
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+        self._updates += 1
+        if self._updates % self.window == 0:
+            self.total = math.fsum(self.values) # Shed accumulated rounding error
+        return self.value
+
+    def revise(self, x: float):
+        if not self.values:
+            return self.update(x) # Nothing to revise yet
+        self.total += x - self.values[-1]
+        self.values[-1] = x
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self.values) < self.window:
+            return None
+        return self.total / self.window
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"window": self.window, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SMAState':
+        state = cls(data['window'])
+        for x in data['values']:
+            state.values.append(x)
+        state.total = math.fsum(state.values)
+        return state
+
+class EMAState:
+    """
+    Exponential moving average, matching pandas ewm(span, adjust=False): starts at the
+    first value.
+    """
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.value = None
+        self.previous = None # Value before the latest bar, for revise()
+
+    def update(self, x: float) -> float:
+        self.previous = self.value
+        self.value = x if self.previous is None else self.previous + self.alpha * (x - self.previous)
+        return self.value
+
+    def revise(self, x: float) -> float:
+        self.value = x if self.previous is None else self.previous + self.alpha * (x - self.previous)
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"span": self.span, "value": self.value, "previous": self.previous}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EMAState':
+        state = cls(data['span'])
+        state.value = data['value']
+        state.previous = data['previous']
+        return state
+
+class RSIState:
+    """
+    RSI over `period` bars. By default the average gain/loss is a simple rolling mean,
+    the same as TechnicalAnalyzer.analyze (including its first bar counting as no change).
+    With wilder=True it uses Wilder's smoothing, seeded with the simple mean of the first
+    `period` moves. Revising before any update appends instead.
+    """
+    def __init__(self, period: int = 14, wilder: bool = False):
+        self.period = period
+        self.wilder = wilder
+        self.gains = SMAState(period)
+        self.losses = SMAState(period)
+        self.avg_gain = None # Wilder averages
+        self.avg_loss = None
+        self.last_close = None
+        self.previous = None # (last_close, avg_gain, avg_loss) before the latest bar
+
+    def _move(self, prev_close: Optional[float], x: float):
+        delta = 0.0 if prev_close is None else x - prev_close
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    def _smooth(self, avg: Optional[float], sma: Optional[float], move: float) -> Optional[float]:
+        if avg is None:
+            return sma # Seed with the simple mean once the first window is full
+        return (avg * (self.period - 1) + move) / self.period
+
+    def update(self, x: float) -> Optional[float]:
+        self.previous = (self.last_close, self.avg_gain, self.avg_loss)
+        gain, loss = self._move(self.last_close, x)
+        self.gains.update(gain)
+        self.losses.update(loss)
+        if self.wilder:
+            self.avg_gain = self._smooth(self.avg_gain, self.gains.value, gain)
+            self.avg_loss = self._smooth(self.avg_loss, self.losses.value, loss)
+        self.last_close = x
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if self.previous is None:
+            return self.update(x) # Nothing to revise yet
+        prev_close, prev_gain, prev_loss = self.previous
+        gain, loss = self._move(prev_close, x)
+        self.gains.revise(gain)
+        self.losses.revise(loss)
+        if self.wilder:
+            self.avg_gain = self._smooth(prev_gain, self.gains.value, gain)
+            self.avg_loss = self._smooth(prev_loss, self.losses.value, loss)
+        self.last_close = x
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        gain, loss = (self.avg_gain, self.avg_loss) if self.wilder else (self.gains.value, self.losses.value)
+        if gain is None or loss is None:
+            return None
+        if loss == 0:
+            return 100.0 if gain > 0 else None
+        return 100 - (100 / (1 + gain / loss))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "period": self.period,
+            "wilder": self.wilder,
+            "gains": self.gains.to_dict(),
+            "losses": self.losses.to_dict(),
+            "avg_gain": self.avg_gain,
+            "avg_loss": self.avg_loss,
+            "last_close": self.last_close,
+            "previous": self.previous
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RSIState':
+        state = cls(data['period'], data['wilder'])
+        state.gains = SMAState.from_dict(data['gains'])
+        state.losses = SMAState.from_dict(data['losses'])
+        state.avg_gain = data['avg_gain']
+        state.avg_loss = data['avg_loss']
+        state.last_close = data['last_close']
+        state.previous = tuple(data['previous']) if data['previous'] is not None else None
+        return state
+
+class MACDState:
+    """
+    MACD (fast EMA - slow EMA) and its signal EMA.
+    """
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMAState(fast)
+        self.slow = EMAState(slow)
+        self.signal = EMAState(signal)
+
+    def update(self, x: float):
+        macd = self.fast.update(x) - self.slow.update(x)
+        return macd, self.signal.update(macd)
+
+    def revise(self, x: float):
+        macd = self.fast.revise(x) - self.slow.revise(x)
+        return macd, self.signal.revise(macd)
+
+    @property
+    def value(self):
+        if self.fast.value is None:
+            return None, None
+        return self.fast.value - self.slow.value, self.signal.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"fast": self.fast.to_dict(), "slow": self.slow.to_dict(), "signal": self.signal.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MACDState':
+        state = cls()
+        state.fast = EMAState.from_dict(data['fast'])
+        state.slow = EMAState.from_dict(data['slow'])
+        state.signal = EMAState.from_dict(data['signal'])
+        return state
+
+class IndicatorEngine:
+    """
+    Streaming version of TechnicalAnalyzer.analyze for one ticker. Seed it once from
+    history; after that each new daily bar (update) or intraday tick on the latest bar
+    (revise) costs O(1), and the state round-trips through to_dict/from_dict.
+    """
+    def __init__(self, wilder: bool = False):
+        self.rsi = RSIState(14, wilder=wilder)
+        self.macd = MACDState(12, 26, 9)
+        self.sma_50 = SMAState(50)
+        self.sma_200 = SMAState(200)
+        self.last_date = None
+        self.last_close = None
+        self.prev_date = None # Bar before the latest one, to detect re-adjusted history
+        self.prev_close = None
+        self.bars = 0
+
+    def seed(self, closes: pd.Series) -> 'IndicatorEngine':
+        """
+        Feeds a close series (oldest first) bar by bar.
+        """
+        for date, close in closes.dropna().items():
+            self.update(date, float(close))
+        return self
+
+    def update(self, date, close: float):
+        """
+        Applies a bar. A bar for the latest date revises it instead of appending.
+        """
+        date = pd.Timestamp(date).strftime('%Y-%m-%d')
+        if self.last_date is not None and date < self.last_date:
+            return # Older than the state; ignore
+        if date == self.last_date:
+            self.rsi.revise(close)
+            self.macd.revise(close)
+            self.sma_50.revise(close)
+            self.sma_200.revise(close)
+        else:
+            self.prev_date, self.prev_close = self.last_date, self.last_close
+            self.rsi.update(close)
+            self.macd.update(close)
+            self.sma_50.update(close)
+            self.sma_200.update(close)
+            self.bars += 1
+        self.last_date = date
+        self.last_close = close
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Latest values in the shape TechnicalAnalyzer.analyze returns (None where not enough bars yet).
+        """
+        macd, signal = self.macd.value
+        sma_50, sma_200 = self.sma_50.value, self.sma_200.value
+        price = self.last_close
+
+        trend = "중립 (Neutral)"
+        if price is not None and sma_50 is not None and sma_200 is not None:
+            if price > sma_50 and sma_50 > sma_200:
+                trend = "상승세 (Bullish)"
+            elif price < sma_50 and sma_50 < sma_200:
+                trend = "하락세 (Bearish)"
+
+        return {
+            "rsi": self.rsi.value,
+            "macd": macd,
+            "macd_signal": signal,
+            "trend": trend,
+            "sma_50": sma_50,
+            "sma_200": sma_200,
+            "as_of": self.last_date,
+            "price": price
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "rsi": self.rsi.to_dict(),
+            "macd": self.macd.to_dict(),
+            "sma_50": self.sma_50.to_dict(),
+            "sma_200": self.sma_200.to_dict(),
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "prev_date": self.prev_date,
+            "prev_close": self.prev_close,
+            "bars": self.bars
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional['IndicatorEngine']:
+        """
+        Restores an engine; returns None for states written by an older layout.
+        """
+        if data.get('version') != STATE_VERSION:
+            return None
+        engine = cls()
+        engine.rsi = RSIState.from_dict(data['rsi'])
+        engine.macd = MACDState.from_dict(data['macd'])
+        engine.sma_50 = SMAState.from_dict(data['sma_50'])
+        engine.sma_200 = SMAState.from_dict(data['sma_200'])
+        engine.last_date = data['last_date']
+        engine.last_close = data['last_close']
+        engine.prev_date = data['prev_date']
+        engine.prev_close = data['prev_close']
+        engine.bars = data['bars']
+        return engine
@@ -0,0 +1,228 @@
+import threading
+from datetime import datetime, date, time as dtime, timedelta
+from typing import Dict, Optional, Set
+from zoneinfo import ZoneInfo
+
+# Regular trading sessions in exchange local time
+EXCHANGES = {
+    "KRX": {"tz": ZoneInfo("Asia/Seoul"), "open": dtime(9, 0), "close": dtime(15, 30)},
+    "NYSE": {"tz": ZoneInfo("America/New_York"), "open": dtime(9, 30), "close": dtime(16, 0)},
+}
+
+# Full-day closures as published by the exchanges. Years missing here fall back to
+# rule-based holidays (see _rule_holidays), which miss lunar-calendar and one-off closures.
+HOLIDAYS = {
+    "KRX": {
+        "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-03-03",
+        "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03", "2025-06-06", "2025-08-15",
+        "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-12-25",
+        "2025-12-31",
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-01",
+        "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25",
+        "2026-10-05", "2026-10-09", "2026-12-25", "2026-12-31",
+    },
+    "NYSE": {
+        "2025-01-01", "2025-01-09", "2025-01-20", "2025-02-17", "2025-04-18", "2025-05-26",
+        "2025-06-19", "2025-07-04", "2025-09-01", "2025-11-27", "2025-12-25",
+        "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25", "2026-06-19",
+        "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+    },
+}
+
+# Half days: date -> local close time
+EARLY_CLOSES = {
+    "KRX": {},
+    "NYSE": {
+        "2025-07-03": dtime(13, 0), "2025-11-28": dtime(13, 0), "2025-12-24": dtime(13, 0),
+        "2026-11-27": dtime(13, 0), "2026-12-24": dtime(13, 0),
+    },
+}
+
+# Quotes keep settling for a while after the bell (closing auction, late prints)
+POST_CLOSE_GRACE = timedelta(minutes=30)
+# Longest TTL given to a closed-market entry, so corrections still get picked up
+MAX_CLOSED_TTL = 12 * 3600
+# The market summary mixes in FX and crypto, which trade around the clock
+MAX_CLOSED_SUMMARY_TTL = 3600
+
+def exchange_for(ticker: str) -> Optional[str]:
+    """
+    Returns the exchange whose session governs ticker, or None if it trades around the clock
+    (FX, crypto, futures) or on an exchange without a calendar here.
+    """
+    ticker = ticker.upper()
+    if ticker.endswith(('.KS', '.KQ')) or ticker in ('^KS11', '^KQ11'):
+        return "KRX"
+    if ticker.endswith(('=X', '=F', '-USD')):
+        return None
+    if '.' in ticker:
+        return None
+    # US listings and US indices (^GSPC, ^IXIC, ^DJI, ^VIX, ^TNX)
+    return "NYSE"
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """
+    The n-th given weekday (Mon=0) of a month; n=-1 for the last one.
+    """
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def _easter(year: int) -> date:
+    # Anonymous Gregorian algorithm
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+def _nyse_rules(year: int):
+    """
+    NYSE holidays and early closes from the exchange's standing rules: Saturday holidays
+    are observed on Friday, Sunday ones on Monday (New Year's Day on a Saturday is not made up).
+    """
+    def observed(day: date) -> Optional[date]:
+        if day.weekday() == 5:
+            return None if (day.month, day.day) == (1, 1) else day - timedelta(days=1)
+        return day + timedelta(days=1) if day.weekday() == 6 else day
+
+    holidays = {
+        observed(date(year, 1, 1)),
+        _nth_weekday(year, 1, 0, 3),   # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+        _easter(year) - timedelta(days=2), # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        observed(date(year, 6, 19)),
+        observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),   # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        observed(date(year, 12, 25)),
+    } - {None}
+
+    early = {}
+    for day in (date(year, 7, 3), _nth_weekday(year, 11, 3, 4) + timedelta(days=1), date(year, 12, 24)):
+        if day.weekday() < 5 and day not in holidays:
+            early[day.isoformat()] = dtime(13, 0)
+    return {day.isoformat() for day in holidays}, early
+
+def _krx_rules(year: int):
+    """
+    KRX solar-calendar holidays with substitute days, plus the year-end closure. Lunar
+    holidays (Seollal, Buddha's Birthday, Chuseok) and election days cannot be derived.
+    """
+    holidays = {date(year, 1, 1), date(year, 5, 1), date(year, 6, 6)}
+    # Weekend holidays eligible for a substitute move to the next free weekday
+    for month, day in ((3, 1), (5, 5), (8, 15), (10, 3), (10, 9), (12, 25)):
+        holiday = date(year, month, day)
+        while holiday.weekday() >= 5 or holiday in holidays:
+            holiday += timedelta(days=1)
+        holidays.add(holiday)
+    holidays = {day for day in holidays if day.weekday() < 5}
+
+    year_end = date(year, 12, 31)
+    while year_end.weekday() >= 5 or year_end in holidays:
+        year_end -= timedelta(days=1)
+    holidays.add(year_end)
+    return {day.isoformat() for day in holidays}, {}
+
+RULES = {"NYSE": _nyse_rules, "KRX": _krx_rules}
+# What the rule-based fallback cannot know, for the warning
+RULE_GAPS = {
+    "NYSE": "one-off closures (e.g. national days of mourning)",
+    "KRX": "lunar holidays (Seollal, Buddha's Birthday, Chuseok), election days and one-off closures",
+}
+
+_calendars: Dict[tuple, tuple] = {} # (exchange, year) -> (holidays, early closes)
+_calendars_lock = threading.Lock()
+
+def _calendar(exchange: str, year: int):
+    """
+    (holidays, early closes) for one exchange-year: the published tables when they list the
+    year, else the rule-based fallback, with a warning printed once per exchange-year.
+    """
+    key = (exchange, year)
+    calendar = _calendars.get(key)
+    if calendar is not None:
+        return calendar
+    with _calendars_lock:
+        if key not in _calendars:
+            prefix = f"{year}-"
+            holidays = {day for day in HOLIDAYS[exchange] if day.startswith(prefix)}
+            if holidays:
+                early = {day: close for day, close in EARLY_CLOSES[exchange].items() if day.startswith(prefix)}
+            else:
+                holidays, early = RULES[exchange](year)
+                print(f"WARNING: market_calendar has no {exchange} holiday table for {year}; using "
+                      f"rule-based holidays, which miss {RULE_GAPS[exchange]}. Add {year} to HOLIDAYS.")
+            _calendars[key] = (holidays, early)
+        return _calendars[key]
+
+def _holidays(exchange: str, year: int) -> Set[str]:
+    return _calendar(exchange, year)[0]
+
+def _is_trading_day(exchange: str, day: date) -> bool:
+    return day.weekday() < 5 and day.isoformat() not in _holidays(exchange, day.year)
+
+def _session(exchange: str, day: date):
+    """
+    Returns (open, close + grace) as aware datetimes for a trading day.
+    """
+    spec = EXCHANGES[exchange]
+    close = _calendar(exchange, day.year)[1].get(day.isoformat(), spec['close'])
+    opens = datetime.combine(day, spec['open'], tzinfo=spec['tz'])
+    closes = datetime.combine(day, close, tzinfo=spec['tz']) + POST_CLOSE_GRACE
+    return opens, closes
+
+def _now(now: Optional[float]) -> datetime:
+    return datetime.fromtimestamp(now, ZoneInfo("UTC")) if now is not None else datetime.now(ZoneInfo("UTC"))
+
+def is_open(exchange: str, now: Optional[float] = None) -> bool:
+    """
+    True during the regular session (plus the post-close grace period).
+    """
+    current = _now(now).astimezone(EXCHANGES[exchange]['tz'])
+    if not _is_trading_day(exchange, current.date()):
+        return False
+    opens, closes = _session(exchange, current.date())
+    return opens <= current < closes
+
+def seconds_until_open(exchange: str, now: Optional[float] = None) -> float:
+    """
+    Seconds until the next session opens (0 while the market is open).
+    """
+    if is_open(exchange, now):
+        return 0
+    current = _now(now).astimezone(EXCHANGES[exchange]['tz'])
+    day = current.date()
+    for _ in range(15):
+        if _is_trading_day(exchange, day):
+            opens, _ = _session(exchange, day)
+            if opens > current:
+                return (opens - current).total_seconds()
+        day += timedelta(days=1)
+    return MAX_CLOSED_TTL
+
+def market_ttl(ticker: str, base_ttl: int, now: Optional[float] = None) -> int:
+    """
+    TTL for data about ticker stored at `now`: base_ttl during the session,
+    until the next open (capped at MAX_CLOSED_TTL) while the market is closed.
+    """
+    exchange = exchange_for(ticker)
+    if exchange is None:
+        return base_ttl
+    closed_for = seconds_until_open(exchange, now)
+    return int(max(base_ttl, min(closed_for, MAX_CLOSED_TTL)))
+
+def summary_ttl(base_ttl: int, now: Optional[float] = None) -> int:
+    """
+    TTL for cross-market snapshots (market summary, economic data): extended only
+    while both KRX and NYSE are closed, and by at most MAX_CLOSED_SUMMARY_TTL.
+    """
+    closed_for = min(seconds_until_open(exchange, now) for exchange in EXCHANGES)
+    return int(max(base_ttl, min(closed_for, MAX_CLOSED_SUMMARY_TTL)))
@@ -0,0 +1,173 @@
+import sqlite3
+from datetime import datetime
+
+def _columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str, decl: str):
+    if column not in _columns(conn, table):
+        conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {decl}')
+
+def _initial_schema(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS company_cache (
+            ticker TEXT PRIMARY KEY,
+            summary_kr TEXT,
+            details_json TEXT,
+            last_updated TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS watchlist (
+            ticker TEXT PRIMARY KEY,
+            added_at TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS portfolio (
+            ticker TEXT PRIMARY KEY,
+            shares INTEGER,
+            avg_price REAL,
+            updated_at TIMESTAMP
+        )
+    ''')
+
+def _portfolio_purchase_date(conn: sqlite3.Connection):
+    _add_column(conn, 'portfolio', 'purchase_date', 'TEXT')
+
+def _market_data_tables(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ohlcv (
+            ticker TEXT,
+            date TEXT,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume REAL,
+            PRIMARY KEY (ticker, date)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ohlcv_meta (
+            ticker TEXT PRIMARY KEY,
+            coverage_start TEXT,
+            last_date TEXT,
+            timezone TEXT,
+            updated_at TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS translation_cache (
+            key TEXT PRIMARY KEY,
+            target TEXT,
+            translated TEXT,
+            last_used TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS fundamentals_cache (
+            ticker TEXT PRIMARY KEY,
+            info_json TEXT,
+            fetched_at TIMESTAMP
+        )
+    ''')
+
+def _company_cache_freshness(conn: sqlite3.Connection):
+    # Per-field-group freshness timestamps, backfilled from last_updated
+    _add_column(conn, 'company_cache', 'details_updated_at', 'TIMESTAMP')
+    _add_column(conn, 'company_cache', 'summary_updated_at', 'TIMESTAMP')
+    conn.execute('''
+        UPDATE company_cache SET
+            details_updated_at = COALESCE(details_updated_at, last_updated),
+            summary_updated_at = COALESCE(summary_updated_at, last_updated)
+    ''')
+
+def _stock_universe(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS stock_universe (
+            ticker TEXT PRIMARY KEY,
+            name_en TEXT,
+            name_kr TEXT,
+            sector TEXT
+        )
+    ''')
+
+def _listing_indexes(conn: sqlite3.Connection):
+    # ORDER BY columns of the watchlist / holdings listings and translation pruning
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_watchlist_added_at ON watchlist (added_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_portfolio_updated_at ON portfolio (updated_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_translation_cache_last_used ON translation_cache (last_used)')
+
+def _indicator_state(conn: sqlite3.Connection):
+    # Streaming indicator state per ticker, kept next to its ohlcv bars
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS indicator_state (
+            ticker TEXT PRIMARY KEY,
+            state_json TEXT,
+            last_date TEXT,
+            updated_at TIMESTAMP
+        )
+    ''')
+
+def _sync_state(conn: sqlite3.Connection):
+    # Signature of the source each derived table was last synced from
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sync_state (
+            name TEXT PRIMARY KEY,
+            signature TEXT,
+            synced_at TIMESTAMP
+        )
+    ''')
+
+# Ordered (version, description, apply). Never edit or renumber an applied migration;
+# append a new one. Each must also be safe on databases created before versioning,
+# which already have some of these tables and columns.
+MIGRATIONS = [
+    (1, "initial schema", _initial_schema),
+    (2, "portfolio.purchase_date", _portfolio_purchase_date),
+    (3, "ohlcv, translation and fundamentals tables", _market_data_tables),
+    (4, "company_cache freshness timestamps", _company_cache_freshness),
+    (5, "stock_universe table", _stock_universe),
+    (6, "listing and pruning indexes", _listing_indexes),
+    (7, "indicator_state table", _indicator_state),
+    (8, "sync_state table", _sync_state),
+]
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+    return row[0] or 0
+
+def run_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Applies pending migrations in order, one transaction each, and returns the schema version.
+    Safe to run from several processes: each migration re-checks the version under the write lock.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TIMESTAMP
+        )
+    ''')
+    if conn.in_transaction:
+        conn.commit()
+
+    for version, description, apply in MIGRATIONS:
+        if version <= schema_version(conn):
+            continue
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have applied it while we waited for the lock
+            applied = version > schema_version(conn)
+            if applied:
+                apply(conn)
+                conn.execute('INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                             (version, description, datetime.now().isoformat()))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        if applied:
+            print(f"Applied migration {version}: {description}")
+    return schema_version(conn)
@@ -0,0 +1,268 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Dict, Any, List
+
+class ProviderUnavailable(Exception):
+    """
+    Raised when a provider call is rejected (circuit open, rate limited) or times out.
+    """
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` tokens per second, bursts of up to `capacity`.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: float = 0) -> bool:
+        """
+        Takes one token, waiting up to timeout seconds for one to become available.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `reset_timeout` seconds, then lets a single trial call through (half-open).
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_running = False
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+# Failure kinds for negative caching, and how long each is remembered before retrying
+NOT_FOUND = "not_found"
+TRANSIENT = "transient"
+RATE_LIMITED = "rate_limited"
+FAILURE_TTLS = {
+    NOT_FOUND: 3600,
+    TRANSIENT: 30,
+    RATE_LIMITED: 120
+}
+
+class FetchFailure:
+    """
+    Negative cache entry for a failed upstream lookup.
+    """
+    __slots__ = ('kind', 'message')
+
+    def __init__(self, kind: str, message: str = ''):
+        self.kind = kind
+        self.message = message
+
+    @property
+    def ttl(self) -> int:
+        return FAILURE_TTLS[self.kind]
+
+    def __repr__(self) -> str:
+        return f"FetchFailure({self.kind!r}, {self.message!r})"
+
+def classify_failure(error=None) -> str:
+    """
+    Maps an upstream error (or None for an empty result) to a failure kind. NOT_FOUND is
+    reserved for explicit "delisted / not found" errors; an empty result may just be a
+    bad response, so it is TRANSIENT.
+    """
+    if error is None:
+        return TRANSIENT
+    name = type(error).__name__.lower()
+    text = str(error).lower()
+    if 'ratelimit' in name or 'rate limit' in text or 'too many requests' in text or '429' in text:
+        return RATE_LIMITED
+    if isinstance(error, ProviderUnavailable):
+        return TRANSIENT
+    if 'delisted' in text or 'not found' in text or 'no data found' in text or '404' in text or 'no timezone found' in text:
+        return NOT_FOUND
+    return TRANSIENT
+
+_SERVER_ERROR = re.compile(r'\b5\d\d\b.*error|server error|bad gateway|service unavailable|gateway time')
+
+def is_provider_failure(error) -> bool:
+    """
+    Whether an error means the provider itself is unhealthy (timeout, connection error,
+    5xx, rate limiting) rather than that the request was bad (unknown or delisted symbol,
+    no data). Only the former count towards opening a circuit breaker.
+    """
+    kind = classify_failure(error)
+    if kind == RATE_LIMITED:
+        return True
+    if kind == NOT_FOUND:
+        return False
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status, int):
+        return status >= 500 or status == 429
+    if isinstance(error, (ConnectionError, TimeoutError, ProviderUnavailable)):
+        return True
+    # requests / curl_cffi ConnectionError, Timeout, ReadTimeout, ...
+    name = type(error).__name__.lower()
+    return 'timeout' in name or 'connection' in name or _SERVER_ERROR.search(str(error).lower()) is not None
+
+class ProviderGuard:
+    """
+    Wraps calls to one upstream provider with a timeout, a token-bucket rate limiter
+    and a circuit breaker. Rejected or timed-out calls raise ProviderUnavailable so
+    callers can fall back to cached or default values right away.
+    Calls run on the guard's own pool of max_workers threads, so a hung provider only
+    costs its own workers; once they are all busy further calls are rejected instead
+    of queueing behind them.
+    """
+    def __init__(self, name: str, timeout: float, rate: float, burst: int,
+                 failure_threshold: int = 5, reset_timeout: float = 30, max_wait: float = 2.0,
+                 max_workers: int = 8):
+        self.name = name
+        self.timeout = timeout
+        self.max_wait = max_wait
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"provider-{name}")
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+        self.calls = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def call(self, func, *args, **kwargs):
+        if self.breaker.state == CircuitBreaker.OPEN:
+            self.rejected += 1
+            raise ProviderUnavailable(f"{self.name} circuit is open")
+        if not self.bucket.acquire(self.max_wait):
+            self.rejected += 1
+            raise ProviderUnavailable(f"{self.name} rate limit exceeded")
+        if not self._workers.acquire(blocking=False):
+            # Every worker is stuck on an earlier call; don't queue behind them
+            self.rejected += 1
+            raise ProviderUnavailable(f"{self.name} has no free workers")
+        if not self.breaker.allow():
+            # Half-open and another trial call is already in flight
+            self._workers.release()
+            self.rejected += 1
+            raise ProviderUnavailable(f"{self.name} circuit is open")
+
+        self.calls += 1
+        with self._busy_lock:
+            self._busy += 1
+        future = self._executor.submit(func, *args, **kwargs)
+        future.add_done_callback(self._release_worker)
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            self.timeouts += 1
+            self.breaker.record_failure()
+            raise ProviderUnavailable(f"{self.name} timed out after {self.timeout}s")
+        except Exception as e:
+            self.errors += 1
+            if is_provider_failure(e):
+                self.breaker.record_failure()
+            else:
+                # The provider answered; the request itself was bad
+                self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _release_worker(self, future):
+        with self._busy_lock:
+            self._busy -= 1
+        self._workers.release()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "tokens_available": round(self.bucket.tokens, 2),
+            "busy_workers": self._busy,
+            "max_workers": self.max_workers,
+            "timeout": self.timeout,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors
+        }
+
+PROVIDERS = {
+    "yahoo": ProviderGuard("yahoo", timeout=15, rate=5, burst=20, failure_threshold=8, reset_timeout=30, max_workers=16),
+    "cnn": ProviderGuard("cnn", timeout=3, rate=1, burst=2, failure_threshold=2, reset_timeout=300, max_wait=0, max_workers=2),
+    "google_translate": ProviderGuard("google_translate", timeout=10, rate=2, burst=5, failure_threshold=5, reset_timeout=60, max_workers=4),
+}
+
+def get_guard(name: str) -> ProviderGuard:
+    return PROVIDERS[name]
+
+def provider_status() -> List[Dict[str, Any]]:
+    return [guard.status() for guard in PROVIDERS.values()]
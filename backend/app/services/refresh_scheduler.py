@@ -0,0 +1,172 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Dict, Any
+from app.services.cache import TTLCache, SingleFlight, shared_cache, shared_flight, refresh_executor
+
+# Run the scheduler loop on startup (off by default; it calls Yahoo in the background)
+REFRESH_SCHEDULER_ENABLED = os.getenv("REFRESH_SCHEDULER", "0") == "1"
+
+class RefreshScheduler:
+    """
+    Tracks an exponentially decayed access count per cache key. Hot keys are refreshed
+    ahead of expiry (with jitter) so readers keep hitting the cache; cold keys are
+    dropped from tracking and simply age out. Nothing is tracked while the loop is
+    not running.
+    """
+    def __init__(self, cache: TTLCache, flight: SingleFlight, interval: float = 5, half_life: float = 600,
+                 hot_threshold: float = 3, cold_threshold: float = 0.5, lead: float = 0.2, jitter: float = 0.1,
+                 max_refreshes_per_minute: int = 30):
+        self.cache = cache
+        self.flight = flight
+        self.interval = interval
+        self.half_life = half_life
+        self.hot_threshold = hot_threshold
+        self.cold_threshold = cold_threshold
+        self.lead = lead # Refresh when this fraction of the TTL is left
+        self.jitter = jitter # ...plus up to this fraction of the TTL at random, to spread refreshes
+        self.max_refreshes_per_minute = max_refreshes_per_minute
+        self._keys = {} # key -> {"score", "updated", "loader", "flight_key", "batch", "jitter"}
+        self._recent_refreshes = deque()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self.refreshes = 0
+        self.skipped_for_budget = 0
+
+    def _decayed(self, entry: Dict[str, Any], now: float) -> float:
+        return entry['score'] * 0.5 ** ((now - entry['updated']) / self.half_life)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._stop.is_set()
+
+    def record(self, key: str, loader, flight_key: str = None, batch=None):
+        """
+        Counts one access to key. loader must fetch fresh data and store it in the cache;
+        it runs under flight_key (default: key) so it coalesces with live loads of the same data.
+        With batch=(group, item), loader takes a list of items instead, and due keys of one
+        group are refreshed together with a single loader([item, ...]) call.
+        """
+        if not self.running:
+            return
+        now = time.time()
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None:
+                entry = {"score": 0.0, "updated": now, "jitter": random.random()}
+                self._keys[key] = entry
+            entry['score'] = self._decayed(entry, now) + 1
+            entry['updated'] = now
+            entry['loader'] = loader
+            entry['flight_key'] = flight_key or key
+            entry['batch'] = batch
+
+    def _due(self, now: float) -> list:
+        due = []
+        with self._lock:
+            for key, entry in list(self._keys.items()):
+                score = self._decayed(entry, now)
+                if score < self.cold_threshold:
+                    del self._keys[key]
+                    continue
+                if score < self.hot_threshold:
+                    continue
+                expiry = self.cache.expiry(key)
+                if expiry is None:
+                    continue
+                stored_at, ttl = expiry
+                refresh_at = stored_at + ttl * (1 - self.lead - self.jitter * entry['jitter'])
+                if now >= refresh_at:
+                    due.append((score, entry))
+        # Hottest keys first when the budget is tight
+        due.sort(key=lambda item: item[0], reverse=True)
+        return [entry for _, entry in due]
+
+    def _take_budget(self, now: float) -> bool:
+        while self._recent_refreshes and now - self._recent_refreshes[0] > 60:
+            self._recent_refreshes.popleft()
+        if len(self._recent_refreshes) >= self.max_refreshes_per_minute:
+            return False
+        self._recent_refreshes.append(now)
+        return True
+
+    def tick(self):
+        now = time.time()
+        jobs = [] # (flight_key, loader, batch items or None), hottest first
+        batches = {} # group -> its job in jobs
+        for entry in self._due(now):
+            if entry['batch'] is None:
+                if not self.flight.in_flight(entry['flight_key']):
+                    jobs.append((entry['flight_key'], entry['loader'], None))
+                continue
+            group, item = entry['batch']
+            job = batches.get(group)
+            if job is None:
+                job = (f"refresh:{group}", entry['loader'], [])
+                if self.flight.in_flight(job[0]):
+                    continue
+                batches[group] = job
+                jobs.append(job)
+            job[2].append(item)
+
+        for flight_key, loader, items in jobs:
+            if not self._take_budget(now):
+                self.skipped_for_budget += 1
+                continue
+            self.refreshes += 1
+            refresh_executor.submit(self._refresh, flight_key, loader if items is None else partial(loader, items))
+
+    def _refresh(self, flight_key: str, loader):
+        try:
+            self.flight.do(flight_key, loader)
+        except Exception as e:
+            print(f"Scheduled refresh failed for {flight_key}: {e}")
+
+    def _run(self, stop: threading.Event):
+        while not stop.wait(self.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"Refresh scheduler tick failed: {e}")
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Each loop gets its own stop event, so a loop still finishing a tick after
+            # stop() cannot be revived by a later start()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,), name="refresh-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        Stops the loop and forgets the tracked keys; start() may be called again afterwards.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+            self._keys.clear()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            scores = {key: self._decayed(entry, now) for key, entry in self._keys.items()}
+        hot = sorted((k for k, v in scores.items() if v >= self.hot_threshold), key=lambda k: -scores[k])
+        return {
+            "running": self.running,
+            "tracked_keys": len(scores),
+            "hot_keys": hot[:20],
+            "refreshes": self.refreshes,
+            "skipped_for_budget": self.skipped_for_budget,
+            "max_refreshes_per_minute": self.max_refreshes_per_minute
+        }
+
+# Process-wide scheduler shared by every MarketDataFetcher instance
+refresh_scheduler = RefreshScheduler(shared_cache, shared_flight)
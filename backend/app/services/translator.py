@@ -0,0 +1,185 @@
+import hashlib
+import queue
+import threading
+from deep_translator import GoogleTranslator
+from app.services.cache import TTLCache
+from app.services.db_service import DBService
+from app.services.provider_guard import get_guard
+
+# Translations never go stale; entries only leave memory through LRU eviction
+TRANSLATION_MEMORY_SIZE = 5000
+TRANSLATION_MEMORY_TTL = 30 * 24 * 3600
+# The translation_cache table is pruned to its row cap after this many inserts
+PRUNE_EVERY = 100
+
+# Queued texts are joined into one upstream request of at most this many characters
+BATCH_MAX_CHARS = 4500
+BATCH_MAX_ITEMS = 20
+BATCH_SEPARATOR = "\n\n"
+TRANSLATION_WORKERS = 2
+
+# Process-wide in-memory layer in front of the translation_cache table
+translation_memory = TTLCache(max_size=TRANSLATION_MEMORY_SIZE, default_ttl=TRANSLATION_MEMORY_TTL)
+
+class CachedTranslator:
+    """
+    GoogleTranslator with a memo keyed by a hash of (target language, source text),
+    held in memory and persisted in the translation_cache table.
+    """
+    def __init__(self, target: str = 'ko', db: DBService = None):
+        self.target = target
+        self.db = db or DBService()
+        self.memory = translation_memory
+        self.guard = get_guard("google_translate")
+        self._saves = 0
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha1(f"{self.target}:{text}".encode('utf-8')).hexdigest()
+
+    def cached(self, text: str):
+        """
+        Returns the stored translation of text, or None if it was never translated.
+        """
+        key = self._key(text)
+        translated = self.memory.get(key)
+        if translated is not None:
+            return translated
+
+        translated = self.db.get_translation(key)
+        if translated is not None:
+            self.memory.set(key, translated)
+        return translated
+
+    def translate(self, text: str) -> str:
+        """
+        Translates text, calling the upstream translator only on a memo miss.
+        Raises if the upstream call fails, like GoogleTranslator.translate.
+        """
+        if not text:
+            return text
+
+        translated = self.cached(text)
+        if translated is not None:
+            return translated
+
+        translated = self.guard.call(GoogleTranslator(source='auto', target=self.target).translate, text)
+        if translated:
+            self._store(text, translated)
+        return translated
+
+    def _store(self, text: str, translated: str):
+        self.memory.set(self._key(text), translated)
+        self.db.save_translation(self._key(text), self.target, translated)
+        self._saves += 1
+        if self._saves % PRUNE_EVERY == 0:
+            self.db.prune_translations()
+
+    def translate_batch(self, texts: list):
+        """
+        Translates several texts with a single upstream request by joining them with
+        BATCH_SEPARATOR. Falls back to one request per text if the split does not line up.
+        """
+        texts = [t for t in dict.fromkeys(texts) if t and self.cached(t) is None]
+        if not texts:
+            return
+
+        joinable = [t for t in texts if BATCH_SEPARATOR not in t]
+        if len(joinable) > 1:
+            try:
+                joined = self.guard.call(GoogleTranslator(source='auto', target=self.target).translate, BATCH_SEPARATOR.join(joinable))
+                parts = [p.strip() for p in (joined or '').split(BATCH_SEPARATOR)]
+                if len(parts) == len(joinable) and all(parts):
+                    for text, translated in zip(joinable, parts):
+                        self._store(text, translated)
+                    texts = [t for t in texts if t not in joinable]
+            except Exception as e:
+                print(f"Batch translation failed: {e}")
+
+        for text in texts:
+            try:
+                self.translate(text)
+            except Exception as e:
+                print(f"Translation failed: {e}")
+
+    def translate_or_defer(self, text: str):
+        """
+        Returns (translation, False) if text was translated before. Otherwise queues
+        it for the background worker and returns (text, True) without waiting.
+        """
+        if not text:
+            return text, False
+
+        translated = self.cached(text)
+        if translated is not None:
+            return translated, False
+
+        get_translation_worker(self).submit(text)
+        return text, True
+
+class TranslationWorker:
+    """
+    Background threads that drain queued texts and translate them in batches,
+    so request handlers never wait for the upstream translator.
+    """
+    def __init__(self, translator: CachedTranslator, workers: int = TRANSLATION_WORKERS):
+        self.translator = translator
+        self.workers = workers
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def submit(self, text: str):
+        with self._lock:
+            if text in self._pending:
+                return
+            self._pending.add(text)
+            if not self._threads:
+                for i in range(self.workers):
+                    thread = threading.Thread(target=self._run, name=f"translation-worker-{i}", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+        self._queue.put(text)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        size = len(batch[0])
+        while len(batch) < BATCH_MAX_ITEMS:
+            try:
+                text = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if size + len(text) + len(BATCH_SEPARATOR) > BATCH_MAX_CHARS:
+                self._queue.put(text)
+                break
+            batch.append(text)
+            size += len(text) + len(BATCH_SEPARATOR)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self.translator.translate_batch(batch)
+            except Exception as e:
+                print(f"Translation worker failed: {e}")
+            finally:
+                with self._lock:
+                    self._pending.difference_update(batch)
+
+_worker = None
+_worker_lock = threading.Lock()
+
+def get_translation_worker(translator: CachedTranslator) -> TranslationWorker:
+    """
+    Returns the process-wide translation worker, creating it on first use.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = TranslationWorker(translator)
+        return _worker
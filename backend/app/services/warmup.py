@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from typing import Dict, Any
+from app.data.stocks import STOCK_DICT
+from app.services.data_fetcher import MarketDataFetcher, MARKET_INDICES, HISTORY_SUPERSET_PERIOD
+from app.services.provider_guard import get_guard, FAILURE_TTLS, TRANSIENT
+
+# Preload caches on FastAPI startup (off by default)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "0") == "1"
+# Warm-up only calls Yahoo while at least this many rate-limiter tokens are left for live traffic
+WARMUP_RESERVED_TOKENS = 5
+# get_ticker_data serves every period from this superset, so warming anything shorter leaves pages cold
+WARMUP_HISTORY_PERIOD = HISTORY_SUPERSET_PERIOD
+# Tickers per bulk history download, so each one finishes well inside the yahoo guard's timeout
+WARMUP_HISTORY_BATCH = 20
+# Failed (raised or returned nothing) critical steps are retried; the job stays not ready until
+# they succeed or the retries run out, then reports "degraded" but ready so deploys don't stall
+CRITICAL_STEPS = ("quotes", "market_summary", "history")
+WARMUP_RETRY_ATTEMPTS = 3
+# First retry waits out the negative cache of transient failures; later ones back off exponentially
+WARMUP_RETRY_BACKOFF = FAILURE_TTLS[TRANSIENT]
+
+class WarmupJob:
+    """
+    Preloads quotes, history and fundamentals for the STOCK_DICT universe and the
+    market summary indices in a background thread, and reports progress.
+    """
+    def __init__(self, enabled: bool = WARMUP_ON_STARTUP):
+        self.enabled = enabled
+        self.state = "idle"
+        self.current_step = None
+        self.completed = 0
+        self.total = 0
+        self.errors = 0
+        self.failed_steps = [] # Critical steps still failing
+        self.retries = 0
+        self.started_at = None
+        self.finished_at = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return not self.enabled or self.state in ("done", "degraded")
+
+    def start(self):
+        with self._lock:
+            if not self.enabled or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="cache-warmup", daemon=True)
+            self._thread.start()
+
+    def _wait_for_tokens(self):
+        bucket = get_guard("yahoo").bucket
+        while bucket.tokens < WARMUP_RESERVED_TOKENS + 1:
+            time.sleep(0.2)
+
+    def _step(self, name: str, func, *args, **kwargs) -> bool:
+        """
+        Runs one step and returns whether it succeeded.
+        """
+        self.current_step = name
+        self._wait_for_tokens()
+        try:
+            # Fetchers swallow upstream errors, so an empty result counts as a failure too
+            failed = not func(*args, **kwargs)
+            error = "no data"
+        except Exception as e:
+            failed, error = True, e
+        if failed:
+            self.errors += 1
+            print(f"Warm-up step {name} failed: {error}")
+        return not failed
+
+    def _run(self):
+        self.state = "running"
+        self.started_at = datetime.now().isoformat()
+        fetcher = MarketDataFetcher()
+        tickers = [s['ticker'] for s in STOCK_DICT]
+
+        def warm_histories():
+            histories = {}
+            for i in range(0, len(tickers), WARMUP_HISTORY_BATCH):
+                histories.update(fetcher.get_histories(tickers[i:i + WARMUP_HISTORY_BATCH], period=WARMUP_HISTORY_PERIOD))
+            return histories
+
+        critical = {
+            "quotes": partial(fetcher.get_quotes, tickers + list(MARKET_INDICES.keys())),
+            "market_summary": fetcher.get_market_summary,
+            "history": warm_histories
+        }
+        # Quotes, summary and history are bulk calls; fundamentals are one call per ticker
+        self.total = len(critical) + len(tickers)
+
+        for name, func in critical.items():
+            if not self._step(name, func):
+                self.failed_steps.append(name)
+            self.completed += 1
+        for ticker in tickers:
+            self._step(f"fundamentals:{ticker}", fetcher.get_company_info, ticker)
+            self.completed += 1
+
+        for attempt in range(WARMUP_RETRY_ATTEMPTS):
+            if not self.failed_steps:
+                break
+            self.current_step = None
+            time.sleep(WARMUP_RETRY_BACKOFF * 2 ** attempt)
+            self.retries += 1
+            self.failed_steps = [name for name in self.failed_steps if not self._step(name, critical[name])]
+
+        self.current_step = None
+        self.finished_at = datetime.now().isoformat()
+        self.state = "degraded" if self.failed_steps else "done"
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "state": self.state,
+            "current_step": self.current_step,
+            "completed": self.completed,
+            "total": self.total,
+            "progress": self.completed / self.total if self.total else (1.0 if self.ready else 0.0),
+            "errors": self.errors,
+            "failed_steps": self.failed_steps,
+            "retries": self.retries,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+warmup_job = WarmupJob()
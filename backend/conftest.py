@@ -0,0 +1,30 @@
+import sys
+import os
+import tempfile
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.services import db_service, data_fetcher
+from app.services.cache import shared_cache
+from app.services.provider_guard import PROVIDERS, CircuitBreaker, TokenBucket
+
+# Routers build their fetchers at import time; keep those off the bundled market.db too
+db_service.DB_PATH = os.path.join(tempfile.mkdtemp(prefix="market-db-"), "market.db")
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    """
+    A MarketDataFetcher on a fresh market.db in tmp_path, with an empty shared cache
+    and closed provider breakers with full rate-limit buckets.
+    """
+    for guard in PROVIDERS.values():
+        monkeypatch.setattr(guard, "breaker", CircuitBreaker(guard.breaker.failure_threshold, guard.breaker.reset_timeout))
+        monkeypatch.setattr(guard, "bucket", TokenBucket(guard.bucket.rate, guard.bucket.capacity))
+    monkeypatch.setattr(db_service, "DB_PATH", str(tmp_path / "market.db"))
+    monkeypatch.setattr(db_service, "_schema_ready", False)
+    monkeypatch.setattr(db_service, "_universe_ready", False)
+    shared_cache.clear()
+    yield data_fetcher.MarketDataFetcher()
+    shared_cache.clear()
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.analyzer import TechnicalAnalyzer
+
+FIELDS = ["rsi", "macd", "macd_signal", "sma_50", "sma_200"]
+
+def make_panel() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range(end="2025-06-30", periods=320)
+    walk = lambda: 100 + np.cumsum(rng.normal(0, 1, len(index)))
+    panel = pd.DataFrame({
+        "FULL": walk(),
+        "LISTED_LATE": walk(), # Leading NaNs: listed partway through
+        "HOLEY": walk(), # Interior holes: exchange holidays the others traded on
+        "SHORT": walk(), # Fewer than 14 bars
+        "RISING": np.arange(len(index), dtype=float) + 50 # No losses at all
+    }, index=index)
+    panel.iloc[:150, 1] = np.nan
+    panel.iloc[rng.choice(np.arange(1, 319), 40, replace=False), 2] = np.nan
+    panel.iloc[:-10, 3] = np.nan
+    return panel
+
+def reference_series(close: pd.Series) -> dict:
+    """
+    The full series TechnicalAnalyzer.analyze takes its latest values from.
+    """
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    return {
+        "rsi": 100 - (100 / (1 + gain / loss)),
+        "macd": macd,
+        "macd_signal": macd.ewm(span=9, adjust=False).mean(),
+        "sma_50": close.rolling(window=50).mean(),
+        "sma_200": close.rolling(window=200).mean()
+    }
+
+@pytest.fixture
+def panel():
+    return make_panel()
+
+def test_latest_matches_analyze_per_ticker(panel):
+    analyzer = TechnicalAnalyzer()
+    latest = analyzer.analyze_panel(panel)
+
+    for ticker in panel.columns:
+        expected = analyzer.analyze(panel[[ticker]].dropna().rename(columns={ticker: "Close"}))
+        row = latest.loc[ticker]
+        for field in FIELDS:
+            np.testing.assert_allclose(row[field], expected[field], rtol=1e-9, equal_nan=True, err_msg=f"{ticker} {field}")
+        assert row["trend"] == expected["trend"], ticker
+
+def test_full_series_matches_analyze_per_ticker(panel):
+    analyzer = TechnicalAnalyzer()
+    series = analyzer.analyze_panel(panel, latest_only=False)
+
+    for ticker in panel.columns:
+        close = panel[ticker].dropna()
+        expected = reference_series(close)
+        # The reference is what analyze() reports for the latest bar
+        assert expected["macd"].iloc[-1] == pytest.approx(analyzer.analyze(close.to_frame("Close"))["macd"])
+        for field in FIELDS:
+            # Only days the ticker traded carry values
+            np.testing.assert_allclose(series[field][ticker].reindex(close.index), expected[field],
+                                       rtol=1e-9, equal_nan=True, err_msg=f"{ticker} {field}")
+
+def test_panel_from_histories_aligns_exchange_local_dates():
+    us = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.DatetimeIndex(["2025-06-02 00:00", "2025-06-03 00:00"]).tz_localize("America/New_York"))
+    kr = pd.DataFrame({"Close": [3.0]}, index=pd.DatetimeIndex(["2025-06-03 00:00"]).tz_localize("Asia/Seoul"))
+
+    panel = TechnicalAnalyzer.panel_from_histories({"AAPL": us, "005930.KS": kr, "EMPTY": pd.DataFrame()})
+
+    assert list(panel.columns) == ["AAPL", "005930.KS"]
+    assert panel.loc["2025-06-03"].tolist() == [2.0, 3.0]
+    assert np.isnan(panel.loc["2025-06-02", "005930.KS"])
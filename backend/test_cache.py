@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+
+from app.services.cache import SingleFlight, TTLCache
+
+N = 8
+
+def run_concurrently(func, n: int = N) -> list:
+    results = [None] * n
+    def worker(i):
+        try:
+            results[i] = func()
+        except Exception as e:
+            results[i] = e
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+class BlockingFetch:
+    """
+    A fetch that blocks until released and counts how often it ran.
+    """
+    def __init__(self, result=None, error: Exception = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+def test_ttl_zero_is_honoured():
+    cache = TTLCache(default_ttl=300)
+    cache.set("quote:AAPL", 1.0, ttl=0)
+    assert cache.get("quote:AAPL") is None
+    assert cache.get_stale("quote:AAPL", 60) == 1.0
+
+def test_concurrent_misses_run_the_fetch_once(fetcher):
+    fetch = BlockingFetch(result=["article"])
+    threads, results = run_concurrently(lambda: fetcher._get_cached_data("news:AAPL", fetch))
+    assert fetch.started.wait(5)
+    time.sleep(0.1) # Let the other callers reach the flight and wait on the leader
+    fetch.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert fetch.calls == 1
+    assert results == [["article"]] * N
+    assert fetcher.cache.get("news:AAPL") == ["article"]
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight()
+    error = ConnectionError("Connection refused")
+    fetch = BlockingFetch(error=error)
+    threads, results = run_concurrently(lambda: flight.do("quote:AAPL", fetch))
+    assert fetch.started.wait(5)
+    time.sleep(0.1)
+    fetch.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert fetch.calls == 1
+    assert all(result is error for result in results)
+    assert not flight.in_flight("quote:AAPL")
+
+def test_stale_entry_is_served_while_one_background_refresh_runs(fetcher):
+    fetcher.cache.set("market_summary", {"S&P 500": 1.0}, ttl=0) # Just expired
+    fetch = BlockingFetch(result={"S&P 500": 2.0})
+
+    for _ in range(5):
+        assert fetcher._get_cached_data("market_summary", fetch, ttl=60, max_stale=600) == {"S&P 500": 1.0}
+    assert fetch.started.wait(5)
+    fetch.release.set()
+
+    deadline = time.time() + 5
+    while fetcher.flight.in_flight("market_summary") and time.time() < deadline:
+        time.sleep(0.01)
+    assert fetch.calls == 1
+    assert fetcher._get_cached_data("market_summary", fetch, ttl=60, max_stale=600) == {"S&P 500": 2.0}
+
+def test_entry_past_max_stale_is_fetched_inline(fetcher):
+    fetcher.cache.set("market_summary", {"S&P 500": 1.0}, ttl=0)
+    fetch = BlockingFetch(result={"S&P 500": 2.0})
+    fetch.release.set()
+
+    assert fetcher._get_cached_data("market_summary", fetch, ttl=60, max_stale=0) == {"S&P 500": 2.0}
+    assert fetch.calls == 1
@@ -0,0 +1,62 @@
+import sqlite3
+import pytest
+
+from app.data.registry import TickerRegistry
+from app.services import db_service
+from app.services.migrations import MIGRATIONS, run_migrations, schema_version
+
+@pytest.fixture
+def universe(tmp_path, monkeypatch):
+    path = tmp_path / "universe.csv"
+    path.write_text("ticker,name_en,name_kr,sector\nAAPL,Apple,애플,Technology\n", encoding="utf-8")
+    registry = TickerRegistry(str(path))
+    monkeypatch.setattr(db_service, "ticker_registry", registry)
+    return path
+
+def universe_rows(db):
+    with db.pool.read() as conn:
+        return conn.execute('SELECT ticker, name_kr FROM stock_universe ORDER BY ticker').fetchall()
+
+def restart(monkeypatch):
+    # A new process: the registry and the once-per-process flag start over
+    monkeypatch.setattr(db_service, "_universe_ready", False)
+    monkeypatch.setattr(db_service, "ticker_registry", TickerRegistry(db_service.ticker_registry.path))
+
+def test_universe_syncs_lazily(fetcher, universe):
+    db = fetcher.db
+    assert universe_rows(db) == []
+    assert not db_service.ticker_registry._loaded
+
+    db.add_to_watchlist("AAPL")
+    assert db.get_watchlist() == [{"ticker": "AAPL", "name": "애플"}]
+    assert universe_rows(db) == [("AAPL", "애플")]
+
+def test_universe_resyncs_only_when_source_changes(fetcher, universe, monkeypatch):
+    db = fetcher.db
+    db.get_watchlist()
+
+    restart(monkeypatch)
+    db.get_watchlist()
+    assert not db_service.ticker_registry._loaded # Unchanged source: registry never loaded
+
+    universe.write_text("ticker,name_en,name_kr,sector\nAAPL,Apple,애플,Technology\nMSFT,Microsoft,마이크로소프트,Technology\n",
+                        encoding="utf-8")
+    restart(monkeypatch)
+    db.get_watchlist()
+    assert universe_rows(db) == [("AAPL", "애플"), ("MSFT", "마이크로소프트")]
+
+def test_migrations_upgrade_a_pre_versioning_database():
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    # Layout from before schema versioning: no purchase_date, no freshness columns
+    conn.execute('CREATE TABLE portfolio (ticker TEXT PRIMARY KEY, shares INTEGER, avg_price REAL, updated_at TIMESTAMP)')
+    conn.execute('CREATE TABLE company_cache (ticker TEXT PRIMARY KEY, summary_kr TEXT, details_json TEXT, last_updated TIMESTAMP)')
+    conn.execute("INSERT INTO company_cache VALUES ('AAPL', '', '{}', '2025-01-01T00:00:00')")
+
+    assert run_migrations(conn) == len(MIGRATIONS)
+    assert run_migrations(conn) == len(MIGRATIONS) # Idempotent
+
+    assert 'purchase_date' in {row[1] for row in conn.execute('PRAGMA table_info(portfolio)')}
+    row = conn.execute('SELECT details_updated_at, summary_updated_at FROM company_cache').fetchone()
+    assert row == ('2025-01-01T00:00:00', '2025-01-01T00:00:00')
+    assert [v for v, _, _ in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+    assert schema_version(conn) == len(MIGRATIONS)
@@ -0,0 +1,117 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import data_fetcher
+from app.services.analyzer import TechnicalAnalyzer
+from app.services.indicators import IndicatorEngine, RSIState, SMAState
+
+FIELDS = ["rsi", "macd", "macd_signal", "sma_50", "sma_200"]
+
+def walk(days: int = 300, seed: int = 3) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=days)
+    return pd.Series(100 + np.cumsum(rng.normal(0, 1, days)), index=index)
+
+def assert_matches_analyze(snapshot: dict, closes: pd.Series):
+    expected = TechnicalAnalyzer().analyze(closes.to_frame("Close"))
+    for field in FIELDS:
+        assert snapshot[field] == pytest.approx(expected[field], rel=1e-9), field
+    assert snapshot["trend"] == expected["trend"]
+
+def test_seed_matches_analyze():
+    closes = walk()
+    assert_matches_analyze(IndicatorEngine().seed(closes).snapshot(), closes)
+
+def test_update_and_revise_match_analyze():
+    closes = walk()
+    engine = IndicatorEngine().seed(closes.iloc[:-1])
+
+    # An intraday tick, then the close of the same day
+    engine.update(closes.index[-1], closes.iloc[-1] + 5)
+    engine.update(closes.index[-1], closes.iloc[-1])
+
+    assert_matches_analyze(engine.snapshot(), closes)
+    assert engine.bars == len(closes)
+
+def test_older_bars_are_ignored():
+    closes = walk()
+    engine = IndicatorEngine().seed(closes)
+    before = engine.snapshot()
+    engine.update(closes.index[-5], 1.0)
+    assert engine.snapshot() == before
+
+def test_state_round_trips_through_json():
+    closes = walk()
+    engine = IndicatorEngine(wilder=True).seed(closes.iloc[:-1])
+    restored = IndicatorEngine.from_dict(json.loads(json.dumps(engine.to_dict())))
+
+    for e in (engine, restored):
+        e.update(closes.index[-1], closes.iloc[-1] + 1)
+        e.update(closes.index[-1], closes.iloc[-1])
+    # The restored sums are recomputed exactly, so allow for the running total's rounding
+    assert restored.snapshot() == pytest.approx(engine.snapshot(), rel=1e-12)
+
+def test_outdated_state_layout_is_dropped():
+    state = IndicatorEngine().seed(walk()).to_dict()
+    state["version"] = -1
+    assert IndicatorEngine.from_dict(state) is None
+
+def test_wilder_rsi_matches_reference():
+    closes = walk()
+    delta = closes.diff().fillna(0.0)
+    gains, losses = delta.clip(lower=0).to_numpy(), (-delta).clip(lower=0).to_numpy()
+    avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+    for gain, loss in zip(gains[14:], losses[14:]):
+        avg_gain = (avg_gain * 13 + gain) / 14
+        avg_loss = (avg_loss * 13 + loss) / 14
+
+    rsi = RSIState(14, wilder=True)
+    for close in closes:
+        rsi.update(close)
+
+    assert rsi.value == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss), rel=1e-9)
+
+def test_revise_before_update_appends():
+    rsi, sma = RSIState(14), SMAState(3)
+    rsi.revise(10.0)
+    sma.revise(10.0)
+    assert rsi.last_close == 10.0
+    assert list(sma.values) == [10.0]
+
+@pytest.fixture
+def history(fetcher, monkeypatch):
+    """
+    Serves get_ticker_data from a mutable close series and counts engine reseeds.
+    """
+    state = {"closes": walk(), "seeds": 0}
+    monkeypatch.setattr(fetcher, "get_ticker_data", lambda ticker, period="1y": state["closes"].to_frame("Close"))
+    seed = IndicatorEngine.seed
+    def counting_seed(engine, closes):
+        state["seeds"] += 1
+        return seed(engine, closes)
+    monkeypatch.setattr(data_fetcher.IndicatorEngine, "seed", counting_seed)
+    return state
+
+def test_snapshot_applies_only_new_bars(fetcher, history):
+    full = history["closes"]
+    history["closes"] = full.iloc[:-1]
+    fetcher.get_indicator_snapshot("AAPL")
+
+    history["closes"] = full
+    snapshot = fetcher.get_indicator_snapshot("AAPL")
+
+    assert history["seeds"] == 1
+    assert_matches_analyze(snapshot, full)
+    assert fetcher.db.get_indicator_state("AAPL")["last_date"] == full.index[-1].strftime('%Y-%m-%d')
+
+def test_snapshot_reseeds_when_history_is_readjusted(fetcher, history):
+    fetcher.get_indicator_snapshot("AAPL")
+
+    # A 2:1 split re-adjusts every past close, including the state's prev_close
+    history["closes"] = history["closes"] * 0.5
+    snapshot = fetcher.get_indicator_snapshot("AAPL")
+
+    assert history["seeds"] == 2
+    assert_matches_analyze(snapshot, history["closes"])
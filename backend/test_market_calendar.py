@@ -0,0 +1,35 @@
+from datetime import date
+import pytest
+
+from app.services import market_calendar as mc
+
+# Published closures the rules cannot derive
+NOT_RULE_BASED = {
+    "NYSE": {"2025-01-09"}, # National day of mourning
+    "KRX": {
+        "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-05-06", "2025-06-03",
+        "2025-10-06", "2025-10-07", "2025-10-08",
+        "2026-02-16", "2026-02-17", "2026-02-18", "2026-05-25", "2026-06-03", "2026-09-24", "2026-09-25",
+    },
+}
+
+@pytest.mark.parametrize("exchange", ["NYSE", "KRX"])
+@pytest.mark.parametrize("year", [2025, 2026])
+def test_rules_reproduce_published_tables(exchange, year):
+    holidays, early = mc.RULES[exchange](year)
+    published = {day for day in mc.HOLIDAYS[exchange] if day.startswith(f"{year}-")}
+    assert holidays == published - NOT_RULE_BASED[exchange]
+    assert early == {day: close for day, close in mc.EARLY_CLOSES[exchange].items() if day.startswith(f"{year}-")}
+
+def test_uncovered_year_falls_back_to_rules_and_warns_once(monkeypatch, capsys):
+    monkeypatch.setattr(mc, "_calendars", {})
+
+    assert not mc._is_trading_day("NYSE", date(2027, 11, 25)) # Thanksgiving
+    assert not mc._is_trading_day("NYSE", date(2027, 3, 26))  # Good Friday
+    assert not mc._is_trading_day("KRX", date(2027, 3, 1))
+    assert mc._is_trading_day("NYSE", date(2027, 11, 24))
+    assert mc._session("NYSE", date(2027, 11, 26))[1].hour == 13 # Early close (+ grace)
+    assert not mc._is_trading_day("NYSE", date(2027, 7, 5)) # July 4th on a Sunday
+
+    warnings = capsys.readouterr().out.count("WARNING")
+    assert warnings == 2 # One per exchange-year
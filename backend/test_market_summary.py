@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from app.services import data_fetcher
+from app.services.provider_guard import ProviderUnavailable
+
+def bars(close: float, days: int = 5) -> pd.DataFrame:
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=days)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0}, index=index)
+
+def serve(prices: dict):
+    """
+    yf.download stand-in: tickers without a price come back as all-NaN columns.
+    """
+    def download(tickers, **kwargs):
+        return pd.concat({ticker: bars(prices.get(ticker, np.nan)) for ticker in tickers}, axis=1)
+    return download
+
+def provider_down(*args, **kwargs):
+    raise ProviderUnavailable("yahoo circuit is open")
+
+class DownTicker:
+    def __init__(self, symbol):
+        pass
+
+    @property
+    def fast_info(self):
+        raise ProviderUnavailable("yahoo circuit is open")
+
+    def history(self, **kwargs):
+        raise ProviderUnavailable("yahoo circuit is open")
+
+def expire(fetcher, key: str):
+    """
+    Backdates a cache entry so it is past its TTL but still within the stale-if-error window.
+    """
+    value, stored_at, ttl = fetcher.cache._data[key]
+    fetcher.cache._data[key] = (value, stored_at - ttl - 1, ttl)
+
+class InlineExecutor:
+    """
+    Runs background refreshes on the calling thread so their result is visible right away.
+    """
+    def submit(self, func, *args):
+        func(*args)
+
+def prime(fetcher, monkeypatch, method: str, key: str):
+    monkeypatch.setattr(data_fetcher, "refresh_executor", InlineExecutor())
+    monkeypatch.setattr(fetcher, "get_fear_and_greed_index", lambda: 50.0)
+    monkeypatch.setattr(data_fetcher.yf, "download", serve({ticker: 100.0 for ticker in data_fetcher.MARKET_INDICES}))
+    good = getattr(fetcher, method)()
+    expire(fetcher, key)
+    for ticker in data_fetcher.MARKET_INDICES:
+        fetcher.cache.delete(f"quote:{ticker}")
+    return good
+
+def test_summary_falls_back_to_cache_when_provider_is_down(fetcher, monkeypatch):
+    good = prime(fetcher, monkeypatch, "get_market_summary", "market_summary")
+    monkeypatch.setattr(data_fetcher.yf, "download", provider_down)
+
+    # Served stale while the refresh runs; the failed refresh must not overwrite it
+    assert fetcher.get_market_summary() == good
+    assert fetcher.get_market_summary()["S&P 500"]["price"] == 100.0
+
+def test_summary_keeps_last_good_quote_for_failed_indices(fetcher, monkeypatch):
+    prime(fetcher, monkeypatch, "get_market_summary", "market_summary")
+    monkeypatch.setattr(data_fetcher.yf, "download", serve({"^GSPC": 110.0}))
+
+    fetcher.get_market_summary()
+    summary = fetcher.get_market_summary()
+
+    assert summary["S&P 500"]["price"] == 110.0
+    assert summary["Nasdaq"]["price"] == 100.0
+
+def test_economic_data_falls_back_to_cache_when_provider_is_down(fetcher, monkeypatch):
+    prime(fetcher, monkeypatch, "get_economic_data", "economic_data")
+    monkeypatch.setattr(data_fetcher.yf, "download", provider_down)
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", DownTicker)
+
+    fetcher.get_economic_data()
+
+    assert fetcher.get_economic_data()["VIX (Volatility)"] == 100.0
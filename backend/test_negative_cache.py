@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from app.services import data_fetcher
+from app.services.provider_guard import TRANSIENT, FAILURE_TTLS
+
+def bars(days: int = 5, close: float = 100.0) -> pd.DataFrame:
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=days)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0}, index=index)
+
+def fake_download(frames: dict):
+    """
+    yf.download stand-in: tickers without a frame come back as all-NaN columns, like Yahoo does.
+    """
+    def download(tickers, **kwargs):
+        empty = bars() * np.nan
+        return pd.concat({ticker: frames.get(ticker, empty) for ticker in tickers}, axis=1)
+    return download
+
+def test_empty_single_ticker_quote_is_transient(fetcher, monkeypatch):
+    monkeypatch.setattr(data_fetcher.yf, "download", fake_download({}))
+
+    assert fetcher.get_quotes(["^VIX"]) == {}
+
+    failure = fetcher._failure("quote:^VIX")
+    assert failure is not None and failure.kind == TRANSIENT
+    assert fetcher.cache.expiry("failure:quote:^VIX")[1] == FAILURE_TTLS[TRANSIENT]
+
+def test_bulk_failures_come_from_the_returned_frame(fetcher, monkeypatch):
+    monkeypatch.setattr(data_fetcher.yf, "download", fake_download({"AAPL": bars(close=200.0)}))
+
+    quotes = fetcher.get_quotes(["AAPL", "ZZZZ"])
+
+    assert quotes["AAPL"]["price"] == 200.0
+    assert fetcher._failure("quote:AAPL") is None
+    assert fetcher._failure("quote:ZZZZ").kind == TRANSIENT
+
+class FailingTicker:
+    """
+    yf.Ticker stand-in whose fast_info and history both fail, counting constructions.
+    """
+    built = 0
+
+    def __init__(self, symbol):
+        FailingTicker.built += 1
+
+    @property
+    def fast_info(self):
+        raise KeyError("lastPrice")
+
+    def history(self, **kwargs):
+        return pd.DataFrame()
+
+def test_failed_price_fallbacks_are_negative_cached(fetcher, monkeypatch):
+    downloads = []
+    def download(tickers, **kwargs):
+        downloads.append(tickers)
+        return fake_download({})(tickers, **kwargs)
+    monkeypatch.setattr(data_fetcher.yf, "download", download)
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", FailingTicker)
+    FailingTicker.built = 0
+
+    for _ in range(5):
+        assert fetcher.get_current_price("ZZZZ") == 0.0
+
+    assert len(downloads) == 1
+    assert FailingTicker.built == 1
+    assert fetcher._failure("price:ZZZZ") is not None
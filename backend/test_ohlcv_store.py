@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+import pandas as pd
+import pytest
+
+from app.services import data_fetcher
+
+TICKER = "AAPL"
+
+class FakeUpstream:
+    """
+    Stands in for Yahoo: serves daily bars from one frame through yf.Ticker().history and yf.download.
+    """
+    def __init__(self, frame: pd.DataFrame, period_start):
+        self.frame = frame
+        self.period_start = period_start
+        self.downloads = []
+
+    def ticker(self, symbol):
+        upstream = self
+
+        class FakeTicker:
+            def history(self, start=None, period=None):
+                upstream.downloads.append(("history", start or period))
+                if start:
+                    return upstream.frame[upstream.frame.index >= pd.Timestamp(start)]
+                return upstream.frame
+
+        return FakeTicker()
+
+    def download(self, tickers, period=None, **kwargs):
+        self.downloads.append(("download", period))
+        start = self.period_start(period)
+        df = self.frame[self.frame.index >= pd.Timestamp(start)]
+        return pd.concat({ticker: df for ticker in tickers}, axis=1)
+
+def make_bars(days: int, scale: float = 1.0) -> pd.DataFrame:
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=days)
+    close = pd.Series(range(100, 100 + days), index=index, dtype=float) * scale
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0}, index=index)
+
+@pytest.fixture
+def upstream(fetcher, monkeypatch):
+    fake = FakeUpstream(make_bars(600), fetcher._period_start)
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", fake.ticker)
+    monkeypatch.setattr(data_fetcher.yf, "download", fake.download)
+    return fake
+
+def expire_store(fetcher, ticker: str):
+    stale = (datetime.now() - timedelta(days=3)).isoformat()
+    with fetcher.db.pool.write() as conn:
+        conn.execute('UPDATE ohlcv_meta SET updated_at = ? WHERE ticker = ?', (stale, ticker))
+
+def stored_closes(fetcher, ticker: str) -> pd.Series:
+    rows = fetcher.db.get_ohlcv(ticker)
+    return pd.Series({pd.Timestamp(row[0]): row[4] for row in rows})
+
+def assert_store_matches(fetcher, upstream, ticker: str = TICKER):
+    stored = stored_closes(fetcher, ticker)
+    assert not stored.empty
+    expected = upstream.frame['Close'].reindex(stored.index)
+    pd.testing.assert_series_equal(stored, expected, check_names=False, check_freq=False)
+
+def test_gap_fill_appends_only_new_bars(fetcher, upstream):
+    full = upstream.frame
+    upstream.frame = full.iloc[:-5]
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+
+    upstream.frame = full
+    expire_store(fetcher, TICKER)
+    upstream.downloads.clear()
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+
+    # Only the tail from the anchor bar was requested
+    assert len(upstream.downloads) == 1
+    assert upstream.downloads[0][1] >= full.index[-8].strftime('%Y-%m-%d')
+    assert_store_matches(fetcher, upstream)
+    assert fetcher.db.get_ohlcv_meta(TICKER)['last_date'] == full.index[-1].strftime('%Y-%m-%d')
+
+def test_sync_history_rewrites_readjusted_store(fetcher, upstream):
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+
+    # A 2:1 split: upstream re-adjusts every past bar
+    upstream.frame = make_bars(600, scale=0.5)
+    expire_store(fetcher, TICKER)
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+
+    assert_store_matches(fetcher, upstream)
+
+def test_bulk_download_rewrites_readjusted_store(fetcher, upstream):
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+    upstream.frame = make_bars(600, scale=0.5)
+
+    histories = fetcher.get_histories([TICKER], period="1y")
+
+    assert TICKER in histories
+    # Bars older than the bulk download must not survive at the old adjustment level
+    assert_store_matches(fetcher, upstream)
+    meta = fetcher.db.get_ohlcv_meta(TICKER)
+    assert meta['coverage_start'] == histories[TICKER].index[0].strftime('%Y-%m-%d')
+
+def test_bulk_download_keeps_store_when_adjustment_matches(fetcher, upstream):
+    fetcher._sync_history(TICKER, fetcher._period_start("2y"))
+    coverage_start = fetcher.db.get_ohlcv_meta(TICKER)['coverage_start']
+    bars = len(fetcher.db.get_ohlcv(TICKER))
+
+    fetcher.get_histories([TICKER], period="1y")
+
+    assert_store_matches(fetcher, upstream)
+    assert fetcher.db.get_ohlcv_meta(TICKER)['coverage_start'] == coverage_start
+    assert len(fetcher.db.get_ohlcv(TICKER)) == bars
@@ -0,0 +1,32 @@
+import pytest
+
+from app.routers import portfolio, stock
+
+HOLDINGS = [
+    {"ticker": "AAPL", "name": "Apple", "shares": 10, "avg_price": 100.0, "purchase_date": None},
+    {"ticker": "MSFT", "name": "Microsoft", "shares": 5, "avg_price": 200.0, "purchase_date": None}
+]
+
+@pytest.fixture
+def upstream(monkeypatch):
+    fetcher = portfolio.fetcher
+    # One flaky bulk response: MSFT is missing from it
+    monkeypatch.setattr(fetcher, "get_quotes", lambda tickers: {"AAPL": {"price": 150.0}})
+    monkeypatch.setattr(fetcher, "get_current_price", lambda ticker: 300.0)
+    monkeypatch.setattr(portfolio.db, "get_holdings", lambda: HOLDINGS)
+    monkeypatch.setattr(stock.fetcher, "get_quotes", fetcher.get_quotes)
+    monkeypatch.setattr(stock.fetcher, "get_current_price", fetcher.get_current_price)
+    monkeypatch.setattr(stock.db, "get_watchlist", lambda: HOLDINGS)
+    return fetcher
+
+def test_holding_missing_from_bulk_quote_uses_fallback_price(upstream):
+    holdings = {h["ticker"]: h for h in portfolio.get_portfolio()}
+
+    assert holdings["AAPL"]["current_price"] == 150.0
+    assert holdings["MSFT"]["current_price"] == 300.0
+    assert holdings["MSFT"]["pl_percent"] == pytest.approx(50.0)
+
+def test_watchlist_missing_from_bulk_quote_uses_fallback_price(upstream):
+    prices = {item["ticker"]: item["price"] for item in stock.get_watchlist()}
+
+    assert prices == {"AAPL": 150.0, "MSFT": 300.0}
@@ -0,0 +1,120 @@
+import sys
+import os
+import threading
+import time
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.services.provider_guard import (
+    ProviderGuard, ProviderUnavailable, CircuitBreaker, classify_failure, is_provider_failure,
+    NOT_FOUND, TRANSIENT, RATE_LIMITED
+)
+
+class HTTPError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP Error {status_code}")
+        self.response = type("Response", (), {"status_code": status_code})()
+
+class ReadTimeout(Exception):
+    pass
+
+def make_guard(threshold: int = 3, timeout: float = 1.0) -> ProviderGuard:
+    return ProviderGuard("test", timeout=timeout, rate=1000, burst=1000, failure_threshold=threshold, reset_timeout=60)
+
+def failing(error):
+    def func():
+        raise error
+    return func
+
+@pytest.mark.parametrize("error, kind", [
+    (Exception("$ZZZZ: possibly delisted; no price data found"), NOT_FOUND),
+    (Exception("No data found for this date range, symbol may be delisted"), NOT_FOUND),
+    (Exception("Quote not found for symbol: ZZZZ"), NOT_FOUND),
+    (Exception("Too Many Requests. Rate limited. Try after a while."), RATE_LIMITED),
+    (ConnectionError("Connection reset by peer"), TRANSIENT),
+    (ProviderUnavailable("yahoo circuit is open"), TRANSIENT),
+])
+def test_classify_failure(error, kind):
+    assert classify_failure(error) == kind
+
+def test_empty_result_is_transient():
+    assert classify_failure(None) == TRANSIENT
+
+@pytest.mark.parametrize("error, counted", [
+    (Exception("$ZZZZ: possibly delisted; no price data found"), False),
+    (HTTPError(404), False),
+    (KeyError("regularMarketPrice"), False),
+    (ValueError("Invalid input - interval=1d is not supported"), False),
+    (ConnectionError("Connection refused"), True),
+    (TimeoutError(), True),
+    (ReadTimeout("read timed out"), True),
+    (HTTPError(500), True),
+    (HTTPError(503), True),
+    (HTTPError(429), True),
+    (Exception("502 Server Error: Bad Gateway"), True),
+    (Exception("Too Many Requests"), True),
+])
+def test_is_provider_failure(error, counted):
+    assert is_provider_failure(error) == counted
+
+def test_bad_symbols_do_not_open_breaker():
+    guard = make_guard(threshold=3)
+    for _ in range(25):
+        with pytest.raises(Exception, match="delisted"):
+            guard.call(failing(Exception("$ZZZZ: possibly delisted; no price data found")))
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+    assert guard.call(lambda: "ok") == "ok"
+
+@pytest.mark.parametrize("error", [ConnectionError("Connection refused"), HTTPError(503), HTTPError(429)])
+def test_provider_errors_open_breaker(error):
+    guard = make_guard(threshold=3)
+    for _ in range(3):
+        with pytest.raises(type(error)):
+            guard.call(failing(error))
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(ProviderUnavailable):
+        guard.call(lambda: "ok")
+
+def test_timeouts_open_breaker():
+    guard = make_guard(threshold=2, timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(ProviderUnavailable):
+            guard.call(time.sleep, 0.5)
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    assert guard.timeouts == 2
+
+def test_bad_request_resets_consecutive_failures():
+    guard = make_guard(threshold=3)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            guard.call(failing(ConnectionError("Connection refused")))
+    # The provider answered, so it is reachable again
+    with pytest.raises(Exception):
+        guard.call(failing(Exception("No data found, symbol may be delisted")))
+    with pytest.raises(ConnectionError):
+        guard.call(failing(ConnectionError("Connection refused")))
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+def test_hung_provider_does_not_starve_other_providers():
+    hung = ProviderGuard("hung", timeout=0.05, rate=1000, burst=1000, failure_threshold=100, reset_timeout=60, max_workers=2)
+    healthy = make_guard(threshold=1)
+    release = threading.Event()
+    try:
+        for _ in range(2):
+            with pytest.raises(ProviderUnavailable, match="timed out"):
+                hung.call(release.wait)
+        # Its workers are all stuck: further calls are rejected rather than queued
+        with pytest.raises(ProviderUnavailable, match="no free workers"):
+            hung.call(lambda: "ok")
+
+        assert healthy.call(lambda: "ok") == "ok"
+        assert healthy.breaker.state == CircuitBreaker.CLOSED
+    finally:
+        release.set()
+
+    deadline = time.time() + 1
+    while hung.status()["busy_workers"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert hung.call(lambda: "ok") == "ok"
@@ -0,0 +1,77 @@
+import time
+import pytest
+
+from app.services import refresh_scheduler as rs
+from app.services.cache import TTLCache, SingleFlight
+
+class InlineExecutor:
+    def submit(self, func, *args):
+        func(*args)
+
+class RecordingFlight(SingleFlight):
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+
+    def do(self, key, func):
+        self.keys.append(key)
+        return super().do(key, func)
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(rs, "refresh_executor", InlineExecutor())
+    # The loop never ticks on its own within a test; tests call tick() themselves
+    scheduler = rs.RefreshScheduler(TTLCache(), RecordingFlight(), interval=3600, hot_threshold=2, lead=0.99, jitter=0)
+    scheduler.start()
+    yield scheduler
+    scheduler.stop()
+
+def make_hot(scheduler, key: str, loader, **kwargs):
+    scheduler.cache.set(key, "old", ttl=60)
+    for _ in range(3):
+        scheduler.record(key, loader, **kwargs)
+
+def test_record_is_noop_until_started():
+    scheduler = rs.RefreshScheduler(TTLCache(), SingleFlight())
+    scheduler.record("quote:AAPL", lambda: None)
+    assert scheduler.stats()['tracked_keys'] == 0
+
+def test_stop_forgets_tracked_keys(scheduler):
+    make_hot(scheduler, "quote:AAPL", lambda: None)
+    scheduler.stop()
+    scheduler.record("quote:AAPL", lambda: None)
+    assert scheduler.stats()['tracked_keys'] == 0
+
+def test_scheduler_can_restart_after_stop(scheduler):
+    first = scheduler._thread
+    scheduler.stop()
+    assert not scheduler.running
+    assert not first.is_alive()
+
+    scheduler.start()
+    assert scheduler.running
+    assert scheduler._thread is not first and scheduler._thread.is_alive()
+    make_hot(scheduler, "quote:AAPL", lambda: None)
+    assert scheduler.stats()['tracked_keys'] == 1
+
+def test_due_quote_keys_refresh_in_one_batch(scheduler):
+    calls = []
+    for ticker in ("AAPL", "MSFT", "005930.KS"):
+        make_hot(scheduler, f"quote:{ticker}", calls.append, batch=("quote", ticker))
+
+    time.sleep(0.7) # Past the 1% of the TTL left before refresh
+    scheduler.tick()
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == ["005930.KS", "AAPL", "MSFT"]
+    assert scheduler.refreshes == 1
+
+def test_refresh_uses_the_live_flight_key(scheduler):
+    calls = []
+    make_hot(scheduler, "history:AAPL", lambda: calls.append(1), flight_key="history:AAPL:2021-10-18")
+
+    time.sleep(0.7)
+    scheduler.tick()
+
+    assert calls == [1]
+    assert scheduler.flight.keys == ["history:AAPL:2021-10-18"]
@@ -0,0 +1,55 @@
+import random
+import pytest
+
+from app.data.registry import TickerRecord, TickerRegistry
+from app.data.search_index import SearchIndex, choseong, normalize
+
+@pytest.fixture(scope="module")
+def bundled():
+    return SearchIndex(TickerRegistry(path="").records())
+
+def tickers(results):
+    return [record.ticker for record in results]
+
+def test_choseong():
+    assert choseong("삼성sdi") == "ㅅㅅsdi"
+    assert normalize("Samsung Electronics Co., Ltd.") == "samsungelectronicsco.ltd."
+
+def test_choseong_query_ranks_by_market_cap(bundled):
+    # 시스코 (CSCO) and 삼성전자 both start with ㅅㅅ; Samsung is the larger company
+    results = tickers(bundled.search("ㅅㅅ", limit=10))
+    assert results[0] == "005930.KS"
+    assert results.index("005930.KS") < results.index("CSCO")
+
+def test_exact_whole_match_beats_larger_prefix_match():
+    index = SearchIndex([
+        TickerRecord("BIG", "Kia Motors Holdings", "기아홀딩스", market_cap=900),
+        TickerRecord("000270.KS", "Kia", "기아", market_cap=30),
+    ])
+    assert tickers(index.search("기아")) == ["000270.KS", "BIG"]
+    assert tickers(index.search("ㄱㅇ")) == ["000270.KS", "BIG"]
+    assert tickers(index.search("kia")) == ["000270.KS", "BIG"]
+
+def test_records_without_market_cap_keep_registry_order_after_the_rest():
+    index = SearchIndex([
+        TickerRecord("AAA1", "Acme One"),
+        TickerRecord("AAA2", "Acme Two", market_cap=5),
+        TickerRecord("AAA3", "Acme Three"),
+    ])
+    assert tickers(index.search("acme")) == ["AAA2", "AAA1", "AAA3"]
+
+def test_word_prefix_and_substring(bundled):
+    assert tickers(bundled.search("google"))[0] == "GOOGL"
+    assert "005930.KS" in tickers(bundled.search("전자"))
+
+def test_long_prefix_returns_the_most_popular_matches():
+    rng = random.Random(7)
+    records = [TickerRecord(f"T{i}", f"Corp{rng.randrange(10**6):06d} Holdings", market_cap=rng.random() * 100)
+               for i in range(5000)]
+    index = SearchIndex(records)
+
+    for query in ("corp", "corp1", "corp12", "holdings"):
+        expected = sorted((r for r in records if any(
+            term.startswith(query) for term in (r.name_en.lower().split() + [normalize(r.name_en)]))),
+            key=lambda r: -r.market_cap)[:10]
+        assert tickers(index.search(query, limit=10)) == tickers(expected)
@@ -0,0 +1,58 @@
+import asyncio
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from app.routers import features
+
+def bars(start: str, days: int, close: float = 100.0) -> pd.DataFrame:
+    index = pd.bdate_range(start=start, periods=days)
+    return pd.DataFrame({"Close": close}, index=index)
+
+def run(request: dict):
+    return asyncio.run(features.calculate_time_machine_batch(features.TimeMachineBatchRequest(**request)))
+
+@pytest.fixture
+def upstream(monkeypatch):
+    fetcher = features.fetcher
+    monkeypatch.setattr(fetcher, "get_ticker_data", lambda ticker, period="1y": bars("2020-01-01", 1000))
+    monkeypatch.setattr(fetcher, "get_quotes", lambda tickers: {})
+    monkeypatch.setattr(fetcher, "get_current_price", lambda ticker: 150.0)
+    return fetcher
+
+def test_current_price_falls_back_when_quote_missing(upstream):
+    result = run({"items": [{"ticker": "AAPL", "amount": 1000, "date": "2021-03-01"}]})
+
+    item = result["items"][0]
+    assert item["current_price"] == 150.0
+    assert item["roi"] == pytest.approx(50.0)
+
+def test_missing_current_price_is_an_error_not_a_loss(upstream, monkeypatch):
+    monkeypatch.setattr(upstream, "get_current_price", lambda ticker: 0.0)
+
+    result = run({
+        "items": [{"ticker": "AAPL", "amount": 1000, "date": "2021-03-01"}],
+        "schedules": [{"ticker": "AAPL", "amount": 100, "start": "2021-01-01", "frequency": "monthly"}]
+    })
+
+    assert result["items"][0]["error"] == "Current price not found"
+    assert result["schedules"][0]["error"] == "Current price not found"
+    assert result["totals"]["initial_investment"] == 0
+
+@pytest.mark.parametrize("request_body", [
+    {"items": [{"ticker": "AAPL", "amount": 1000, "date": "2021-02-30"}]},
+    {"items": [{"ticker": "AAPL", "amount": 1000, "date": "03/01/2021"}]},
+    {"schedules": [{"ticker": "AAPL", "amount": 100, "start": "yesterday"}]},
+    {"schedules": [{"ticker": "AAPL", "amount": 100, "start": "2021-01-01", "end": "2021-13-01"}]},
+])
+def test_invalid_dates_are_rejected(upstream, request_body):
+    with pytest.raises(HTTPException) as error:
+        run(request_body)
+    assert error.value.status_code == 422
+
+def test_bad_date_does_not_zero_the_others(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, "get_ticker_data", lambda ticker, period="1y": bars("2020-01-01", 1000))
+
+    prices = fetcher.get_historical_prices("AAPL", ["2021-03-01", "not-a-date", "2019-01-01"])
+
+    assert prices == {"2021-03-01": 100.0, "not-a-date": 0.0, "2019-01-01": 0.0}
@@ -0,0 +1,59 @@
+import pytest
+
+from app.services import warmup
+
+class FakeFetcher:
+    """
+    Stands in for MarketDataFetcher; `failures` is how many history calls come back empty.
+    """
+    failures = 0
+
+    def __init__(self):
+        self.history_calls = 0
+
+    def get_quotes(self, tickers):
+        return {ticker: {"price": 1.0} for ticker in tickers}
+
+    def get_market_summary(self):
+        return {"S&P 500": {"price": 1.0}}
+
+    def get_histories(self, tickers, period):
+        self.history_calls += 1
+        if FakeFetcher.failures:
+            FakeFetcher.failures -= 1
+            return {}
+        return {ticker: object() for ticker in tickers}
+
+    def get_company_info(self, ticker):
+        return {"symbol": ticker}
+
+@pytest.fixture
+def job(monkeypatch):
+    monkeypatch.setattr(warmup, "MarketDataFetcher", FakeFetcher)
+    monkeypatch.setattr(warmup, "STOCK_DICT", [{"ticker": "AAPL"}, {"ticker": "MSFT"}])
+    monkeypatch.setattr(warmup, "WARMUP_RETRY_BACKOFF", 0)
+    return warmup.WarmupJob(enabled=True)
+
+def test_failed_critical_step_is_retried_until_it_succeeds(job):
+    FakeFetcher.failures = 2
+
+    job._run()
+
+    assert job.state == "done"
+    assert job.ready
+    assert job.retries == 2
+    assert job.status()["failed_steps"] == []
+
+def test_retries_are_bounded_and_then_ready_but_degraded(job):
+    FakeFetcher.failures = 100
+
+    job._run()
+
+    assert job.state == "degraded"
+    assert job.ready
+    assert job.retries == warmup.WARMUP_RETRY_ATTEMPTS
+    assert job.status()["failed_steps"] == ["history"]
+
+def test_not_ready_while_running(job):
+    job.state = "running"
+    assert not job.ready